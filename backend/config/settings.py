@@ -28,6 +28,7 @@ INSTALLED_APPS = [
     'django.contrib.sessions',
     'django.contrib.messages',
     'django.contrib.staticfiles',
+    'django.contrib.postgres',
     'rest_framework',
     'rest_framework_simplejwt',
     'corsheaders',
@@ -41,6 +42,16 @@ REST_FRAMEWORK = {
         'workshop.middleware.jwt_cookie_middleware.CustomerJWTAuthentication',
         'rest_framework_simplejwt.authentication.JWTAuthentication',
     ),
+    # orjson-backed JSON in and out; output matches DRF's JSONRenderer
+    'DEFAULT_RENDERER_CLASSES': (
+        'workshop.renderers.ORJSONRenderer',
+        'rest_framework.renderers.BrowsableAPIRenderer',
+    ),
+    'DEFAULT_PARSER_CLASSES': (
+        'workshop.parsers.ORJSONParser',
+        'rest_framework.parsers.FormParser',
+        'rest_framework.parsers.MultiPartParser',
+    ),
 }
 
 SIMPLE_JWT = {
@@ -58,8 +69,12 @@ SIMPLE_JWT = {
 }
 
 MIDDLEWARE = [
+    'workshop.middleware.request_id_middleware.RequestIdMiddleware',
+    'workshop.middleware.metrics_middleware.MetricsMiddleware',
+    'workshop.middleware.compression_middleware.CompressionMiddleware',
     'corsheaders.middleware.CorsMiddleware',
     'django.middleware.security.SecurityMiddleware',
+    'workshop.middleware.sql_profiling_middleware.SQLProfilingMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -134,15 +149,174 @@ DATABASES = {
 }
 
 
+# Cache shared by every worker: business settings and catalog version stamps and the
+# analytics reports live here. Redis when REDIS_URL is set (needs the redis package),
+# otherwise a database table created by migration 0037 (or `manage.py createcachetable`)
+
+REDIS_URL = config('REDIS_URL', default='')
+
+if REDIS_URL:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.redis.RedisCache',
+            'LOCATION': REDIS_URL,
+        }
+    }
+else:
+    CACHES = {
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'workshop_cache',
+        }
+    }
+
+
 # GoDaddy Email SMTP settings
 
-EMAIL_BACKEND = 'django.core.mail.backends.smtp.EmailBackend'
-EMAIL_HOST = 'smtpout.secureserver.net'
-EMAIL_PORT = 587
+EMAIL_BACKEND = config('EMAIL_BACKEND', default='django.core.mail.backends.smtp.EmailBackend')
+EMAIL_HOST = config('EMAIL_HOST', default='smtpout.secureserver.net')
+EMAIL_PORT = config('EMAIL_PORT', default=587, cast=int)
 EMAIL_HOST_USER = 'admin@detailinghubpk.com'
 EMAIL_HOST_PASSWORD = config('EMAIL_HOST_PASSWORD')
-EMAIL_USE_TLS = True
+EMAIL_USE_TLS = config('EMAIL_USE_TLS', default=True, cast=bool)
 DEFAULT_FROM_EMAIL = EMAIL_HOST_USER
+EMAIL_TIMEOUT = 30
+
+# Bulk mail (BulkMailDispatcher): messages per SMTP connection and provider send quota
+EMAIL_BULK_BATCH_SIZE = config('EMAIL_BULK_BATCH_SIZE', default=100, cast=int)
+EMAIL_RATE_LIMIT_PER_MINUTE = config('EMAIL_RATE_LIMIT_PER_MINUTE', default=60, cast=int)
+
+
+# Background jobs (see workshop/services/job_service.py, run with `manage.py run_jobs`)
+# Eager mode executes jobs in-process after commit instead of waiting for a worker
+
+BACKGROUND_JOBS_EAGER = config('BACKGROUND_JOBS_EAGER', default=False, cast=bool)
+
+
+# Invoice numbers (workshop/services/invoice_number_service.py): DH<fiscal year>-<sequence>
+# Each worker reserves INVOICE_NUMBER_BLOCK_SIZE numbers at a time; 1 makes them strictly sequential
+
+FISCAL_YEAR_START_MONTH = config('FISCAL_YEAR_START_MONTH', default=1, cast=int)
+INVOICE_NUMBER_BLOCK_SIZE = config('INVOICE_NUMBER_BLOCK_SIZE', default=20, cast=int)
+
+
+# Live dashboard events (Server-Sent Events over PostgreSQL LISTEN/NOTIFY)
+# Streams run on gevent workers (gunicorn.conf.py), so an open stream holds a greenlet
+# rather than a worker; each worker process shares one LISTEN connection among its streams.
+# Streams end after EVENT_STREAM_MAX_SECONDS and the browser reconnects automatically
+
+EVENT_STREAM_CHANNEL = 'workshop_events'
+EVENT_STREAM_MAX_SECONDS = config('EVENT_STREAM_MAX_SECONDS', default=300, cast=int)
+
+
+# SQL profiling (workshop/middleware/sql_profiling_middleware.py)
+# Disabled by default; when enabled, SQL_PROFILING_SAMPLE_RATE of requests get a
+# Server-Timing header and a log line with query count, DB time, N+1 and slow queries
+
+SQL_PROFILING_ENABLED = config('SQL_PROFILING_ENABLED', default=False, cast=bool)
+SQL_PROFILING_SAMPLE_RATE = config('SQL_PROFILING_SAMPLE_RATE', default=0.05, cast=float)
+SQL_PROFILING_SLOW_QUERY_MS = config('SQL_PROFILING_SLOW_QUERY_MS', default=100, cast=int)
+SQL_PROFILING_DUPLICATE_THRESHOLD = config('SQL_PROFILING_DUPLICATE_THRESHOLD', default=3, cast=int)
+
+
+# Autocomplete (workshop/services/autocomplete_service.py)
+# Each worker keeps an in-memory prefix index, updated by signals for its own writes and
+# rebuilt on a background thread after AUTOCOMPLETE_REFRESH_SECONDS while the old index
+# keeps serving; misses (and searches before the first build) fall back to a pg_trgm search
+
+AUTOCOMPLETE_REFRESH_SECONDS = config('AUTOCOMPLETE_REFRESH_SECONDS', default=300, cast=int)
+
+
+# Product catalog listing cache (workshop/services/catalog_service.py)
+# Product, variant and stock changes retire cached pages in every worker through the
+# shared cache's version stamp; pages expire after CATALOG_CACHE_TIMEOUT seconds
+
+CATALOG_CACHE_TIMEOUT = config('CATALOG_CACHE_TIMEOUT', default=300, cast=int)
+
+
+# Business settings (workshop/services/business_settings_service.py)
+# Each worker keeps the settings row in memory and checks the shared cache's version
+# stamp at most every BUSINESS_SETTINGS_CHECK_SECONDS; saves replace the stamp. A copy
+# older than BUSINESS_SETTINGS_MAX_AGE_SECONDS is reloaded from the database regardless
+
+BUSINESS_SETTINGS_CHECK_SECONDS = config('BUSINESS_SETTINGS_CHECK_SECONDS', default=5, cast=int)
+BUSINESS_SETTINGS_MAX_AGE_SECONDS = config('BUSINESS_SETTINGS_MAX_AGE_SECONDS', default=300, cast=int)
+
+
+# Booking capacity (workshop/services/capacity_planner_service.py)
+# A day offers CAPACITY_BAYS * (opening minutes // CAPACITY_JOB_MINUTES) slots, limited by
+# the staff present when each job needs CAPACITY_STAFF_PER_JOB people
+
+CAPACITY_HORIZON_DAYS = config('CAPACITY_HORIZON_DAYS', default=60, cast=int)
+CAPACITY_BAYS = config('CAPACITY_BAYS', default=1, cast=int)
+CAPACITY_JOB_MINUTES = config('CAPACITY_JOB_MINUTES', default=100, cast=int)
+CAPACITY_STAFF_PER_JOB = config('CAPACITY_STAFF_PER_JOB', default=2, cast=int)
+
+# Timed bookings (workshop/services/slot_scheduler_service.py) start on this grid from opening time
+SCHEDULING_STEP_MINUTES = config('SCHEDULING_STEP_MINUTES', default=30, cast=int)
+
+# Booking SLA report (workshop/queries/booking_event_queries.py): hours a booking may wait
+# for confirmation, and hours a job may stay in progress, before it is reported as a breach
+BOOKING_SLA_PENDING_HOURS = config('BOOKING_SLA_PENDING_HOURS', default=24, cast=int)
+BOOKING_SLA_IN_PROGRESS_HOURS = config('BOOKING_SLA_IN_PROGRESS_HOURS', default=8, cast=int)
+
+
+# Prometheus metrics on /metrics (workshop/metrics.py)
+# Under gunicorn set PROMETHEUS_MULTIPROC_DIR so samples are aggregated across workers.
+# Scrapers send `Authorization: Bearer <METRICS_AUTH_TOKEN>`; without a token /metrics is a 404
+
+METRICS_ENABLED = config('METRICS_ENABLED', default=True, cast=bool)
+METRICS_AUTH_TOKEN = config('METRICS_AUTH_TOKEN', default='')
+
+
+# Response compression (workshop/middleware/compression_middleware.py)
+# brotli when the client accepts it, otherwise gzip; small and streaming responses are left alone.
+# Against BREACH, responses to requests carrying credentials (auth cookies or an Authorization
+# header) always use gzip padded with up to COMPRESSION_MAX_RANDOM_BYTES random bytes, as
+# Django's GZipMiddleware does; brotli has no room for such padding.
+
+COMPRESSION_ENABLED = config('COMPRESSION_ENABLED', default=True, cast=bool)
+COMPRESSION_MIN_SIZE = config('COMPRESSION_MIN_SIZE', default=1024, cast=int)
+COMPRESSION_BROTLI_QUALITY = 4
+COMPRESSION_MAX_RANDOM_BYTES = 100
+
+
+# Logging: one JSON object per line on stderr, tagged with the request id
+# (workshop/logging_utils.py). LOG_FORMAT=text gives readable lines for local work.
+# Log calls use lazy %-style arguments, so disabled levels cost almost nothing.
+
+LOG_LEVEL = config('LOG_LEVEL', default='INFO')
+LOG_FORMAT = config('LOG_FORMAT', default='json')
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'filters': {
+        'request_id': {'()': 'workshop.logging_utils.RequestIdFilter'},
+    },
+    'formatters': {
+        'json': {'()': 'workshop.logging_utils.JsonFormatter'},
+        'text': {'format': '%(asctime)s %(levelname)s %(name)s [%(request_id)s] %(message)s'},
+    },
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+            'filters': ['request_id'],
+            'formatter': LOG_FORMAT,
+        },
+    },
+    'root': {
+        'handlers': ['console'],
+        'level': 'WARNING',
+    },
+    'loggers': {
+        'django': {'level': config('LOG_LEVEL_DJANGO', default='WARNING')},
+        'workshop': {'level': LOG_LEVEL},
+        'workshop.queries': {'level': config('LOG_LEVEL_QUERIES', default='WARNING')},
+        'workshop.permissions': {'level': config('LOG_LEVEL_PERMISSIONS', default='WARNING')},
+        'workshop.middleware.sql_profiling_middleware': {'level': 'INFO'},
+    },
+}
 
 
 # Password validation
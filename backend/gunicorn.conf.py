@@ -0,0 +1,32 @@
+# gunicorn.conf.py
+# Loaded automatically when gunicorn is started from the backend directory.
+import os
+import shutil
+
+# Prometheus multiprocess mode: every worker writes samples to this directory and
+# /metrics aggregates them. It has to be set before prometheus_client is imported.
+PROMETHEUS_MULTIPROC_DIR = os.environ.setdefault('PROMETHEUS_MULTIPROC_DIR', '/tmp/workshop-prometheus')
+
+# The dashboard holds a Server-Sent Events stream open for up to EVENT_STREAM_MAX_SECONDS.
+# A sync worker would be pinned by every open tab and killed by `timeout` mid-stream, so
+# requests run on gevent greenlets; an idle stream costs a greenlet, not a worker.
+worker_class = os.environ.get('GUNICORN_WORKER_CLASS', 'gevent')
+worker_connections = int(os.environ.get('GUNICORN_WORKER_CONNECTIONS', 500))
+
+
+def on_starting(server):
+    # Samples from a previous master would otherwise be reported as current
+    shutil.rmtree(PROMETHEUS_MULTIPROC_DIR, ignore_errors=True)
+    os.makedirs(PROMETHEUS_MULTIPROC_DIR, exist_ok=True)
+
+
+def post_fork(server, worker):
+    if worker_class == 'gevent':
+        # psycopg2 waits in C; this makes its waits yield to other greenlets
+        from psycogreen.gevent import patch_psycopg
+        patch_psycopg()
+
+
+def child_exit(server, worker):
+    from prometheus_client import multiprocess
+    multiprocess.mark_process_dead(worker.pid)
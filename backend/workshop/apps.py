@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class WorkshopConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'workshop'
+
+    def ready(self):
+        from . import signals  # noqa: F401
@@ -1,3 +1,4 @@
+import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -7,6 +8,8 @@ from rest_framework.permissions import AllowAny
 from ..serializers.customer_serializer import CustomerDetailSerializer
 from ..models import User
 
+logger = logging.getLogger(__name__)
+
 
 class CustomerLoginView(APIView):
     """
@@ -18,8 +21,6 @@ class CustomerLoginView(APIView):
         email = request.data.get('email')
         password = request.data.get('password')
         
-        print(f"DEBUG: Customer login attempt with email: {email}")
-        
         if not email or not password:
             return Response({
                 'error': 'Email and password are required'
@@ -29,8 +30,6 @@ class CustomerLoginView(APIView):
         try:
             customer = User.objects.get(email=email, is_active=True)
             if customer.check_password(password): 
-                print(f"DEBUG: Customer authenticated: {customer.email}")
-                
                 # Update last login
                 customer.last_login = timezone.now()
                 customer.save()
@@ -44,10 +43,7 @@ class CustomerLoginView(APIView):
                 # Create access token from refresh token
                 access_token = str(refresh.access_token)
                 
-                print(f"DEBUG: Customer token created for {customer.email}")
-                print(f"DEBUG: Token user_id: {refresh['user_id']}")
-                print(f"DEBUG: Token role: {refresh['role']}")
-                print(f"DEBUG: Access token length: {len(access_token)}")
+                logger.info("Customer login succeeded for user %s", customer.id)
                 
                 response = Response({
                     'user': CustomerDetailSerializer(customer).data,
@@ -55,8 +51,6 @@ class CustomerLoginView(APIView):
                     'message': 'Customer login successful'
                 }, status=status.HTTP_200_OK)
 
-                print(response.data)
-                
                 # Set customer tokens in HttpOnly cookies (separate from admin)
                 response.set_cookie(
                     key='customer_refresh_token',
@@ -78,12 +72,12 @@ class CustomerLoginView(APIView):
                 )
                 return response
             else:
-                print("DEBUG: Customer password check failed")
+                logger.info("Customer login failed: bad password for user %s", customer.id)
                 return Response({
                     'error': 'Invalid email or password'
                 }, status=status.HTTP_401_UNAUTHORIZED)
         except User.DoesNotExist:
-            print("DEBUG: Customer not found")
+            logger.info("Customer login failed: unknown or inactive email")
             return Response({
                 'error': 'Invalid email or password'
             }, status=status.HTTP_401_UNAUTHORIZED)
@@ -1,3 +1,4 @@
+import logging
 from rest_framework.views import APIView
 from rest_framework.response import Response
 from rest_framework import status
@@ -6,6 +7,8 @@ from ..serializers.customer_serializer import CustomerCreateSerializer, Customer
 from ..helper.email_validator import is_valid_email_domain
 from ..helper.phone_number_valid import is_valid_phone_number
 
+logger = logging.getLogger(__name__)
+
 
 class CustomerRegisterView(APIView):
     permission_classes = [AllowAny]
@@ -37,14 +40,13 @@ class CustomerRegisterView(APIView):
         serializer = CustomerCreateSerializer(data=request.data)
         if serializer.is_valid():
             try:
-                print(serializer.errors)
                 customer = serializer.save()
                 return Response({
                     'message': 'Customer registered successfully',
                     'user': CustomerDetailSerializer(customer).data
                 }, status=status.HTTP_201_CREATED)
             except Exception as e:
-                print(e)
+                logger.exception("Customer registration failed")
                 return Response({
                     'error': f'Registration failed: {str(e)}'
                 }, status=status.HTTP_400_BAD_REQUEST)
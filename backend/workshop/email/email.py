@@ -1,5 +1,13 @@
-from django.core.mail import send_mail
+import time
+import uuid
+import smtplib
+import logging
+
+from django.core.mail import send_mail, get_connection, EmailMessage
 from django.conf import settings
+from django.template import Template, Context
+
+logger = logging.getLogger(__name__)
 
 class EmailHandler:
 	@staticmethod
@@ -25,3 +33,121 @@ class EmailHandler:
 			['admin@detailinghubpk.com'],
 			fail_silently=False,
 		)
+
+
+class BulkMailDispatcher:
+	"""
+	Sends one templated message per recipient over a single SMTP connection per batch.
+
+	Messages are rendered lazily from a generator, sending is throttled to
+	EMAIL_RATE_LIMIT_PER_MINUTE, and every recipient gets an EmailDelivery row.
+	The row is written as `sending` before the message goes out, so a re-run after a
+	crash never mails a recipient twice; a row left in `sending` means the outcome is unknown.
+	"""
+
+	def __init__(self, batch_size=None, rate_per_minute=None, connection_factory=get_connection):
+		self.batch_size = batch_size or getattr(settings, 'EMAIL_BULK_BATCH_SIZE', 100)
+		self.rate_per_minute = rate_per_minute or getattr(settings, 'EMAIL_RATE_LIMIT_PER_MINUTE', 0)
+		self.connection_factory = connection_factory
+		self._last_sent_at = None
+
+	@staticmethod
+	def render_messages(recipients, subject_template, body_template):
+		"""
+		Yield (user, EmailMessage) for each recipient with an email address.
+		Templates use Django template syntax with `customer` in the context.
+		"""
+		subject_tpl = Template(subject_template)
+		body_tpl = Template(body_template)
+		for user in recipients:
+			if not user.email:
+				continue
+			context = Context({'customer': user})
+			message = EmailMessage(
+				subject=subject_tpl.render(context).strip(),
+				body=body_tpl.render(context),
+				from_email=settings.DEFAULT_FROM_EMAIL,
+				to=[user.email],
+			)
+			yield user, message
+
+	def _throttle(self):
+		if not self.rate_per_minute:
+			return
+		interval = 60.0 / self.rate_per_minute
+		if self._last_sent_at is not None:
+			wait = interval - (time.monotonic() - self._last_sent_at)
+			if wait > 0:
+				time.sleep(wait)
+		self._last_sent_at = time.monotonic()
+
+	def dispatch(self, recipients, subject_template, body_template, batch_id=None, heartbeat=None):
+		"""
+		Send to every recipient; returns a summary dict with counts per status.
+		`heartbeat` is called after every batch, e.g. to renew a background job's lease.
+		"""
+		from workshop.models import EmailDelivery
+
+		batch_id = batch_id or uuid.uuid4()
+		summary = {'batch_id': str(batch_id), 'sent': 0, 'failed': 0}
+
+		# Re-running a batch (e.g. a retried job) skips recipients that got it or may have
+		already_sent = set(
+			EmailDelivery.objects.filter(
+				batch_id=batch_id, status__in=[EmailDelivery.Status.SENT, EmailDelivery.Status.SENDING]
+			).values_list('email', flat=True)
+		)
+		messages = (
+			(user, message)
+			for user, message in self.render_messages(recipients, subject_template, body_template)
+			if message.to[0] not in already_sent
+		)
+
+		while True:
+			batch = [item for _, item in zip(range(self.batch_size), messages)]
+			if not batch:
+				break
+
+			connection = self.connection_factory(fail_silently=False)
+			connection.open()
+			try:
+				for user, message in batch:
+					delivery = EmailDelivery.objects.create(
+						batch_id=batch_id,
+						user=user,
+						email=message.to[0],
+						subject=message.subject[:255],
+						status=EmailDelivery.Status.SENDING,
+					)
+					self._throttle()
+					status, error = EmailDelivery.Status.SENT, None
+					try:
+						connection.send_messages([message])
+					except smtplib.SMTPServerDisconnected as e:
+						# Provider dropped us mid-batch; reconnect once and retry this message
+						status, error = self._resend(connection, message, e)
+					except Exception as e:
+						status, error = EmailDelivery.Status.FAILED, f"{type(e).__name__}: {e}"
+
+					summary[status] += 1
+					delivery.status, delivery.error = status, error
+					delivery.save(update_fields=['status', 'error'])
+			finally:
+				connection.close()
+
+			if heartbeat is not None:
+				heartbeat()
+
+		logger.info("Bulk mail %s: %s sent, %s failed", batch_id, summary['sent'], summary['failed'])
+		return summary
+
+	@staticmethod
+	def _resend(connection, message, original_error):
+		from workshop.models import EmailDelivery
+		try:
+			connection.close()
+			connection.open()
+			connection.send_messages([message])
+			return EmailDelivery.Status.SENT, None
+		except Exception as e:
+			return EmailDelivery.Status.FAILED, f"{type(original_error).__name__}: {original_error}; retry: {e}"
@@ -1,76 +1,14 @@
 # workshop/helper/booking_helpers.py
 
+import logging
 from django.utils import timezone
-from django.db import transaction
 from datetime import datetime, timedelta
 from workshop.models.booking import Booking
 from workshop.models.daily_availability import DailyAvailability
+from workshop.services.capacity_planner_service import CapacityPlanner
 from decimal import Decimal
 
-
-def handle_booking_status_change(booking, old_status, new_status, user, notes):
-    """
-    Handle booking status change with daily availability updates and invoice generation
-    """
-    with transaction.atomic():
-        # Update booking service status (status is on BookingService, not Booking)
-        if hasattr(booking, 'service') and booking.service:
-            booking.service.status = new_status
-            booking.service.save()
-        
-        if new_status == 'completed':
-            try:
-                if not booking.invoice:
-                    # Only generate invoice if one doesn't exist
-                    from workshop.models.invoice import Invoice
-                    from decimal import Decimal
-                    
-                    service_price = booking.service.price if booking.service else Decimal('0.00')
-                    customer = booking.car.customer if booking.car else None
-                    
-                    if customer:
-                        invoice = Invoice.objects.create(
-                            user=customer,
-                            subtotal=service_price,
-                            tax_percentage=Decimal('0.00'),
-                            discount_amount=Decimal('0.00'),
-                            total_amount=service_price,
-                            status=Invoice.Status.PENDING
-                        )
-                        booking.invoice = invoice
-                        booking.save()
-                        notes += f"\nInvoice {invoice.invoice_number} generated automatically."
-            except Exception as e:
-                # Log the error but don't fail the status change
-                print(f"Error generating invoice for booking {booking.id}: {str(e)}")
-        
-        # Update daily availability based on status change
-        update_daily_availability_for_booking(booking, old_status, new_status)
-    
-    return booking
-
-
-def update_daily_availability_for_booking(booking, old_status, new_status):
-    """
-    Update daily availability based on booking status change
-    """
-    availability, created = DailyAvailability.objects.get_or_create(
-        date=booking.booking_date,
-        defaults={'total_slots': 7, 'available_slots': 7}
-    )
-    
-    # Determine if old status booked a slot
-    old_books_slot = old_status in ['pending', 'confirmed', 'in_progress']
-    # Determine if new status books a slot  
-    new_books_slot = new_status in ['pending', 'confirmed', 'in_progress']
-    
-    if old_books_slot and not new_books_slot:
-        # Freeing up a slot (cancellation, completion, etc.)
-        availability.cancel_slot()
-    elif not old_books_slot and new_books_slot:
-        # Booking a slot (from draft to pending/confirmed)
-        availability.book_slot()
-    # If both book slots or both don't book slots, no change needed
+logger = logging.getLogger(__name__)
 
 
 def handle_booking_creation(booking):
@@ -78,10 +16,7 @@ def handle_booking_creation(booking):
     Handle booking creation by updating daily availability
     """
     if booking.status in ['pending', 'confirmed', 'in_progress']:
-        availability, created = DailyAvailability.objects.get_or_create(
-            date=booking.booking_date,
-            defaults={'total_slots': 7, 'available_slots': 7}
-        )
+        availability = CapacityPlanner.get_or_create_day(booking.booking_date)
         availability.book_slot()
 
 
@@ -131,8 +66,8 @@ def get_available_slots_for_date(target_date):
         availability = DailyAvailability.objects.get(date=target_date)
         return availability.available_slots
     except DailyAvailability.DoesNotExist:
-        # If no availability record exists, return default
-        return 7
+        # If no availability record exists, return the planned capacity
+        return CapacityPlanner.plan([target_date])[target_date]
 
 
 def prepare_booking_snapshot_data(customer, car):
@@ -183,10 +118,7 @@ def sync_availability_with_actual_bookings():
             ).count()
             
             # Get or create availability record
-            availability, created = DailyAvailability.objects.get_or_create(
-                date=date,
-                defaults={'total_slots': 7, 'available_slots': 7}
-            )
+            availability = CapacityPlanner.get_or_create_day(date)
             
             # Update available slots
             availability.available_slots = max(0, availability.total_slots - active_count)
@@ -0,0 +1,44 @@
+# workshop/logging_utils.py
+"""
+Structured logging helpers wired up by settings.LOGGING.
+
+Every record gets the current request id (set by RequestIdMiddleware), and
+JsonFormatter emits one JSON object per line including any `extra={...}` fields.
+"""
+import json
+import logging
+from contextvars import ContextVar
+from datetime import datetime, timezone
+
+request_id_var = ContextVar('request_id', default='-')
+
+# Attributes every LogRecord has; anything else on a record came from `extra`
+_RECORD_ATTRS = set(vars(logging.LogRecord('', 0, '', 0, '', (), None))) | {'message', 'asctime', 'request_id'}
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request id so formatters can use %(request_id)s"""
+
+    def filter(self, record):
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+
+    def format(self, record):
+        entry = {
+            'ts': datetime.fromtimestamp(record.created, tz=timezone.utc).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'logger': record.name,
+            'message': record.getMessage(),
+            'request_id': getattr(record, 'request_id', request_id_var.get()),
+        }
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS and not key.startswith('_'):
+                entry[key] = value
+        if record.exc_info:
+            entry['exc_info'] = self.formatException(record.exc_info)
+        if record.stack_info:
+            entry['stack_info'] = self.formatStack(record.stack_info)
+        return json.dumps(entry, default=str)
@@ -0,0 +1,285 @@
+# workshop/management/commands/benchmark_endpoints.py
+import gc
+import json
+import time
+import platform
+import statistics
+import tracemalloc
+from datetime import timedelta
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test.utils import CaptureQueriesContext, setup_test_environment, teardown_test_environment
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from workshop.models import User, Car, Service, BookingService, ProductVariant
+
+
+DEFAULT_BASELINE = Path(settings.BASE_DIR) / 'benchmarks' / 'endpoint_baseline.json'
+
+# Latency changes smaller than this are treated as noise, whatever the percentage
+MIN_LATENCY_DELTA_MS = 2.0
+
+
+class Rollback(Exception):
+    """Raised inside a benchmark transaction to undo a write request"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the main API endpoints against the current database (run seed_scale first). '
+        'Reports p50/p95/p99 latency, SQL query count and peak Python memory per endpoint, '
+        'and compares them with a JSON baseline.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--iterations', type=int, default=30)
+        parser.add_argument('--warmup', type=int, default=3)
+        parser.add_argument('--only', nargs='+', metavar='NAME',
+                            help='Benchmark only these endpoints (see --list)')
+        parser.add_argument('--list', action='store_true', help='List endpoint names and exit')
+        parser.add_argument('--baseline', default=str(DEFAULT_BASELINE),
+                            help='Baseline JSON file to compare with (or write with --save-baseline)')
+        parser.add_argument('--save-baseline', action='store_true',
+                            help='Write this run as the new baseline instead of comparing')
+        parser.add_argument('--threshold', type=float, default=0.25,
+                            help='Allowed relative increase in p95 latency and peak memory (0.25 = 25%%)')
+        parser.add_argument('--output', help='Also write this run\'s results to a JSON file')
+
+    def handle(self, *args, **options):
+        endpoints = self.endpoints()
+        if options['list']:
+            for name, method, _, _ in endpoints:
+                self.stdout.write(f"{name:24} {method.upper()}")
+            return
+
+        if options['only']:
+            unknown = set(options['only']) - {name for name, *_ in endpoints}
+            if unknown:
+                raise CommandError(f"Unknown endpoint(s): {', '.join(sorted(unknown))}")
+            endpoints = [endpoint for endpoint in endpoints if endpoint[0] in options['only']]
+
+        # Adds 'testserver' to ALLOWED_HOSTS and swaps in the locmem email backend
+        setup_test_environment()
+        try:
+            self.fixtures = self.load_fixtures()
+            self.client = APIClient()
+            self.client.force_authenticate(user=self.fixtures['admin'])
+
+            results = {}
+            for name, method, path, payload in endpoints:
+                results[name] = self.benchmark(name, method, path, payload, options['iterations'], options['warmup'])
+        finally:
+            teardown_test_environment()
+
+        run = {
+            'created_at': timezone.now().isoformat(),
+            'database': connection.vendor,
+            'python': platform.python_version(),
+            'iterations': options['iterations'],
+            'endpoints': results,
+        }
+        self.print_results(results)
+
+        # A redirect or error page says nothing about the endpoint, so its timings are neither kept nor compared
+        failed = [name for name, result in results.items() if not self.succeeded(result)]
+        if failed:
+            raise CommandError(f"Non-2xx responses from: {', '.join(failed)}")
+
+        if options['output']:
+            self.write_json(Path(options['output']), run)
+
+        baseline_path = Path(options['baseline'])
+        if options['save_baseline']:
+            self.write_json(baseline_path, run)
+            self.stdout.write(self.style.SUCCESS(f"Baseline written to {baseline_path}"))
+            return
+
+        if not baseline_path.exists():
+            self.stdout.write(self.style.WARNING(
+                f"No baseline at {baseline_path}; run with --save-baseline to create one"
+            ))
+            return
+
+        baseline = json.loads(baseline_path.read_text())
+        regressions = self.compare(results, baseline.get('endpoints', {}), options['threshold'])
+        if regressions:
+            for line in regressions:
+                self.stdout.write(self.style.ERROR(f"  REGRESSION {line}"))
+            raise CommandError(f"{len(regressions)} regression(s) against {baseline_path}")
+        self.stdout.write(self.style.SUCCESS(f"No regressions against {baseline_path}"))
+
+    # -- scenario --------------------------------------------------------------
+
+    def load_fixtures(self):
+        admin = User.objects.filter(role=User.Role.admin, is_active=True).order_by('date_joined').first()
+        car = Car.objects.select_related('customer').filter(customer__isnull=False).order_by('created_at').first()
+        booking_service = BookingService.objects.select_related('booking').order_by('-booking__created_at').first()
+        variant = ProductVariant.objects.order_by('-quantity').first()
+        service = Service.objects.filter(is_active=True).order_by('name').first()
+
+        missing = [
+            label for label, value in (
+                ('an admin user', admin), ('a car with a customer', car), ('a booking', booking_service),
+                ('a product variant', variant), ('an active service', service),
+            ) if value is None
+        ]
+        if missing:
+            raise CommandError(
+                f"Benchmark needs {', '.join(missing)}; seed data first, e.g. 'python manage.py seed_scale --scale 0.01'"
+            )
+        return {
+            'admin': admin,
+            'car': car,
+            'booking': booking_service.booking,
+            'variant': variant,
+            'service': service,
+        }
+
+    def endpoints(self):
+        """(name, method, path, payload) for each benchmarked endpoint; callables are resolved lazily"""
+        today = timezone.now().date()
+        return [
+            ('booking-list', 'get', lambda f: '/bookings/list/', None),
+            ('booking-detail', 'get', lambda f: f"/bookings/{f['booking'].id}/detail/", None),
+            ('booking-create', 'post', lambda f: '/bookings/create/', lambda f: {
+                'customer': str(f['car'].customer_id),
+                'car': str(f['car'].id),
+                'service': str(f['service'].id),
+                'booking_date': str(today + timedelta(days=60)),
+                'special_instructions': 'benchmark',
+            }),
+            ('invoice-list', 'get', lambda f: '/invoices/list-invoices/', None),
+            ('analytics-report', 'get', lambda f: f"/analytics/report/monthly/?month={today:%B}&year={today.year}", None),
+            ('analytics-metrics', 'get', lambda f: '/analytics/metrics/', None),
+            ('dashboard-stats', 'get', lambda f: '/dashboard/stats/', None),
+            ('available-dates', 'get', lambda f: '/bookings/available-dates/?days=30', None),
+            ('stock-adjust', 'post', lambda f: f"/stock-movements/{f['variant'].id}/adjust/", lambda f: {
+                'quantity_change': 1,
+                'reason': 'benchmark',
+            }),
+            ('add-variant-to-booking', 'post', lambda f: '/variants/add-to-booking/', lambda f: {
+                'booking_id': str(f['booking'].id),
+                'items': [{
+                    'product_variant': str(f['variant'].id),
+                    'unit_price': str(f['variant'].price),
+                    'quantity': 1,
+                }],
+            }),
+        ]
+
+    # -- measurement -----------------------------------------------------------
+
+    def request(self, method, path, payload):
+        """
+        Issue one request; writes run in a transaction that is always rolled back.
+        Requests are sent as HTTPS, or SECURE_SSL_REDIRECT answers every one with a 301.
+        """
+        if method == 'get':
+            return self.client.get(path, secure=True)
+
+        response = None
+        try:
+            with transaction.atomic():
+                response = getattr(self.client, method)(path, payload, format='json', secure=True)
+                raise Rollback
+        except Rollback:
+            pass
+        return response
+
+    def benchmark(self, name, method, path, payload, iterations, warmup):
+        path = path(self.fixtures)
+        payload = payload(self.fixtures) if payload else None
+        self.stdout.write(f"  {name} ...", ending='')
+        self.stdout.flush()
+
+        for _ in range(warmup):
+            self.request(method, path, payload)
+
+        timings = []
+        query_counts = []
+        status_codes = set()
+        for _ in range(iterations):
+            with CaptureQueriesContext(connection) as queries:
+                started = time.perf_counter()
+                response = self.request(method, path, payload)
+                timings.append((time.perf_counter() - started) * 1000)
+            query_counts.append(len(queries))
+            status_codes.add(response.status_code)
+
+        # tracemalloc slows allocation-heavy code, so memory gets its own pass
+        gc.collect()
+        tracemalloc.start()
+        self.request(method, path, payload)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        self.stdout.write(f" {statistics.median(timings):.1f} ms")
+        return {
+            'method': method.upper(),
+            'path': path,
+            'status_codes': sorted(status_codes),
+            'p50_ms': round(self.percentile(timings, 50), 2),
+            'p95_ms': round(self.percentile(timings, 95), 2),
+            'p99_ms': round(self.percentile(timings, 99), 2),
+            'queries': max(query_counts),
+            'peak_memory_kib': round(peak / 1024, 1),
+        }
+
+    @staticmethod
+    def percentile(values, pct):
+        """Nearest-rank percentile"""
+        ordered = sorted(values)
+        rank = max(0, min(len(ordered) - 1, round(pct / 100 * len(ordered) + 0.5) - 1))
+        return ordered[rank]
+
+    # -- reporting -------------------------------------------------------------
+
+    def compare(self, results, baseline, threshold):
+        regressions = []
+        for name, current in results.items():
+            previous = baseline.get(name)
+            if not previous:
+                continue
+
+            # Query counts are deterministic, so any increase is a regression (usually an N+1)
+            if current['queries'] > previous['queries']:
+                regressions.append(f"{name}: queries {previous['queries']} -> {current['queries']}")
+
+            delta = current['p95_ms'] - previous['p95_ms']
+            if delta > MIN_LATENCY_DELTA_MS and current['p95_ms'] > previous['p95_ms'] * (1 + threshold):
+                regressions.append(f"{name}: p95 {previous['p95_ms']:.1f} ms -> {current['p95_ms']:.1f} ms")
+
+            if current['peak_memory_kib'] > previous['peak_memory_kib'] * (1 + threshold):
+                regressions.append(
+                    f"{name}: peak memory {previous['peak_memory_kib']:.0f} KiB -> {current['peak_memory_kib']:.0f} KiB"
+                )
+        return regressions
+
+    def print_results(self, results):
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(
+            f"{'endpoint':24} {'status':>8} {'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9} {'queries':>8} {'peak KiB':>10}"
+        ))
+        for name, result in results.items():
+            codes = ','.join(str(code) for code in result['status_codes'])
+            line = (
+                f"{name:24} {codes:>8} {result['p50_ms']:>9.1f} {result['p95_ms']:>9.1f} "
+                f"{result['p99_ms']:>9.1f} {result['queries']:>8} {result['peak_memory_kib']:>10.0f}"
+            )
+            if not self.succeeded(result):
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+    @staticmethod
+    def succeeded(result):
+        return all(200 <= code < 300 for code in result['status_codes'])
+
+    @staticmethod
+    def write_json(path, data):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(data, indent=2) + '\n')
@@ -0,0 +1,144 @@
+# workshop/management/commands/benchmark_export.py
+import time
+import random
+import tracemalloc
+from datetime import date, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+
+from workshop.models import User, Invoice, Expense
+from workshop.models.expenses import ExpenseCategory
+from workshop.services.export_service import ExportService
+
+
+BENCHMARK_TAG = 'benchmark-export'
+
+
+class Command(BaseCommand):
+    help = 'Benchmark the streaming CSV exports (time to first byte, throughput, peak Python memory)'
+
+    EXPORTS = {
+        'invoices': 'export_invoices',
+        'bookings': 'export_bookings',
+        'stock-movements': 'export_stock_movements',
+        'expenses': 'export_expenses',
+    }
+    SEEDABLE = ('invoices', 'expenses')
+
+    def add_arguments(self, parser):
+        parser.add_argument('--entity', choices=list(self.EXPORTS), default='expenses')
+        parser.add_argument('--rows', type=int, default=1_000_000,
+                            help='Rows to seed when --seed is given')
+        parser.add_argument('--seed', action='store_true',
+                            help='Bulk insert --rows tagged rows before benchmarking')
+        parser.add_argument('--cleanup', action='store_true',
+                            help='Delete the tagged benchmark rows afterwards')
+        parser.add_argument('--batch-size', type=int, default=10_000)
+
+    def handle(self, *args, **options):
+        entity = options['entity']
+
+        if options['seed']:
+            if entity not in self.SEEDABLE:
+                raise CommandError(
+                    f"Seeding is only supported for {', '.join(self.SEEDABLE)}; "
+                    f"run seed commands first to benchmark {entity}."
+                )
+            self.seed(entity, options['rows'], options['batch_size'])
+
+        try:
+            self.run_benchmark(entity)
+        finally:
+            if options['cleanup']:
+                self.cleanup(entity)
+
+    def run_benchmark(self, entity):
+        service = ExportService()
+        response = getattr(service, self.EXPORTS[entity])({})
+
+        tracemalloc.start()
+        started = time.perf_counter()
+        first_chunk_at = None
+        total_bytes = 0
+        lines = 0
+
+        for chunk in response.streaming_content:
+            if first_chunk_at is None:
+                first_chunk_at = time.perf_counter()
+            total_bytes += len(chunk)
+            lines += chunk.count(b'\n')
+
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        rows = max(lines - 1, 0)
+        ttfb = (first_chunk_at - started) if first_chunk_at else elapsed
+
+        self.stdout.write(self.style.SUCCESS(f"Export benchmark: {entity} ({connection.vendor})"))
+        self.stdout.write(f"  Rows:              {rows:,}")
+        self.stdout.write(f"  Bytes:             {total_bytes:,}")
+        self.stdout.write(f"  Time to 1st chunk: {ttfb * 1000:.1f} ms")
+        self.stdout.write(f"  Total time:        {elapsed:.2f} s")
+        if elapsed > 0:
+            self.stdout.write(f"  Throughput:        {rows / elapsed:,.0f} rows/s")
+        self.stdout.write(f"  Peak Python memory: {peak / (1024 * 1024):.1f} MiB")
+
+    def seed(self, entity, rows, batch_size):
+        rng = random.Random(42)
+        seeded = 0
+        started = time.perf_counter()
+
+        if entity == 'invoices':
+            user, _ = User.objects.get_or_create(
+                email=f'{BENCHMARK_TAG}@example.com',
+                defaults={'name': 'Benchmark Customer'}
+            )
+            start_index = Invoice.objects.filter(invoice_number__startswith='BX').count()
+
+        while seeded < rows:
+            size = min(batch_size, rows - seeded)
+            if entity == 'invoices':
+                batch = []
+                for i in range(seeded, seeded + size):
+                    subtotal = Decimal(rng.randint(1000, 50000))
+                    batch.append(Invoice(
+                        invoice_number=f"BX{start_index + i:010d}",
+                        subtotal=subtotal,
+                        discount_amount=Decimal('0.00'),
+                        total_amount=subtotal,
+                        status=rng.choice(Invoice.Status.values),
+                        user=user,
+                    ))
+                Invoice.objects.bulk_create(batch, batch_size=batch_size)
+            else:
+                today = date.today()
+                batch = [
+                    Expense(
+                        title=BENCHMARK_TAG,
+                        category=rng.choice(ExpenseCategory.values),
+                        amount=Decimal(rng.randint(100, 100000)),
+                        paid_on=today - timedelta(days=rng.randint(0, 730)),
+                    )
+                    for _ in range(size)
+                ]
+                Expense.objects.bulk_create(batch, batch_size=batch_size)
+
+            seeded += size
+            self.stdout.write(f"  Seeded {seeded:,}/{rows:,} {entity}", ending='\r')
+
+        self.stdout.write('')
+        self.stdout.write(self.style.SUCCESS(
+            f"Seeded {rows:,} {entity} in {time.perf_counter() - started:.1f}s"
+        ))
+
+    def cleanup(self, entity):
+        if entity == 'invoices':
+            deleted, _ = User.objects.filter(email=f'{BENCHMARK_TAG}@example.com').delete()
+        elif entity == 'expenses':
+            deleted, _ = Expense.objects.filter(title=BENCHMARK_TAG).delete()
+        else:
+            return
+        self.stdout.write(self.style.WARNING(f"Removed {deleted:,} benchmark rows"))
@@ -0,0 +1,103 @@
+# workshop/management/commands/benchmark_logging.py
+import os
+import logging
+import timeit
+from contextlib import redirect_stdout
+
+from django.core.management.base import BaseCommand, CommandError
+
+from workshop.models import User, BookingService, InvoiceItems
+from workshop.queries.invoice_queries import get_filtered_invoices
+from workshop.serializers.invoice_serializer import InvoiceSerializer
+
+
+class Command(BaseCommand):
+    help = (
+        'Measure the per-request cost of the print() debugging that used to run on hot paths '
+        'against the lazy logger calls that replaced it, using rows from the current database'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--repeat', type=int, default=200)
+        parser.add_argument('--page-size', type=int, default=50,
+                            help='Invoice page size, as sent by the dashboard list')
+
+    def handle(self, *args, **options):
+        scenarios = self.build_scenarios(options['page_size'])
+        logger = logging.getLogger('workshop.services.invoice_service')
+        level = logging.getLevelName(logger.getEffectiveLevel())
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Logging overhead per call ({options['repeat']} repeats, service logger level {level})"
+        ))
+        self.stdout.write(f"  {'path':28} {'print() us':>12} {'logger us':>12} {'saved us':>12}")
+
+        with open(os.devnull, 'w') as devnull:
+            for name, data, legacy, current in scenarios:
+                # stdout goes to /dev/null: this measures formatting and write cost, not the terminal
+                with redirect_stdout(devnull):
+                    legacy_time = timeit.timeit(lambda: legacy(data), number=options['repeat'])
+                current_time = timeit.timeit(lambda: current(logger, data), number=options['repeat'])
+
+                legacy_us = legacy_time / options['repeat'] * 1e6
+                current_us = current_time / options['repeat'] * 1e6
+                self.stdout.write(
+                    f"  {name:28} {legacy_us:>12.1f} {current_us:>12.1f} {legacy_us - current_us:>12.1f}"
+                )
+
+    def build_scenarios(self, page_size):
+        result = get_filtered_invoices(page=1, page_size=page_size)
+        invoices_data = InvoiceSerializer(result['invoices'], many=True).data
+        if not invoices_data:
+            raise CommandError("No invoices found; seed data first, e.g. 'python manage.py seed_scale --scale 0.01'")
+
+        booking_service = (
+            BookingService.objects.filter(items__isnull=False).select_related('service').first()
+        )
+        items = list(
+            InvoiceItems.objects.filter(booking_service=booking_service).select_related('product_variant__product')
+        ) if booking_service else []
+        user = User.objects.filter(role=User.Role.customer).first()
+        params = {'customer_id': None, 'invoice_type': None, 'date_from': None, 'date_to': None,
+                  'page': 1, 'page_size': page_size}
+
+        def invoice_list_legacy(data):
+            print(f"Fetching invoices for customer_id={params['customer_id']}, invoice_type={params['invoice_type']}, "
+                  f"date_from={params['date_from']}, date_to={params['date_to']}, page=1, page_size={page_size}")
+            print(data[0])
+            print(data[1])
+
+        def invoice_list_current(logger, data):
+            logger.debug(
+                "Fetching invoices customer_id=%s invoice_type=%s date_from=%s date_to=%s page=%s page_size=%s",
+                params['customer_id'], params['invoice_type'], params['date_from'], params['date_to'], 1, page_size
+            )
+
+        def invoice_items_legacy(data):
+            print(f"[DEBUG] get_invoice_items called with booking_id: {booking_service and booking_service.booking_id}")
+            print(f"[DEBUG] BookingService found: {booking_service}")
+            for item in data:
+                print(f"[DEBUG] InvoiceItem: id={item.id}, product_variant={item.product_variant}, "
+                      f"unit_price={item.unit_price}, quantity={item.quantity}")
+            print(f"[DEBUG] Returning {len(data)} invoice items.")
+
+        def invoice_items_current(logger, data):
+            logger.debug("Returning %d invoice items for booking %s", len(data),
+                         booking_service and booking_service.booking_id)
+
+        def permission_legacy(data):
+            print(f"DEBUG IsCustomer: Checking permission for user: {data}")
+            print(f"DEBUG IsCustomer: User type: {type(data)}")
+            print(f"DEBUG IsCustomer: User authenticated: {getattr(data, 'is_authenticated', False)}")
+            print("DEBUG IsCustomer: User is Customer instance - ALLOWED")
+
+        def permission_current(logger, data):
+            # The allowed path no longer logs at all
+            return None
+
+        return [
+            (f'invoice list ({len(invoices_data)} rows)', (result, invoices_data),
+             invoice_list_legacy, invoice_list_current),
+            (f'invoice items ({len(items)} items)', items, invoice_items_legacy, invoice_items_current),
+            ('IsCustomer.has_permission', user, permission_legacy, permission_current),
+        ]
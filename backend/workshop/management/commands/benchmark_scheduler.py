@@ -0,0 +1,118 @@
+# workshop/management/commands/benchmark_scheduler.py
+import time
+import random
+
+from django.core.management.base import BaseCommand
+
+from workshop.services.slot_scheduler_service import DaySchedule, IntervalIndex, ResourcePool
+
+
+class LinearIndex:
+    """Reference implementation: scan the sorted bookings from the start of the day"""
+
+    def __init__(self, opens, closes, busy=()):
+        self.opens = opens
+        self.closes = closes
+        self.busy = sorted(busy)
+
+    def earliest(self, not_before, duration):
+        cursor = max(not_before, self.opens)
+        for start, end in self.busy:
+            if start - cursor >= duration:
+                break
+            cursor = max(cursor, end)
+        return cursor if self.closes - cursor >= duration else None
+
+
+class Command(BaseCommand):
+    help = (
+        'Benchmark the slot scheduler interval index against a linear scan on a synthetic '
+        'month of densely booked bays and technicians (in memory, no database needed)'
+    )
+
+    DURATIONS = (30, 45, 60, 90, 120, 180, 240)
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=30)
+        parser.add_argument('--bays', type=int, default=6)
+        parser.add_argument('--technicians', type=int, default=10)
+        parser.add_argument('--opens', type=int, default=8 * 60, help='Opening time in minutes after midnight')
+        parser.add_argument('--closes', type=int, default=20 * 60)
+        parser.add_argument('--step', type=int, default=15)
+        parser.add_argument('--queries', type=int, default=20_000)
+        parser.add_argument('--seed', type=int, default=42)
+
+    def handle(self, *args, **options):
+        rng = random.Random(options['seed'])
+        opens, closes, step = options['opens'], options['closes'], options['step']
+
+        started = time.perf_counter()
+        days = [self.fill_day(rng, options) for _ in range(options['days'])]
+        fill_ms = (time.perf_counter() - started) * 1000
+        bookings = sum(len(day) for day in days)
+        self.stdout.write(self.style.SUCCESS(
+            f"{options['days']} days, {options['bays']} bays, {options['technicians']} technicians: "
+            f"{bookings:,} bookings ({bookings / max(len(days), 1):.0f}/day) placed in {fill_ms:.0f} ms"
+        ))
+
+        indexed = [self.schedule(IntervalIndex, day, options) for day in days]
+        linear = [self.schedule(LinearIndex, day, options) for day in days]
+        queries = [
+            (rng.randrange(len(days)), rng.randrange(opens, closes, step), rng.choice(self.DURATIONS))
+            for _ in range(options['queries'])
+        ]
+
+        indexed_ms, indexed_results = self.time_queries(indexed, queries)
+        linear_ms, linear_results = self.time_queries(linear, queries)
+        mismatches = sum(1 for a, b in zip(indexed_results, linear_results) if a != b)
+
+        per_query = 1000 / max(len(queries), 1)
+        self.stdout.write(f"  interval index: {indexed_ms:>9.1f} ms  {indexed_ms * per_query:>8.1f} us/query")
+        self.stdout.write(
+            f"  linear scan:    {linear_ms:>9.1f} ms  {linear_ms * per_query:>8.1f} us/query  "
+            f"({linear_ms / max(indexed_ms, 0.001):.1f}x)"
+        )
+        found = sum(1 for result in indexed_results if result is not None)
+        self.stdout.write(f"  {found:,} of {len(queries):,} queries found a start")
+        if mismatches:
+            self.stdout.write(self.style.ERROR(f"  {mismatches} results differ from the linear scan"))
+        else:
+            self.stdout.write(self.style.SUCCESS('  results match the linear scan'))
+
+    def fill_day(self, rng, options):
+        """Book random jobs at their earliest feasible start until the day is nearly full"""
+        schedule = self.schedule(IntervalIndex, [], options)
+        placed, misses = [], 0
+        while misses < 50:
+            not_before = rng.randrange(options['opens'], options['closes'], options['step'])
+            placement = schedule.earliest(not_before, rng.choice(self.DURATIONS))
+            if placement is None:
+                misses += 1
+                continue
+            schedule.reserve(placement)
+            placed.append(placement)
+        return placed
+
+    @staticmethod
+    def schedule(index_class, placements, options):
+        opens, closes = options['opens'], options['closes']
+        bays = {key: [] for key in range(options['bays'])}
+        technicians = {key: [] for key in range(options['technicians'])}
+        for placement in placements:
+            bays[placement.bay].append((placement.start, placement.end))
+            technicians[placement.technician].append((placement.start, placement.end))
+        return DaySchedule(
+            opens,
+            closes,
+            ResourcePool([(key, index_class(opens, closes, busy)) for key, busy in bays.items()]),
+            ResourcePool([(key, index_class(opens, closes, busy)) for key, busy in technicians.items()]),
+            step=options['step'],
+        )
+
+    @staticmethod
+    def time_queries(schedules, queries):
+        results = []
+        started = time.perf_counter()
+        for day, not_before, duration in queries:
+            results.append(schedules[day].earliest(not_before, duration))
+        return (time.perf_counter() - started) * 1000, results
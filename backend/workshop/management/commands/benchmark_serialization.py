@@ -0,0 +1,84 @@
+# workshop/management/commands/benchmark_serialization.py
+import time
+import statistics
+
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.text import compress_string
+from rest_framework.renderers import JSONRenderer
+
+from workshop.models import User
+from workshop.renderers import ORJSONRenderer
+from workshop.queries.invoice_queries import get_filtered_invoices
+from workshop.serializers.customer_serializer import CustomerDetailSerializer
+from workshop.serializers.invoice_serializer import InvoiceSerializer
+from workshop.middleware.compression_middleware import brotli
+
+
+class Command(BaseCommand):
+    help = (
+        'Compare DRF JSONRenderer with ORJSONRenderer and measure gzip/brotli sizes '
+        'for the customer and invoice list payloads'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=10_000,
+                            help='Customers in the customer list payload (cars are nested)')
+        parser.add_argument('--invoices', type=int, default=1_000, help='Invoice list page size')
+        parser.add_argument('--repeat', type=int, default=5)
+        parser.add_argument('--brotli-quality', type=int, default=4)
+
+    def handle(self, *args, **options):
+        payloads = self.build_payloads(options['customers'], options['invoices'])
+
+        for name, data in payloads:
+            self.stdout.write(self.style.SUCCESS(f"{name}: {len(data):,} rows"))
+
+            stock_ms, stock_body = self.time_render(JSONRenderer(), data, options['repeat'])
+            fast_ms, fast_body = self.time_render(ORJSONRenderer(), data, options['repeat'])
+            self.stdout.write(f"  JSONRenderer:    {stock_ms:>9.1f} ms  {len(stock_body):>12,} bytes")
+            self.stdout.write(
+                f"  ORJSONRenderer:  {fast_ms:>9.1f} ms  {len(fast_body):>12,} bytes  ({stock_ms / max(fast_ms, 0.001):.1f}x)"
+            )
+
+            started = time.perf_counter()
+            gzipped = compress_string(fast_body)
+            gzip_ms = (time.perf_counter() - started) * 1000
+            self.stdout.write(
+                f"  gzip:            {gzip_ms:>9.1f} ms  {len(gzipped):>12,} bytes  ({self.ratio(gzipped, fast_body)})"
+            )
+
+            if brotli is None:
+                self.stdout.write(self.style.WARNING('  brotli:          not installed'))
+                continue
+            started = time.perf_counter()
+            compressed = brotli.compress(fast_body, quality=options['brotli_quality'])
+            brotli_ms = (time.perf_counter() - started) * 1000
+            self.stdout.write(
+                f"  brotli q{options['brotli_quality']}:       {brotli_ms:>9.1f} ms  {len(compressed):>12,} bytes  "
+                f"({self.ratio(compressed, fast_body)})"
+            )
+
+    def build_payloads(self, customer_limit, invoice_limit):
+        customers = User.objects.filter(role=User.Role.customer).prefetch_related('cars')[:customer_limit]
+        customer_data = CustomerDetailSerializer(customers, many=True).data
+
+        result = get_filtered_invoices(page=1, page_size=invoice_limit)
+        invoice_data = InvoiceSerializer(result['invoices'], many=True).data
+
+        if not customer_data and not invoice_data:
+            raise CommandError("No data found; seed first, e.g. 'python manage.py seed_scale --scale 0.05'")
+        return [('Customer list', customer_data), ('Invoice list', invoice_data)]
+
+    @staticmethod
+    def time_render(renderer, data, repeat):
+        timings = []
+        body = b''
+        for _ in range(repeat):
+            started = time.perf_counter()
+            body = renderer.render(data, 'application/json', {})
+            timings.append((time.perf_counter() - started) * 1000)
+        return statistics.median(timings), body
+
+    @staticmethod
+    def ratio(compressed, original):
+        return f"{len(compressed) / max(len(original), 1):.0%} of raw"
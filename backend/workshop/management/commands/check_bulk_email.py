@@ -0,0 +1,89 @@
+# workshop/management/commands/check_bulk_email.py
+from collections import Counter
+
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management.base import BaseCommand, CommandError
+from django.db import transaction
+
+from workshop.email.email import BulkMailDispatcher
+from workshop.models import EmailDelivery, User
+
+
+class WorkerLost(BaseException):
+    """Stands in for a worker killed mid-send; not an Exception, so the dispatcher cannot catch it"""
+
+
+class Command(BaseCommand):
+    help = (
+        'Check BulkMailDispatcher against the in-memory mail backend: a run killed mid-batch and '
+        'then re-run must mail every recipient at most once. Everything is rolled back afterwards.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--recipients', type=int, default=250)
+        parser.add_argument('--batch-size', type=int, default=40)
+        parser.add_argument('--crash-after', type=int, default=95,
+                            help='Kill the first run when it is about to send this many messages')
+
+    def handle(self, *args, **options):
+        total, crash_after = options['recipients'], options['crash_after']
+        if not 0 < crash_after <= total:
+            raise CommandError('--crash-after must be between 1 and --recipients')
+
+        with transaction.atomic():
+            self.run(total, options['batch_size'], crash_after)
+            transaction.set_rollback(True)
+
+    def run(self, total, batch_size, crash_after):
+        users = User.objects.bulk_create([
+            User(name=f'Bulk check {i}', email=f'bulk-check-{i}@example.invalid', role=User.Role.customer)
+            for i in range(total)
+        ])
+        mail.outbox = []
+        sends = {'count': 0}
+
+        class CrashingBackend(EmailBackend):
+            def send_messages(self, messages):
+                sends['count'] += 1
+                if sends['count'] == crash_after:
+                    raise WorkerLost
+                return super().send_messages(messages)
+
+        heartbeats = []
+        dispatcher = BulkMailDispatcher(
+            batch_size=batch_size, rate_per_minute=10 ** 9, connection_factory=CrashingBackend,
+        )
+        batch_id = None
+        try:
+            dispatcher.dispatch(users, 'Check {{ customer.name }}', 'Hello', heartbeat=lambda: heartbeats.append(1))
+        except WorkerLost:
+            batch_id = EmailDelivery.objects.filter(email=users[0].email).values_list('batch_id', flat=True).first()
+        if batch_id is None:
+            raise CommandError('The first run was not interrupted')
+        first_run = len(mail.outbox)
+
+        summary = dispatcher.dispatch(
+            users, 'Check {{ customer.name }}', 'Hello', batch_id=batch_id, heartbeat=lambda: heartbeats.append(1),
+        )
+
+        received = Counter(message.to[0] for message in mail.outbox)
+        statuses = Counter(
+            EmailDelivery.objects.filter(batch_id=batch_id).values_list('status', flat=True)
+        )
+        duplicates = sum(1 for count in received.values() if count > 1)
+
+        self.stdout.write(f"  First run:        {first_run} sent before the crash")
+        self.stdout.write(f"  Re-run:           {summary['sent']} sent, {summary['failed']} failed")
+        self.stdout.write(f"  Mailed:           {len(received)} of {total} recipients")
+        self.stdout.write(f"  Duplicates:       {duplicates}")
+        self.stdout.write(f"  Delivery rows:    {dict(statuses)}")
+        self.stdout.write(f"  Lease renewals:   {len(heartbeats)}")
+
+        # The message in flight at the crash stays `sending` and is not retried
+        expected = {EmailDelivery.Status.SENT: total - 1, EmailDelivery.Status.SENDING: 1}
+        if duplicates or len(received) != total - 1 or dict(statuses) != expected:
+            raise CommandError('Bulk mail delivered a recipient twice or lost track of one')
+        if not heartbeats:
+            raise CommandError('The dispatcher never renewed its lease')
+        self.stdout.write(self.style.SUCCESS('Bulk mail check passed'))
@@ -0,0 +1,48 @@
+# workshop/management/commands/import_catalog.py
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+
+from workshop.services.catalog_import_service import CatalogImportService, CatalogImportError
+
+
+class Command(BaseCommand):
+    help = (
+        'Import products and variants from a CSV, JSON or JSON Lines file. Columns: '
+        'product_name, category, variant_name, sku (optional), price, quantity (optional)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('path')
+        parser.add_argument('--format', choices=CatalogImportService.FORMATS,
+                            help='Defaults to the file extension')
+        parser.add_argument('--chunk-size', type=int, default=CatalogImportService.CHUNK_SIZE)
+        parser.add_argument('--created-by', default='Catalog import')
+        parser.add_argument('--dry-run', action='store_true', help='Validate and roll every chunk back')
+
+    def handle(self, *args, **options):
+        service = CatalogImportService(
+            chunk_size=options['chunk_size'],
+            created_by=options['created_by'],
+            dry_run=options['dry_run'],
+        )
+        started = time.perf_counter()
+        try:
+            fmt = CatalogImportService.detect_format(options['path'], options['format'])
+            with open(options['path'], 'rb') as stream:
+                report = service.run(CatalogImportService.iter_rows(stream, fmt))
+        except (CatalogImportError, OSError) as e:
+            raise CommandError(str(e))
+
+        for error in report['errors']:
+            self.stdout.write(self.style.WARNING(f"  row {error['row']} ({error['sku'] or 'no sku'}): {error['errors']}"))
+        if report.get('errors_truncated'):
+            self.stdout.write(self.style.WARNING('  ... further errors not shown'))
+        if report.get('error'):
+            self.stdout.write(self.style.ERROR(f"  import stopped: {report['error']}"))
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{'Validated' if options['dry_run'] else 'Imported'} {report['rows']:,} rows in "
+            f"{time.perf_counter() - started:.1f}s: {report['created']:,} created, "
+            f"{report['updated']:,} updated, {report['failed']:,} failed"
+        ))
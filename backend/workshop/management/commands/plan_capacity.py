@@ -0,0 +1,24 @@
+# workshop/management/commands/plan_capacity.py
+from datetime import date
+
+from django.core.management.base import BaseCommand, CommandError
+
+from workshop.services.capacity_planner_service import CapacityPlanner
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate DailyAvailability for the booking horizon with capacity planned from working hours, '
+        'holidays and staffing, and recompute existing future days (run daily from cron)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--start', type=date.fromisoformat, default=None, help='First day (YYYY-MM-DD), default today')
+        parser.add_argument('--days', type=int, default=None, help='Days to plan, default CAPACITY_HORIZON_DAYS')
+
+    def handle(self, *args, **options):
+        if options['days'] is not None and options['days'] <= 0:
+            raise CommandError('--days must be positive')
+
+        created, updated = CapacityPlanner.generate(options['start'], options['days'])
+        self.stdout.write(self.style.SUCCESS(f"Capacity planned: {len(created)} days created, {updated} updated"))
@@ -0,0 +1,27 @@
+# workshop/management/commands/prune_notifications.py
+from django.core.management.base import BaseCommand
+
+from workshop.services.notification_service import NotificationService
+
+
+class Command(BaseCommand):
+    help = 'Delete read notifications older than the retention window (run from cron)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--days', type=int, default=NotificationService.RETENTION_DAYS)
+        parser.add_argument('--batch-size', type=int, default=NotificationService.RETENTION_BATCH_SIZE)
+        parser.add_argument('--rebuild-counters', action='store_true',
+                            help='Recompute unread/total counters from the notification table afterwards')
+
+    def handle(self, *args, **options):
+        deleted = NotificationService.purge_read(
+            older_than_days=options['days'],
+            batch_size=options['batch_size'],
+        )
+        self.stdout.write(self.style.SUCCESS(
+            f"Deleted {deleted} read notification(s) older than {options['days']} days"
+        ))
+
+        if options['rebuild_counters']:
+            NotificationService.rebuild_counters()
+            self.stdout.write(self.style.SUCCESS('Notification counters rebuilt'))
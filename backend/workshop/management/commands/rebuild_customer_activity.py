@@ -0,0 +1,26 @@
+# workshop/management/commands/rebuild_customer_activity.py
+import time
+
+from django.core.management.base import BaseCommand
+
+from workshop.queries.customer_analytics_queries import rebuild_visit_stats, rebuild_customer_activity
+
+
+class Command(BaseCommand):
+    help = (
+        'Recompute customer visit stats and the customer monthly activity fact table from invoices '
+        '(after bulk imports, or from cron to correct drift)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        customers = rebuild_visit_stats()
+        self.stdout.write(self.style.SUCCESS(f"Visit stats updated for {customers:,} customers"))
+
+        rows = rebuild_customer_activity(batch_size=options['batch_size'])
+        self.stdout.write(self.style.SUCCESS(
+            f"Customer activity rebuilt: {rows:,} customer-month rows in {time.perf_counter() - started:.1f}s"
+        ))
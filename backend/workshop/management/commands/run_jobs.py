@@ -0,0 +1,63 @@
+# workshop/management/commands/run_jobs.py
+import time
+import signal
+
+from django.core.management.base import BaseCommand
+from django.db import close_old_connections
+
+from workshop.services.job_service import JobService
+
+
+class Command(BaseCommand):
+    help = 'Run the background job worker (email, notification fan-out and other queued side effects)'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--once', action='store_true',
+                            help='Drain due jobs and exit instead of polling forever')
+        parser.add_argument('--batch-size', type=int, default=10,
+                            help='Jobs leased per claim')
+        parser.add_argument('--sleep', type=float, default=2.0,
+                            help='Seconds to wait when the queue is empty')
+        parser.add_argument('--retry-dead', action='store_true',
+                            help='Requeue dead-lettered jobs before starting')
+        parser.add_argument('--task', default=None,
+                            help='Limit --retry-dead to one task name')
+
+    def handle(self, *args, **options):
+        self.stopping = False
+        signal.signal(signal.SIGTERM, self._stop)
+        signal.signal(signal.SIGINT, self._stop)
+
+        if options['retry_dead']:
+            count = JobService.retry_dead(options['task'])
+            self.stdout.write(self.style.WARNING(f"Requeued {count} dead job(s)"))
+
+        worker = JobService.worker_id()
+        self.stdout.write(self.style.SUCCESS(f"Job worker {worker} started"))
+
+        processed = 0
+        while not self.stopping:
+            close_old_connections()
+
+            stale = JobService.requeue_stale()
+            if stale:
+                self.stdout.write(self.style.WARNING(f"Requeued {stale} stale job(s)"))
+
+            jobs = JobService.claim_jobs(worker, limit=options['batch_size'])
+            if not jobs:
+                if options['once']:
+                    break
+                time.sleep(options['sleep'])
+                continue
+
+            for job in jobs:
+                ok = JobService.run_job(job)
+                processed += 1
+                style = self.style.SUCCESS if ok else self.style.ERROR
+                self.stdout.write(style(f"{job.task} {job.id}: {job.status}"))
+
+        self.stdout.write(f"Job worker {worker} stopped after {processed} job(s)")
+
+    def _stop(self, signum, frame):
+        # Finish the current batch, then exit the loop
+        self.stopping = True
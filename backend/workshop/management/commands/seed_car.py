@@ -1,6 +1,6 @@
 from django.core.management.base import BaseCommand
 from workshop.models.car import Car  # Adjust import based on your structure
-from workshop.models.customer import Customer
+from workshop.models.user import User
 
 from random import choice, randint
 from faker import Faker
@@ -12,7 +12,7 @@ class Command(BaseCommand):
 
     def handle(self, *args, **kwargs):
         # Get some existing customers
-        customers = list(Customer.objects.all())
+        customers = list(User.objects.filter(role=User.Role.customer))
 
         if not customers:
             self.stdout.write(self.style.ERROR('No customers found. Please seed customers first.'))
@@ -55,6 +55,6 @@ class Command(BaseCommand):
             )
 
             if created:
-                self.stdout.write(self.style.SUCCESS(f'Created car: {make} {model} ({vin}) for {customer.username}'))
+                self.stdout.write(self.style.SUCCESS(f'Created car: {make} {model} ({vin}) for {customer.name}'))
             else:
                 self.stdout.write(self.style.WARNING(f'Car already exists: {vin}'))
@@ -1,6 +1,5 @@
 from django.core.management.base import BaseCommand
-from workshop.models.customer import Customer
-from django.utils import timezone
+from workshop.models.user import User
 
 class Command(BaseCommand):
     help = 'Seeds the database with 5 demo customers'
@@ -14,7 +13,7 @@ class Command(BaseCommand):
                 'password': 'securepass1',
                 'first_name': 'Ali',
                 'last_name': 'Khan',
-                'phone_number': '03001234567',
+                'phone_number': '+923001234567',
                 'city': 'Karachi',
                 'state': 'Sindh',
                 'address': '123 Clifton Block 5, Karachi',
@@ -26,7 +25,7 @@ class Command(BaseCommand):
                 'password': 'securepass2',
                 'first_name': 'Amna',
                 'last_name': 'Emaan',
-                'phone_number': '03111234567',
+                'phone_number': '+923111234567',
                 'city': 'Karachi',
                 'state': 'Sindh',
                 'address': 'House 45, DHA Phase 6, Karachi',
@@ -38,7 +37,7 @@ class Command(BaseCommand):
                 'password': 'securepass3',
                 'first_name': 'Wali',
                 'last_name': 'Yar',
-                'phone_number': '03221234567',
+                'phone_number': '+923221234567',
                 'city': 'Karachi',
                 'state': 'Sindh',
                 'address': 'Flat 8, Gulshan Block 13D, Karachi',
@@ -50,7 +49,7 @@ class Command(BaseCommand):
                 'password': 'securepass4',
                 'first_name': 'Osaid',
                 'last_name': 'Rehman',
-                'phone_number': '03451234567',
+                'phone_number': '+923451234567',
                 'city': 'Karachi',
                 'state': 'Sindh',
                 'address': 'Villa 7, Bahria Town, Karachi',
@@ -62,7 +61,7 @@ class Command(BaseCommand):
                 'password': 'securepass5',
                 'first_name': 'Fatima',
                 'last_name': 'Mirza',
-                'phone_number': '03331234567',
+                'phone_number': '+923331234567',
                 'city': 'Lahore',
                 'state': 'Punjab',
                 'address': 'Model Town, Lahore',
@@ -70,23 +69,20 @@ class Command(BaseCommand):
         ]
 
         for data in customers_data:
-            customer, created = Customer.objects.get_or_create(
-                username=data['username'],
+            customer, created = User.objects.get_or_create(
+                email=data['email'],
                 defaults={
-                    'nic': data['nic'],
-                    'email': data['email'],
-                    'first_name': data['first_name'],
-                    'last_name': data['last_name'],
+                    'name': f"{data['first_name']} {data['last_name']}",
+                    'role': User.Role.customer,
                     'phone_number': data['phone_number'],
                     'city': data['city'],
                     'state': data['state'],
                     'address': data['address'],
-                    'date_joined': timezone.now(),
                 }
             )
             if created:
                 customer.set_password(data['password'])
                 customer.save()
-                self.stdout.write(self.style.SUCCESS(f"Created customer: {customer.username}"))
+                self.stdout.write(self.style.SUCCESS(f"Created customer: {customer.name}"))
             else:
-                self.stdout.write(self.style.WARNING(f"Customer already exists: {customer.username}"))
+                self.stdout.write(self.style.WARNING(f"Customer already exists: {customer.name}"))
@@ -0,0 +1,505 @@
+# workshop/management/commands/seed_scale.py
+import time
+import uuid
+import random
+from contextlib import contextmanager
+from datetime import datetime, time as dt_time, timedelta
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from faker import Faker
+
+from workshop.models import (
+    User, Car, Service, Product, ProductVariant, StockMovement, Invoice, InvoiceItems,
+    DailyAvailability, Booking, BookingService, BookingEvent, Employee, PaySlip, Expense,
+)
+from workshop.models.expenses import ExpenseCategory
+from workshop.queries.customer_analytics_queries import rebuild_visit_stats, rebuild_customer_activity
+
+
+MAKES_MODELS = {
+    'Toyota': ['Corolla', 'Yaris', 'Camry', 'Fortuner', 'Hilux', 'Prius'],
+    'Honda': ['Civic', 'City', 'Accord', 'BR-V', 'HR-V'],
+    'Suzuki': ['Alto', 'Cultus', 'Swift', 'Wagon R', 'Mehran'],
+    'Hyundai': ['Tucson', 'Elantra', 'Sonata'],
+    'KIA': ['Sportage', 'Picanto', 'Sorento'],
+    'Changan': ['Alsvin', 'Oshan X7'],
+    'MG': ['HS', 'ZS'],
+}
+COLORS = ['White', 'Black', 'Silver', 'Grey', 'Red', 'Blue', 'Green', 'Beige']
+PLATE_PREFIXES = ['KHI', 'LHR', 'ISB', 'RWP', 'FSD', 'MUL', 'PEW']
+
+SERVICES = [
+    ('Exterior Wash', Service.Category.WASHING, '1500.00'),
+    ('Full Detail', Service.Category.DETAILING, '8500.00'),
+    ('Interior Detail', Service.Category.DETAILING, '4500.00'),
+    ('Oil & Filter Change', Service.Category.OIL_CHANGE, '3500.00'),
+    ('Wheel Alignment & Balancing', Service.Category.MAINTENANCE, '2500.00'),
+    ('Brake Pad Replacement', Service.Category.REPAIR, '5000.00'),
+    ('AC Service', Service.Category.AC_SERVICING, '6000.00'),
+    ('Ceramic Coating', Service.Category.POLISHING, '25000.00'),
+    ('Battery Replacement', Service.Category.BATTERY_SERVICES, '3000.00'),
+    ('Pre-Purchase Inspection', Service.Category.INSPECTION, '2000.00'),
+]
+VARIANT_NAMES = ['Small', 'Medium', 'Large', '500ml', '1L', '4L', 'Standard', 'Premium']
+
+# Fields stamped with auto_now_add that must carry historical values for realistic data
+HISTORICAL_FIELDS = [
+    (User, 'date_joined'),
+    (Car, 'created_at'),
+    (Invoice, 'created_at'),
+    (Booking, 'created_at'),
+    (StockMovement, 'updated_at'),
+    (Expense, 'created_at'),
+    (PaySlip, 'paid_on'),
+    (Employee, 'date_joined'),
+]
+
+SCALE_EMAIL_DOMAIN = 'scale.example.com'
+
+
+@contextmanager
+def historical_timestamps():
+    """Temporarily let bulk_create keep explicit values for auto_now_add fields"""
+    fields = [model._meta.get_field(name) for model, name in HISTORICAL_FIELDS]
+    previous = [field.auto_now_add for field in fields]
+    for field in fields:
+        field.auto_now_add = False
+    try:
+        yield
+    finally:
+        for field, value in zip(fields, previous):
+            field.auto_now_add = value
+
+
+class Command(BaseCommand):
+    help = (
+        'Generate a large, referentially consistent synthetic dataset for benchmarking '
+        '(customers, cars, bookings with services/invoices/items, stock ledger, payroll, expenses)'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--customers', type=int, default=100_000)
+        parser.add_argument('--cars', type=int, default=300_000)
+        parser.add_argument('--bookings', type=int, default=2_000_000)
+        parser.add_argument('--products', type=int, default=200)
+        parser.add_argument('--variants-per-product', type=int, default=4)
+        parser.add_argument('--stock-movements', type=int, default=500_000)
+        parser.add_argument('--employees', type=int, default=40)
+        parser.add_argument('--expenses', type=int, default=50_000)
+        parser.add_argument('--days', type=int, default=730,
+                            help='History window; bookings also extend 30 days into the future')
+        parser.add_argument('--scale', type=float, default=1.0,
+                            help='Multiply every volume, e.g. 0.01 for a quick smoke dataset')
+        parser.add_argument('--seed', type=int, default=42, help='Random seed (same seed, same data)')
+        parser.add_argument('--chunk-size', type=int, default=5000)
+
+    def handle(self, *args, **options):
+        self.rng = random.Random(options['seed'])
+        self.fake = Faker()
+        Faker.seed(options['seed'])
+        self.chunk_size = options['chunk_size']
+        self.today = timezone.now().date()
+        self.start_date = self.today - timedelta(days=options['days'])
+        self.end_date = self.today + timedelta(days=30)
+
+        scale = options['scale']
+        volume = {
+            key: max(1, int(options[key] * scale))
+            for key in ('customers', 'cars', 'bookings', 'stock_movements', 'employees', 'expenses', 'products')
+        }
+        self.stdout.write(self.style.WARNING(
+            'Seeding ' + ', '.join(f"{count:,} {key.replace('_', ' ')}" for key, count in volume.items())
+        ))
+
+        # Name pools keep Faker off the hot path; it is far too slow to call per row at this scale
+        self.first_names = [self.fake.first_name() for _ in range(500)]
+        self.last_names = [self.fake.last_name() for _ in range(500)]
+        self.sentences = [self.fake.sentence(nb_words=8) for _ in range(200)]
+
+        started = time.perf_counter()
+        with historical_timestamps():
+            admin = self.get_admin()
+            services = self.seed_services()
+            customer_ids = self.step('customers', self.seed_customers, volume['customers'])
+            cars = self.step('cars', self.seed_cars, volume['cars'], customer_ids)
+            variants = self.step('products', self.seed_catalog, volume['products'], options['variants_per_product'])
+            self.step('stock movements', self.seed_stock_ledger, volume['stock_movements'], variants)
+            self.step('bookings', self.seed_bookings, volume['bookings'], cars, services, variants, admin)
+            self.step('payroll', self.seed_payroll, volume['employees'], options['days'])
+            self.step('expenses', self.seed_expenses, volume['expenses'], admin)
+            # bulk_create skips the invoice signals that maintain these
+            self.step('customer visit stats', rebuild_visit_stats)
+            self.step('customer activity', rebuild_customer_activity)
+
+        self.stdout.write(self.style.SUCCESS(f"Done in {time.perf_counter() - started:.1f}s"))
+
+    # -- helpers ---------------------------------------------------------------
+
+    def step(self, label, func, *args):
+        started = time.perf_counter()
+        result = func(*args)
+        self.stdout.write(self.style.SUCCESS(f"  {label}: {time.perf_counter() - started:.1f}s"))
+        return result
+
+    def uuid(self):
+        """Deterministic UUID4 from the seeded generator"""
+        return uuid.UUID(int=self.rng.getrandbits(128), version=4)
+
+    def random_datetime(self, day):
+        moment = datetime.combine(day, dt_time(hour=self.rng.randint(8, 19), minute=self.rng.randint(0, 59)))
+        return timezone.make_aware(moment)
+
+    def random_day(self, start=None, end=None):
+        start = start or self.start_date
+        end = end or self.today
+        return start + timedelta(days=self.rng.randint(0, (end - start).days))
+
+    def chunks(self, total):
+        for offset in range(0, total, self.chunk_size):
+            yield offset, min(self.chunk_size, total - offset)
+
+    def progress(self, label, done, total):
+        self.stdout.write(f"    {label}: {done:,}/{total:,}", ending='\r')
+        if done >= total:
+            self.stdout.write('')
+
+    # -- reference data --------------------------------------------------------
+
+    def get_admin(self):
+        admin = User.objects.filter(role=User.Role.admin).order_by('date_joined').first()
+        if admin:
+            return admin
+        return User.objects.create_superuser(
+            email=f'admin@{SCALE_EMAIL_DOMAIN}', password='scale-admin', name='Scale Admin'
+        )
+
+    def seed_services(self):
+        services = []
+        for name, category, price in SERVICES:
+            service, _ = Service.objects.get_or_create(
+                name=name,
+                defaults={'category': category, 'price': Decimal(price), 'description': name},
+            )
+            services.append(service)
+        return [(service.id, service.price) for service in services]
+
+    # -- customers and cars ----------------------------------------------------
+
+    def seed_customers(self, total):
+        run_tag = self.rng.getrandbits(32)
+        ids = []
+        for offset, size in self.chunks(total):
+            batch = []
+            for i in range(offset, offset + size):
+                user_id = self.uuid()
+                first, last = self.rng.choice(self.first_names), self.rng.choice(self.last_names)
+                batch.append(User(
+                    id=user_id,
+                    name=f"{first} {last}"[:30],
+                    email=f"{first.lower()}.{last.lower()}.{run_tag:x}.{i}@{SCALE_EMAIL_DOMAIN}",
+                    role=User.Role.customer,
+                    phone_number=f"+923{self.rng.randint(0, 499999999):09d}",
+                    city=self.rng.choice(['Karachi', 'Lahore', 'Islamabad', 'Rawalpindi']),
+                    date_joined=self.random_datetime(self.random_day()),
+                ))
+                ids.append(user_id)
+            User.objects.bulk_create(batch)
+            self.progress('customers', offset + size, total)
+        return ids
+
+    def seed_cars(self, total, customer_ids):
+        run_tag = self.rng.randint(0, 9999)
+        cars = []
+        for offset, size in self.chunks(total):
+            batch = []
+            for i in range(offset, offset + size):
+                # Every customer gets at least one car; the rest are spread randomly
+                customer_id = customer_ids[i] if i < len(customer_ids) else self.rng.choice(customer_ids)
+                make = self.rng.choice(list(MAKES_MODELS))
+                car_id = self.uuid()
+                batch.append(Car(
+                    id=car_id,
+                    make=make,
+                    model=self.rng.choice(MAKES_MODELS[make]),
+                    year=str(self.rng.randint(2005, 2025)),
+                    license_plate=f"{self.rng.choice(PLATE_PREFIXES)}-{run_tag:04d}-{i:07d}",
+                    color=self.rng.choice(COLORS),
+                    customer_id=customer_id,
+                    created_at=self.random_datetime(self.random_day()),
+                ))
+                cars.append((car_id, customer_id))
+            Car.objects.bulk_create(batch)
+            self.progress('cars', offset + size, total)
+        return cars
+
+    # -- catalog and stock -----------------------------------------------------
+
+    def seed_catalog(self, total_products, variants_per_product):
+        run_tag = self.rng.randint(0, 9999)
+        categories = [value for value, _ in Product.CATEGORY_CHOICES]
+        products, variants = [], []
+        for p in range(total_products):
+            product = Product(
+                id=self.uuid(),
+                name=f"{self.fake.word().title()} {self.rng.choice(categories)} {p}"[:100],
+                category=self.rng.choice(categories),
+            )
+            products.append(product)
+            for v in range(variants_per_product):
+                variants.append(ProductVariant(
+                    id=self.uuid(),
+                    product=product,
+                    variant_name=VARIANT_NAMES[v % len(VARIANT_NAMES)],
+                    # Explicit SKU bypasses ProductVariant.save()'s per-row COUNT query
+                    sku=f"SC{run_tag:04d}-{p:05d}-{v:02d}",
+                    price=Decimal(self.rng.randint(200, 15000)),
+                    quantity=Decimal('0'),
+                ))
+        Product.objects.bulk_create(products, batch_size=self.chunk_size)
+        ProductVariant.objects.bulk_create(variants, batch_size=self.chunk_size)
+        return [(variant.id, variant.price) for variant in variants]
+
+    def seed_stock_ledger(self, total, variants):
+        """
+        Per-variant ledger: INITIAL then PURCHASE/SALE/DAMAGE/ADJUSTMENT rows whose
+        quantity_before/after chain exactly, ending at the variant's stored quantity.
+        """
+        per_variant = max(1, total // len(variants))
+        final_quantities = []
+        batch = []
+        written = 0
+
+        for variant_id, _ in variants:
+            quantity = Decimal(self.rng.randint(20, 200))
+            moment = self.random_datetime(self.start_date)
+            batch.append(StockMovement(
+                id=self.uuid(), product_variant_id=variant_id, change_amount=quantity, reason='INITIAL',
+                quantity_before=Decimal('0'), quantity_after=quantity, created_by='seed_scale',
+                reference_id=f"Initial_Stock_{variant_id}", updated_at=moment,
+            ))
+            step = timedelta(seconds=max(60, int((self.today - self.start_date).total_seconds() / per_variant)))
+
+            for _ in range(per_variant - 1):
+                moment += step
+                reason = self.rng.choices(['SALE', 'PURCHASE', 'DAMAGE', 'ADJUSTMENT'], weights=[70, 20, 5, 5])[0]
+                if reason == 'PURCHASE' or quantity < 5:
+                    reason, change = 'PURCHASE', Decimal(self.rng.randint(10, 100))
+                elif reason == 'ADJUSTMENT':
+                    change = Decimal(self.rng.randint(-2, 2)) or Decimal('1')
+                else:
+                    change = -Decimal(self.rng.randint(1, min(5, int(quantity))))
+                batch.append(StockMovement(
+                    id=self.uuid(), product_variant_id=variant_id, change_amount=change, reason=reason,
+                    quantity_before=quantity, quantity_after=quantity + change, created_by='seed_scale',
+                    updated_at=moment,
+                ))
+                quantity += change
+
+                if len(batch) >= self.chunk_size:
+                    StockMovement.objects.bulk_create(batch)
+                    written += len(batch)
+                    batch = []
+                    self.progress('stock movements', written, per_variant * len(variants))
+
+            final_quantities.append(ProductVariant(id=variant_id, quantity=quantity))
+
+        StockMovement.objects.bulk_create(batch)
+        self.progress('stock movements', per_variant * len(variants), per_variant * len(variants))
+        ProductVariant.objects.bulk_update(final_quantities, ['quantity'], batch_size=self.chunk_size)
+
+    # -- bookings, invoices, items ---------------------------------------------
+
+    def seed_availability(self):
+        days = (self.end_date - self.start_date).days + 1
+        existing = dict(
+            DailyAvailability.objects.filter(date__range=(self.start_date, self.end_date))
+            .values_list('date', 'id')
+        )
+        missing = [
+            DailyAvailability(id=self.uuid(), date=self.start_date + timedelta(days=d))
+            for d in range(days)
+            if self.start_date + timedelta(days=d) not in existing
+        ]
+        DailyAvailability.objects.bulk_create(missing, batch_size=self.chunk_size)
+        existing.update({row.date: row.id for row in missing})
+        return existing
+
+    def booking_status(self, day):
+        if day < self.today:
+            return self.rng.choices(['completed', 'canceled'], weights=[90, 10])[0]
+        if day == self.today:
+            return self.rng.choice(['confirmed', 'in_progress', 'completed'])
+        return self.rng.choices(['pending', 'confirmed', 'canceled'], weights=[50, 45, 5])[0]
+
+    # Status path a booking took to reach its final status
+    STATUS_PATHS = {
+        'pending': ['pending'],
+        'confirmed': ['pending', 'confirmed'],
+        'in_progress': ['pending', 'confirmed', 'in_progress'],
+        'completed': ['pending', 'confirmed', 'in_progress', 'completed'],
+        'canceled': ['pending', 'canceled'],
+    }
+
+    def booking_events(self, booking_id, status, created_at, created_by_id):
+        """Event log for a seeded booking, one event per step of its status path"""
+        events, previous = [], None
+        for to_status in self.STATUS_PATHS[status]:
+            at = created_at if previous is None else previous[1] + timedelta(minutes=self.rng.randint(15, 24 * 60))
+            events.append(BookingEvent(
+                id=self.uuid(),
+                booking_id=booking_id,
+                from_status=previous[0] if previous else '',
+                to_status=to_status,
+                created_at=at,
+                previous_at=previous[1] if previous else None,
+                created_by_id=created_by_id,
+            ))
+            previous = (to_status, at)
+        return events
+
+    def seed_bookings(self, total, cars, services, variants, admin):
+        availability = self.seed_availability()
+        booked = {day: 0 for day in availability}
+        run_tag = self.rng.randint(0, 999)
+        invoice_status = {
+            'completed': lambda: self.rng.choices(['paid', 'pending', 'refunded'], weights=[92, 6, 2])[0],
+            'canceled': lambda: 'cancelled',
+        }
+
+        for offset, size in self.chunks(total):
+            invoices, bookings, booking_services, items, events = [], [], [], [], []
+            for i in range(offset, offset + size):
+                car_id, customer_id = self.rng.choice(cars)
+                day = self.random_day(end=self.end_date)
+                status = self.booking_status(day)
+                service_id, service_price = self.rng.choice(services)
+                created_at = self.random_datetime(day - timedelta(days=self.rng.randint(0, 14)))
+
+                booking_service_id = self.uuid()
+                items_total = Decimal('0')
+                for _ in range(self.rng.choices([0, 1, 2, 3], weights=[40, 30, 20, 10])[0]):
+                    variant_id, unit_price = self.rng.choice(variants)
+                    quantity = Decimal(self.rng.randint(1, 3))
+                    items.append(InvoiceItems(
+                        id=self.uuid(), booking_service_id=booking_service_id, product_variant_id=variant_id,
+                        unit_price=unit_price, quantity=quantity, total_amount=unit_price * quantity,
+                    ))
+                    items_total += unit_price * quantity
+
+                subtotal = service_price + items_total
+                discount = Decimal(self.rng.choice([0, 0, 0, 250, 500]))
+                invoice_id = self.uuid()
+                invoices.append(Invoice(
+                    id=invoice_id,
+                    invoice_number=f"SC{run_tag:03d}{i:09d}",
+                    subtotal=subtotal,
+                    discount_amount=discount,
+                    total_amount=max(subtotal - discount, Decimal('0')),
+                    status=invoice_status.get(status, lambda: 'pending')(),
+                    user_id=customer_id,
+                    created_at=created_at,
+                ))
+
+                booking_id = self.uuid()
+                created_by_id = self.rng.choice([admin.id, customer_id])
+                rating = self.rng.choice([None, None, 3, 4, 5, 5]) if status == 'completed' else None
+                bookings.append(Booking(
+                    id=booking_id,
+                    car_id=car_id,
+                    invoice_id=invoice_id,
+                    daily_availability_id=availability[day],
+                    created_by_id=created_by_id,
+                    special_instructions=self.rng.choice(self.sentences) if self.rng.random() < 0.2 else None,
+                    customer_rating=rating,
+                    customer_feedback=self.rng.choice(self.sentences) if rating else '',
+                    created_at=created_at,
+                ))
+                booking_services.append(BookingService(
+                    id=booking_service_id,
+                    booking_id=booking_id,
+                    service_id=service_id,
+                    price=service_price,
+                    product_items_price=items_total,
+                    status=status,
+                ))
+                events.extend(self.booking_events(booking_id, status, created_at, created_by_id))
+                if status != 'canceled':
+                    booked[day] += 1
+
+            with transaction.atomic():
+                Invoice.objects.bulk_create(invoices)
+                Booking.objects.bulk_create(bookings)
+                BookingService.objects.bulk_create(booking_services)
+                InvoiceItems.objects.bulk_create(items)
+                BookingEvent.objects.bulk_create(events)
+            self.progress('bookings', offset + size, total)
+
+        # Size each day's capacity to what was booked so availability stays consistent
+        rows = list(DailyAvailability.objects.filter(id__in=availability.values()))
+        for row in rows:
+            active = booked.get(row.date, 0) + (row.total_slots - row.available_slots)
+            row.total_slots = max(row.total_slots, active)
+            row.available_slots = row.total_slots - active
+        DailyAvailability.objects.bulk_update(rows, ['total_slots', 'available_slots'], batch_size=self.chunk_size)
+
+    # -- payroll and expenses --------------------------------------------------
+
+    def seed_payroll(self, total, days):
+        run_tag = self.rng.randint(0, 99999)
+        employees = []
+        for i in range(total):
+            first, last = self.rng.choice(self.first_names), self.rng.choice(self.last_names)
+            employees.append(Employee(
+                id=self.uuid(),
+                name=f"{first} {last}"[:50],
+                email=f"emp.{run_tag}.{i}@{SCALE_EMAIL_DOMAIN}",
+                phone=f"+92{run_tag % 1000:03d}{i:07d}",
+                nic=f"{run_tag:05d}{i:08d}",
+                position=self.rng.choice(['Detailer', 'Washer', 'Mechanic', 'Supervisor', 'Cashier']),
+                salary=Decimal(self.rng.randint(35, 120) * 1000),
+                date_joined=self.start_date,
+            ))
+        Employee.objects.bulk_create(employees)
+
+        months = []
+        cursor = self.start_date.replace(day=1)
+        while cursor <= self.today:
+            months.append(cursor)
+            cursor = (cursor + timedelta(days=32)).replace(day=1)
+
+        payslips = []
+        for employee in employees:
+            for month in months[:-1]:
+                bonus = Decimal(self.rng.choice([0, 0, 0, 2000, 5000]))
+                payslips.append(PaySlip(
+                    id=self.uuid(),
+                    employee=employee,
+                    month=month.strftime('%Y-%m'),
+                    amount=employee.salary,
+                    bonus=bonus,
+                    total_salary=employee.salary + bonus,
+                    paid_on=(month + timedelta(days=32)).replace(day=1),
+                ))
+        PaySlip.objects.bulk_create(payslips, batch_size=self.chunk_size)
+
+    def seed_expenses(self, total, admin):
+        categories = ExpenseCategory.values
+        for offset, size in self.chunks(total):
+            batch = []
+            for _ in range(size):
+                paid_on = self.random_day()
+                category = self.rng.choice(categories)
+                batch.append(Expense(
+                    id=self.uuid(),
+                    title=f"{category.title()} {paid_on:%b %Y}",
+                    category=category,
+                    amount=Decimal(self.rng.randint(100, 80000)),
+                    paid_on=paid_on,
+                    created_by=admin,
+                    created_at=self.random_datetime(paid_on),
+                ))
+            Expense.objects.bulk_create(batch)
+            self.progress('expenses', offset + size, total)
@@ -1,54 +1,57 @@
 from django.core.management.base import BaseCommand
-from workshop.models.booking import BookingTimeSlot
-from datetime import date, time, timedelta
+from workshop.models import Employee, Service, WorkshopResource
+
+# Typical job length per service category, in minutes
+CATEGORY_DURATIONS = {
+    Service.Category.WASHING: 45,
+    Service.Category.DETAILING: 240,
+    Service.Category.MAINTENANCE: 90,
+    Service.Category.REPAIR: 180,
+    Service.Category.INSPECTION: 45,
+    Service.Category.OIL_CHANGE: 30,
+    Service.Category.TIRE_SERVICES: 60,
+    Service.Category.BATTERY_SERVICES: 30,
+    Service.Category.AC_SERVICING: 90,
+    Service.Category.PAINT_AND_BODY: 480,
+    Service.Category.POLISHING: 180,
+    Service.Category.MODIFICATIONS: 240,
+    Service.Category.WINDSHIELD_SERVICES: 90,
+    Service.Category.ENGINE_TUNING: 120,
+    Service.Category.BREAKDOWN_ASSISTANCE: 60,
+}
+
 
 class Command(BaseCommand):
-    help = 'Seeds the database with available time slots for the next 30 days'
+    help = (
+        'Seeds the slot scheduler: workshop bays, one technician per active employee, '
+        'and service durations by category for services still on the default duration'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--bays', type=int, default=3)
 
-    def handle(self, *args, **kwargs):
-        # Time slots for workshop operations (9 AM to 6 PM)
-        time_slots = [
-            (time(9, 0), time(10, 30)),   # 9:00 - 10:30
-            (time(10, 30), time(12, 0)),  # 10:30 - 12:00
-            (time(13, 0), time(14, 30)),  # 1:00 - 2:30 (after lunch)
-            (time(14, 30), time(16, 0)),  # 2:30 - 4:00
-            (time(16, 0), time(17, 30)),  # 4:00 - 5:30
+    def handle(self, *args, **options):
+        bays = [
+            WorkshopResource(name=f"Bay {number}", kind=WorkshopResource.Kind.BAY)
+            for number in range(1, options['bays'] + 1)
+            if not WorkshopResource.objects.filter(name=f"Bay {number}", kind=WorkshopResource.Kind.BAY).exists()
         ]
-        
-        created_count = 0
-        start_date = date.today()
-        
-        # Create time slots for next 30 days
-        for day_offset in range(30):
-            current_date = start_date + timedelta(days=day_offset)
-            
-            # Skip Fridays (workshop closed)
-            if current_date.weekday() == 4:  # Friday is 4
-                continue
-            
-            for start_time, end_time in time_slots:
-                # Determine max concurrent bookings based on time slot
-                # Morning and afternoon slots can handle more cars
-                if start_time.hour < 12 or start_time.hour > 14:
-                    max_concurrent = 2
-                else:
-                    max_concurrent = 1
-                
-                slot, created = BookingTimeSlot.objects.get_or_create(
-                    date=current_date,
-                    start_time=start_time,
-                    defaults={
-                        'end_time': end_time,
-                        'max_concurrent_bookings': max_concurrent,
-                        'is_available': True,
-                    }
-                )
-                
-                if created:
-                    created_count += 1
-                    self.stdout.write(self.style.SUCCESS(
-                        f"Created time slot: {current_date} {start_time}-{end_time}"
-                    ))
-        
-        self.stdout.write(self.style.SUCCESS(f"\nCreated {created_count} new time slots."))
-        self.stdout.write(self.style.WARNING("Note: Fridays are skipped (workshop closed)."))
+        WorkshopResource.objects.bulk_create(bays)
+        self.stdout.write(self.style.SUCCESS(f"Created {len(bays)} bays"))
+
+        linked = set(
+            WorkshopResource.objects.filter(kind=WorkshopResource.Kind.TECHNICIAN, employee__isnull=False)
+            .values_list('employee_id', flat=True)
+        )
+        technicians = [
+            WorkshopResource(name=employee.name, kind=WorkshopResource.Kind.TECHNICIAN, employee=employee)
+            for employee in Employee.objects.filter(is_active=True).exclude(id__in=linked)
+        ]
+        WorkshopResource.objects.bulk_create(technicians)
+        self.stdout.write(self.style.SUCCESS(f"Created {len(technicians)} technicians"))
+
+        services = list(Service.objects.filter(duration_minutes=60))
+        for service in services:
+            service.duration_minutes = CATEGORY_DURATIONS.get(service.category, 60)
+        Service.objects.bulk_update(services, ['duration_minutes'])
+        self.stdout.write(self.style.SUCCESS(f"Set durations for {len(services)} services"))
@@ -0,0 +1,44 @@
+# workshop/management/commands/send_bulk_email.py
+import uuid
+
+from django.core.management.base import BaseCommand, CommandError
+
+from workshop.services.job_service import JobService
+
+
+class Command(BaseCommand):
+    help = 'Send a templated email to all customers (or a role) using batched SMTP connections'
+
+    def add_arguments(self, parser):
+        parser.add_argument('--subject', required=True,
+                            help='Subject template, e.g. "Your car is due, {{ customer.name }}"')
+        parser.add_argument('--body', help='Body template')
+        parser.add_argument('--body-file', help='Read the body template from a file')
+        parser.add_argument('--role', default='customer')
+        parser.add_argument('--now', action='store_true',
+                            help='Send in this process instead of queueing for the job worker')
+
+    def handle(self, *args, **options):
+        body = options['body']
+        if options['body_file']:
+            with open(options['body_file'], encoding='utf-8') as fh:
+                body = fh.read()
+        if not body:
+            raise CommandError('Provide --body or --body-file')
+
+        payload = {
+            'subject': options['subject'],
+            'body': body,
+            'role': options['role'],
+            'batch_id': str(uuid.uuid4()),
+        }
+
+        job = JobService.enqueue('email.bulk', payload, max_attempts=3)
+        if options['now']:
+            JobService.run_job(job)
+            job.refresh_from_db()
+            self.stdout.write(self.style.SUCCESS(f"Batch {payload['batch_id']} finished: {job.status}"))
+        else:
+            self.stdout.write(self.style.SUCCESS(
+                f"Queued batch {payload['batch_id']} as job {job.id}; run `manage.py run_jobs` to send"
+            ))
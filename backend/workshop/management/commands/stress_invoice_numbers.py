@@ -0,0 +1,106 @@
+# workshop/management/commands/stress_invoice_numbers.py
+import time
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+from django.core.management.base import BaseCommand, CommandError
+from django.db import IntegrityError, connection
+from django.db.models import Count
+
+from workshop.models import User, Invoice, InvoiceNumberCounter
+from workshop.services.invoice_number_service import InvoiceNumberAllocator
+
+
+STRESS_TAG = 'invoice-number-stress'
+
+
+class Command(BaseCommand):
+    help = (
+        'Create invoices from parallel workers, each with its own number allocator, and check '
+        'that every invoice number is unique. Uses a separate counter period, not the live one.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--invoices', type=int, default=100_000)
+        parser.add_argument('--workers', type=int, default=8)
+        parser.add_argument('--mode', choices=('bulk', 'single'), default='bulk',
+                            help='bulk: allocate a batch and bulk_create it; single: Invoice.save() per row')
+        parser.add_argument('--batch-size', type=int, default=500, help='Invoices per allocation in bulk mode')
+        parser.add_argument('--block-size', type=int, default=20, help='Allocator block size in single mode')
+        parser.add_argument('--period', default='STRESS', help='Counter period the numbers are drawn from')
+        parser.add_argument('--keep', action='store_true', help='Keep the created invoices')
+
+    def handle(self, *args, **options):
+        if connection.vendor != 'postgresql':
+            raise CommandError('Row locks need PostgreSQL; this database cannot run the stress test in parallel')
+
+        self.user, _ = User.objects.get_or_create(
+            email=f'{STRESS_TAG}@example.com', defaults={'name': 'Invoice Stress'}
+        )
+        self.options = options
+        per_worker = [options['invoices'] // options['workers']] * options['workers']
+        per_worker[0] += options['invoices'] % options['workers']
+
+        started = time.perf_counter()
+        try:
+            with ThreadPoolExecutor(max_workers=options['workers']) as pool:
+                results = list(pool.map(self.run_worker, per_worker))
+            elapsed = time.perf_counter() - started
+            self.report(results, elapsed)
+        finally:
+            if not options['keep']:
+                User.objects.filter(pk=self.user.pk).delete()
+                InvoiceNumberCounter.objects.filter(period=options['period']).delete()
+
+    def run_worker(self, total):
+        # One allocator per thread stands in for one gunicorn worker and its cached block
+        allocator = InvoiceNumberAllocator(block_size=self.options['block_size'])
+        created = collisions = 0
+        try:
+            if self.options['mode'] == 'bulk':
+                while created < total:
+                    size = min(self.options['batch_size'], total - created)
+                    numbers = allocator.allocate(size, period=self.options['period'])
+                    try:
+                        Invoice.objects.bulk_create([self.build(number) for number in numbers])
+                    except IntegrityError:
+                        collisions += 1
+                    created += size
+            else:
+                for _ in range(total):
+                    invoice = self.build(allocator.allocate(1, period=self.options['period'])[0])
+                    try:
+                        invoice.save()
+                    except IntegrityError:
+                        collisions += 1
+                    created += 1
+        finally:
+            connection.close()
+        return created, collisions
+
+    def build(self, number):
+        return Invoice(
+            invoice_number=number,
+            subtotal=Decimal('1000.00'),
+            total_amount=Decimal('1000.00'),
+            user=self.user,
+        )
+
+    def report(self, results, elapsed):
+        attempted = sum(created for created, _ in results)
+        collisions = sum(count for _, count in results)
+        stored = Invoice.objects.filter(user=self.user, invoice_number__startswith=f"DH{self.options['period']}-")
+        distinct = stored.aggregate(n=Count('invoice_number', distinct=True))['n']
+        counter = InvoiceNumberCounter.objects.get(period=self.options['period'])
+
+        self.stdout.write(self.style.SUCCESS(
+            f"{self.options['mode']} mode, {self.options['workers']} workers: "
+            f"{attempted:,} invoices in {elapsed:.1f}s ({attempted / max(elapsed, 0.001):,.0f}/s)"
+        ))
+        self.stdout.write(f"  Stored:          {stored.count():,}")
+        self.stdout.write(f"  Distinct numbers: {distinct:,}")
+        self.stdout.write(f"  Collisions:      {collisions}")
+        self.stdout.write(f"  Numbers reserved: {counter.last_value:,} (unused block tails: {counter.last_value - distinct:,})")
+
+        if collisions or distinct != attempted:
+            raise CommandError('Invoice number collisions detected')
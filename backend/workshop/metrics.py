@@ -0,0 +1,73 @@
+# workshop/metrics.py
+"""
+Prometheus metrics for the backend, exported on /metrics.
+
+Under gunicorn each worker is a separate process, so PROMETHEUS_MULTIPROC_DIR must
+point at a directory shared by all workers (see gunicorn.conf.py). Every worker then
+writes its samples to mmap files there and /metrics aggregates them on scrape.
+"""
+import os
+import time
+from contextlib import contextmanager
+
+from prometheus_client import (
+    CONTENT_TYPE_LATEST, REGISTRY, CollectorRegistry, Counter, Histogram, generate_latest, multiprocess,
+)
+
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+REQUEST_LATENCY = Histogram(
+    'workshop_http_request_duration_seconds',
+    'Request latency by view',
+    ['method', 'view', 'status'],
+    buckets=LATENCY_BUCKETS,
+)
+REQUEST_DB_QUERIES = Histogram(
+    'workshop_http_request_db_queries',
+    'SQL statements executed per request',
+    ['view'],
+    buckets=QUERY_COUNT_BUCKETS,
+)
+REQUEST_DB_TIME = Histogram(
+    'workshop_http_request_db_duration_seconds',
+    'Time spent in the database per request',
+    ['view'],
+    buckets=LATENCY_BUCKETS,
+)
+ANALYTICS_CACHE = Counter(
+    'workshop_analytics_cache_requests_total',
+    'AnalyticsService cache lookups',
+    ['report', 'result'],
+)
+STOCK_LOCK_WAIT = Histogram(
+    'workshop_stock_lock_wait_seconds',
+    'Time spent waiting for the product variant row lock when writing the stock ledger',
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+SLOT_CONFLICTS = Counter(
+    'workshop_slot_reservation_conflicts_total',
+    'Bookings rejected or not reserved because the day had no free slot',
+    ['reason'],
+)
+
+
+@contextmanager
+def observe_lock_wait(histogram=STOCK_LOCK_WAIT):
+    """Time the block (a SELECT ... FOR UPDATE) into `histogram`"""
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        histogram.observe(time.perf_counter() - started)
+
+
+def render():
+    """Return (body, content_type) for a scrape, aggregating worker files in multiprocess mode"""
+    if os.environ.get('PROMETHEUS_MULTIPROC_DIR'):
+        registry = CollectorRegistry()
+        multiprocess.MultiProcessCollector(registry)
+    else:
+        registry = REGISTRY
+    return generate_latest(registry), CONTENT_TYPE_LATEST
@@ -0,0 +1,97 @@
+# workshop/middleware/compression_middleware.py
+import re
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.utils.cache import patch_vary_headers
+from django.utils.text import compress_string
+
+try:
+    import brotli
+except ImportError:  # brotli is optional; gzip is always available
+    brotli = None
+
+
+_ACCEPT_ENCODING_ITEM = re.compile(r'\s*([a-z*]+)\s*(?:;\s*q\s*=\s*([0-9.]+))?', re.IGNORECASE)
+
+COMPRESSIBLE_TYPES = ('application/json', 'text/', 'application/javascript', 'image/svg+xml')
+
+
+def accepted_encodings(header):
+    """Encodings the client accepts (q > 0) from an Accept-Encoding header"""
+    accepted = set()
+    for item in header.split(','):
+        match = _ACCEPT_ENCODING_ITEM.match(item)
+        if not match:
+            continue
+        encoding, quality = match.group(1).lower(), match.group(2)
+        try:
+            if quality is not None and float(quality) <= 0:
+                continue
+        except ValueError:
+            continue
+        accepted.add(encoding)
+    return accepted
+
+
+def has_credentials(request):
+    """Whether the request carries cookies or an Authorization header"""
+    return bool(request.COOKIES) or 'Authorization' in request.headers
+
+
+class CompressionMiddleware:
+    """
+    Compresses buffered responses above COMPRESSION_MIN_SIZE bytes, preferring brotli
+    over gzip when both the client and the server support it.
+
+    A response to a request with credentials may reflect secrets next to attacker-chosen
+    input, which BREACH exploits through the compressed length. Those responses always get
+    gzip with a random-length filename field, the padding Django's GZipMiddleware uses.
+
+    Streaming responses (SSE event stream, CSV exports) are passed through untouched,
+    so events are not held back in a compressor buffer.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'COMPRESSION_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.min_size = getattr(settings, 'COMPRESSION_MIN_SIZE', 1024)
+        self.brotli_quality = getattr(settings, 'COMPRESSION_BROTLI_QUALITY', 4)
+        self.max_random_bytes = getattr(settings, 'COMPRESSION_MAX_RANDOM_BYTES', 100)
+
+    def __call__(self, request):
+        response = self.get_response(request)
+
+        if response.streaming or response.has_header('Content-Encoding'):
+            return response
+        if not response.get('Content-Type', '').startswith(COMPRESSIBLE_TYPES):
+            return response
+
+        # Compressed or not, the body depends on the request's Accept-Encoding
+        patch_vary_headers(response, ('Accept-Encoding',))
+
+        if len(response.content) < self.min_size:
+            return response
+
+        accepted = accepted_encodings(request.headers.get('Accept-Encoding', ''))
+        if brotli is not None and 'br' in accepted and not has_credentials(request):
+            compressed, encoding = brotli.compress(response.content, quality=self.brotli_quality), 'br'
+        elif 'gzip' in accepted:
+            compressed = compress_string(response.content, max_random_bytes=self.max_random_bytes)
+            encoding = 'gzip'
+        else:
+            return response
+
+        if len(compressed) >= len(response.content):
+            return response
+
+        response.content = compressed
+        response['Content-Length'] = str(len(compressed))
+        response['Content-Encoding'] = encoding
+
+        # The compressed body is no longer byte-identical to the one a strong ETag describes
+        etag = response.get('ETag')
+        if etag and etag.startswith('"'):
+            response['ETag'] = 'W/' + etag
+        return response
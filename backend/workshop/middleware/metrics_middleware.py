@@ -0,0 +1,60 @@
+# workshop/middleware/metrics_middleware.py
+import time
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+from workshop import metrics
+
+
+class QueryCounter:
+    """Minimal execute_wrapper: statement count and total time only"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.count += 1
+            self.duration += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    Records per-view latency, DB query count and DB time into the Prometheus metrics.
+
+    Views are labelled by URL route (e.g. `bookings/<pk>/detail/`) rather than path,
+    so label cardinality stays bounded.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'METRICS_ENABLED', True):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(counter))
+            response = self.get_response(request)
+        elapsed = time.perf_counter() - started
+
+        match = getattr(request, 'resolver_match', None)
+        if match and match.url_name == 'metrics':
+            return response
+        view = match.route if match else '<unmatched>'
+
+        metrics.REQUEST_LATENCY.labels(
+            request.method, view, f"{response.status_code // 100}xx"
+        ).observe(elapsed)
+        metrics.REQUEST_DB_QUERIES.labels(view).observe(counter.count)
+        metrics.REQUEST_DB_TIME.labels(view).observe(counter.duration)
+        return response
@@ -0,0 +1,32 @@
+# workshop/middleware/request_id_middleware.py
+import re
+import uuid
+
+from workshop.logging_utils import request_id_var
+
+# Accept ids from the proxy (nginx $request_id) only if they look sane
+_VALID_REQUEST_ID = re.compile(r'^[A-Za-z0-9._-]{1,64}$')
+
+
+class RequestIdMiddleware:
+    """
+    Tags each request with an id for log correlation.
+    Reuses an incoming X-Request-ID when valid and echoes it on the response.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        incoming = request.headers.get('X-Request-ID', '')
+        request_id = incoming if _VALID_REQUEST_ID.match(incoming) else uuid.uuid4().hex
+        request.request_id = request_id
+
+        token = request_id_var.set(request_id)
+        try:
+            response = self.get_response(request)
+        finally:
+            request_id_var.reset(token)
+
+        response['X-Request-ID'] = request_id
+        return response
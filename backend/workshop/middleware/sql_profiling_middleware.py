@@ -0,0 +1,152 @@
+# workshop/middleware/sql_profiling_middleware.py
+import re
+import time
+import random
+import hashlib
+import logging
+from contextlib import ExitStack
+
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connections
+
+logger = logging.getLogger(__name__)
+
+
+_IN_LIST = re.compile(r'\bIN\s*\((?:\s*%s\s*,)*\s*%s\s*\)', re.IGNORECASE)
+_VALUES_LIST = re.compile(r'VALUES\s*(\((?:[^()]*)\))(?:\s*,\s*\((?:[^()]*)\))+', re.IGNORECASE)
+_LITERALS = re.compile(r"'(?:[^']|'')*'|\b\d+(?:\.\d+)?\b")
+_WHITESPACE = re.compile(r'\s+')
+
+
+def fingerprint(sql):
+    """
+    Normalise a statement so queries differing only in parameters compare equal.
+    Django passes parameters separately, so this mostly folds IN/VALUES lists and inlined literals.
+    """
+    normalized = _IN_LIST.sub('IN (...)', sql)
+    normalized = _VALUES_LIST.sub(r'VALUES \1, ...', normalized)
+    normalized = _LITERALS.sub('?', normalized)
+    return _WHITESPACE.sub(' ', normalized).strip()
+
+
+class QueryRecorder:
+    """connection.execute_wrapper callback collecting timing per statement"""
+
+    def __init__(self):
+        self.count = 0
+        self.duration = 0.0
+        self.statements = []
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            elapsed = time.perf_counter() - started
+            self.count += 1
+            self.duration += elapsed
+            self.statements.append((sql, elapsed))
+
+    def duplicates(self, threshold):
+        """Fingerprints executed at least `threshold` times: the usual N+1 signature"""
+        groups = {}
+        for sql, elapsed in self.statements:
+            key = fingerprint(sql)
+            count, total = groups.get(key, (0, 0.0))
+            groups[key] = (count + 1, total + elapsed)
+        return sorted(
+            (
+                {
+                    'fingerprint': hashlib.md5(key.encode('utf-8')).hexdigest()[:12],
+                    'count': count,
+                    'total_ms': round(total * 1000, 2),
+                    'sql': key[:500],
+                }
+                for key, (count, total) in groups.items() if count >= threshold
+            ),
+            key=lambda group: group['count'],
+            reverse=True,
+        )
+
+    def slowest(self, limit):
+        return [
+            {'ms': round(elapsed * 1000, 2), 'sql': sql[:500]}
+            for sql, elapsed in sorted(self.statements, key=lambda item: item[1], reverse=True)[:limit]
+        ]
+
+
+class SQLProfilingMiddleware:
+    """
+    Opt-in per-request SQL profiler.
+
+    For a sampled fraction of requests it records query count, total database time,
+    duplicate statement fingerprints (N+1 candidates) and the slowest statements,
+    then reports them in a `Server-Timing` header and a structured log line.
+
+    When SQL_PROFILING_ENABLED is false Django drops the middleware at startup,
+    so it costs nothing. Unsampled requests pay for one random() call.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, 'SQL_PROFILING_ENABLED', False):
+            raise MiddlewareNotUsed
+
+        self.get_response = get_response
+        self.sample_rate = getattr(settings, 'SQL_PROFILING_SAMPLE_RATE', 1.0)
+        self.slow_query_ms = getattr(settings, 'SQL_PROFILING_SLOW_QUERY_MS', 100)
+        self.duplicate_threshold = getattr(settings, 'SQL_PROFILING_DUPLICATE_THRESHOLD', 3)
+        self.top_n = getattr(settings, 'SQL_PROFILING_TOP_N', 5)
+        self.server_timing = getattr(settings, 'SQL_PROFILING_SERVER_TIMING', True)
+
+    def __call__(self, request):
+        if self.sample_rate < 1.0 and random.random() >= self.sample_rate:
+            return self.get_response(request)
+
+        recorder = QueryRecorder()
+        started = time.perf_counter()
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(recorder))
+            response = self.get_response(request)
+        total = time.perf_counter() - started
+
+        # Streaming bodies run their queries after this point and are not counted
+        self.report(request, response, recorder, total)
+        return response
+
+    def report(self, request, response, recorder, total):
+        db_ms = recorder.duration * 1000
+        total_ms = total * 1000
+
+        if self.server_timing:
+            timing = (
+                f'db;dur={db_ms:.1f};desc="{recorder.count} queries", '
+                f'app;dur={max(total_ms - db_ms, 0):.1f}'
+            )
+            existing = response.get('Server-Timing')
+            response['Server-Timing'] = f"{existing}, {timing}" if existing else timing
+
+        duplicates = recorder.duplicates(self.duplicate_threshold)
+        slowest = recorder.slowest(self.top_n)
+        slow = [statement for statement in slowest if statement['ms'] >= self.slow_query_ms]
+
+        profile = {
+            'method': request.method,
+            'path': request.path,
+            'status': response.status_code,
+            'duration_ms': round(total_ms, 2),
+            'db_ms': round(db_ms, 2),
+            'query_count': recorder.count,
+            'duplicate_queries': duplicates,
+            'slowest_queries': slowest,
+        }
+        message = "%s %s %s %.1fms db=%.1fms queries=%d"
+        args = (request.method, request.path, response.status_code, total_ms, db_ms, recorder.count)
+        if duplicates or slow:
+            logger.warning(
+                message + " duplicates=%d slow=%d", *args, len(duplicates), len(slow),
+                extra={'sql_profile': profile}
+            )
+        else:
+            logger.info(message, *args, extra={'sql_profile': profile})
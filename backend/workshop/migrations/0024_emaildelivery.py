@@ -0,0 +1,34 @@
+# Generated by Django 5.2.4 on 2026-10-19 10:00
+
+import django.db.models.deletion
+import uuid
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0023_backgroundjob'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='EmailDelivery',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('batch_id', models.UUIDField(db_index=True, help_text='Groups all deliveries of one dispatch')),
+                ('email', models.EmailField(max_length=254)),
+                ('subject', models.CharField(max_length=255)),
+                ('status', models.CharField(choices=[('sent', 'Sent'), ('failed', 'Failed')], max_length=20)),
+                ('error', models.TextField(blank=True, null=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('user', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='email_deliveries', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'email_delivery',
+                'ordering': ['-created_at'],
+                'indexes': [models.Index(fields=['batch_id', 'status'], name='email_delivery_batch_idx')],
+            },
+        ),
+    ]
@@ -0,0 +1,61 @@
+# Generated by Django 5.2.4 on 2026-10-19 11:00
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+def backfill_counters(apps, schema_editor):
+    Notification = apps.get_model('workshop', 'Notification')
+    NotificationCounter = apps.get_model('workshop', 'NotificationCounter')
+
+    rows = (
+        Notification.objects.filter(user__isnull=False)
+        .values('user_id', 'notification_type')
+        .annotate(
+            total=models.Count('id'),
+            unread=models.Count('id', filter=models.Q(is_read=False)),
+            urgent=models.Count('id', filter=models.Q(priority='urgent')),
+        )
+        .order_by()
+    )
+    NotificationCounter.objects.bulk_create([
+        NotificationCounter(
+            user_id=row['user_id'],
+            notification_type=row['notification_type'],
+            total_count=row['total'],
+            unread_count=row['unread'],
+            urgent_count=row['urgent'],
+        )
+        for row in rows
+    ], batch_size=1000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0024_emaildelivery'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='notification',
+            index=models.Index(fields=['user', 'is_read', 'created_at'], name='notification_inbox_idx'),
+        ),
+        migrations.CreateModel(
+            name='NotificationCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('notification_type', models.CharField(choices=[('booking', 'Booking'), ('payment', 'Payment'), ('system', 'System'), ('reminder', 'Reminder'), ('alert', 'Alert')], max_length=20)),
+                ('total_count', models.IntegerField(default=0)),
+                ('unread_count', models.IntegerField(default=0)),
+                ('urgent_count', models.IntegerField(default=0)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='notification_counters', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'notification_counter',
+                'constraints': [models.UniqueConstraint(fields=('user', 'notification_type'), name='unique_notification_counter')],
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
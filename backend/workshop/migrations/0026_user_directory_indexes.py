@@ -0,0 +1,27 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:00
+
+import django.contrib.postgres.indexes
+import django.db.models.functions.text
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0025_notification_inbox'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('role', 'customer')), fields=['name', 'id'], name='user_customer_dir_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(django.contrib.postgres.indexes.OpClass(django.db.models.functions.text.Upper('name'), name='text_pattern_ops'), condition=models.Q(('role', 'customer')), name='user_name_prefix_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='user',
+            index=models.Index(condition=models.Q(('role', 'customer')), fields=['phone_number'], name='user_phone_prefix_idx', opclasses=['varchar_pattern_ops']),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-19 12:30
+
+import django.contrib.postgres.indexes
+from django.contrib.postgres.operations import TrigramExtension
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0026_user_directory_indexes'),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddIndex(
+            model_name='user',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['name'], name='user_name_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+        migrations.AddIndex(
+            model_name='car',
+            index=django.contrib.postgres.indexes.GinIndex(fields=['license_plate'], name='car_plate_trgm_idx', opclasses=['gin_trgm_ops']),
+        ),
+    ]
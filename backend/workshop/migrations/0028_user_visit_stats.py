@@ -0,0 +1,44 @@
+# Generated by Django 5.2.4 on 2026-10-19 13:00
+
+from django.db import migrations, models
+from django.db.models import Count, Max, Min, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
+
+
+def backfill_visit_stats(apps, schema_editor):
+    User = apps.get_model('workshop', 'User')
+    Invoice = apps.get_model('workshop', 'Invoice')
+
+    # A visit is an invoice that was not cancelled
+    invoices = Invoice.objects.filter(~Q(status='cancelled'), user=OuterRef('pk')).order_by().values('user')
+    User.objects.filter(role='customer').update(
+        visit_count=Coalesce(Subquery(invoices.annotate(c=Count('id')).values('c')), 0),
+        first_visit_at=Subquery(invoices.annotate(first=Min('created_at')).values('first')),
+        last_visit_at=Subquery(invoices.annotate(last=Max('created_at')).values('last')),
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0027_autocomplete_trigram'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='user',
+            name='visit_count',
+            field=models.PositiveIntegerField(default=0),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='first_visit_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='user',
+            name='last_visit_at',
+            field=models.DateTimeField(blank=True, null=True),
+        ),
+        migrations.RunPython(backfill_visit_stats, migrations.RunPython.noop),
+    ]
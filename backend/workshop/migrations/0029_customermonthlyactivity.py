@@ -0,0 +1,64 @@
+# Generated by Django 5.2.4 on 2026-10-19 13:30
+
+import django.db.models.deletion
+from decimal import Decimal
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count, DateField, Q, Sum, Value
+from django.db.models.functions import Coalesce, TruncMonth
+
+
+def backfill_activity(apps, schema_editor):
+    Invoice = apps.get_model('workshop', 'Invoice')
+    CustomerMonthlyActivity = apps.get_model('workshop', 'CustomerMonthlyActivity')
+
+    rows = (
+        Invoice.objects.order_by()
+        .values(
+            'user_id',
+            month=TruncMonth('created_at', output_field=DateField()),
+            cohort=TruncMonth(Coalesce('user__first_visit_at', 'user__date_joined'), output_field=DateField()),
+        )
+        .annotate(
+            invoice_count=Count('id', filter=~Q(status='cancelled')),
+            revenue=Coalesce(Sum('total_amount', filter=Q(status='paid')), Value(Decimal('0'))),
+        )
+    )
+    CustomerMonthlyActivity.objects.bulk_create([
+        CustomerMonthlyActivity(
+            user_id=row['user_id'],
+            month=row['month'],
+            cohort_month=row['cohort'],
+            invoice_count=row['invoice_count'],
+            revenue=row['revenue'],
+        )
+        for row in rows.iterator(chunk_size=5000)
+        if row['invoice_count'] or row['revenue']
+    ], batch_size=5000)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0028_user_visit_stats'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='CustomerMonthlyActivity',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('month', models.DateField()),
+                ('cohort_month', models.DateField()),
+                ('invoice_count', models.PositiveIntegerField(default=0)),
+                ('revenue', models.DecimalField(decimal_places=2, default=0, max_digits=12)),
+                ('user', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='monthly_activity', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'customer_monthly_activity',
+                'indexes': [models.Index(fields=['cohort_month', 'month'], name='cust_activity_cohort_idx')],
+                'constraints': [models.UniqueConstraint(fields=('user', 'month'), name='unique_customer_month')],
+            },
+        ),
+        migrations.RunPython(backfill_activity, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,48 @@
+# Generated by Django 5.2.4 on 2026-10-19 14:30
+
+import re
+
+from django.db import migrations, models
+
+
+SKU_SUFFIX = re.compile(r'^(.+)-(\d+)$')
+
+
+def backfill_counters(apps, schema_editor):
+    """Start every prefix's counter after the highest suffix already in use"""
+    ProductVariant = apps.get_model('workshop', 'ProductVariant')
+    SkuCounter = apps.get_model('workshop', 'SkuCounter')
+
+    highest = {}
+    for sku in ProductVariant.objects.values_list('sku', flat=True).iterator(chunk_size=5000):
+        match = SKU_SUFFIX.match(sku)
+        if match and len(match.group(1)) <= 45:
+            prefix, value = match.group(1), int(match.group(2))
+            highest[prefix] = max(highest.get(prefix, 0), value)
+
+    SkuCounter.objects.bulk_create(
+        [SkuCounter(prefix=prefix, last_value=value) for prefix, value in highest.items()],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0030_invoicenumbercounter'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='SkuCounter',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('prefix', models.CharField(max_length=45, unique=True)),
+                ('last_value', models.PositiveIntegerField(default=0)),
+            ],
+            options={
+                'db_table': 'sku_counter',
+            },
+        ),
+        migrations.RunPython(backfill_counters, migrations.RunPython.noop),
+    ]
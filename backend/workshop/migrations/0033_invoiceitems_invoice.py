@@ -0,0 +1,24 @@
+# Generated by Django 5.2.4 on 2026-10-19 15:30
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0032_product_catalog_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='invoiceitems',
+            name='booking_service',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='workshop.bookingservice'),
+        ),
+        migrations.AddField(
+            model_name='invoiceitems',
+            name='invoice',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.CASCADE, related_name='items', to='workshop.invoice'),
+        ),
+    ]
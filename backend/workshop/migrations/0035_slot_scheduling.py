@@ -0,0 +1,61 @@
+# Generated by Django 5.2.4 on 2026-10-19 16:30
+
+import uuid
+
+import django.core.validators
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0034_holiday'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='service',
+            name='duration_minutes',
+            field=models.PositiveIntegerField(default=60, validators=[django.core.validators.MinValueValidator(5)]),
+        ),
+        migrations.CreateModel(
+            name='WorkshopResource',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('name', models.CharField(max_length=50)),
+                ('kind', models.CharField(choices=[('bay', 'Bay'), ('technician', 'Technician')], max_length=20)),
+                ('is_active', models.BooleanField(default=True)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('employee', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='resources', to='workshop.employee')),
+            ],
+            options={
+                'db_table': 'workshop_resource',
+                'ordering': ['kind', 'name'],
+            },
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='start_time',
+            field=models.TimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='end_time',
+            field=models.TimeField(blank=True, null=True),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='bay',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='bay_bookings', to='workshop.workshopresource'),
+        ),
+        migrations.AddField(
+            model_name='booking',
+            name='technician',
+            field=models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='technician_bookings', to='workshop.workshopresource'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['daily_availability', 'start_time'], name='booking_day_start_idx'),
+        ),
+    ]
@@ -0,0 +1,77 @@
+# Generated by Django 5.2.4 on 2026-10-19 17:00
+
+import uuid
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.conf import settings
+from django.db import migrations, models
+
+
+STATUS_CHOICES = [
+    ('pending', 'Pending'),
+    ('confirmed', 'Confirmed'),
+    ('in_progress', 'In Progress'),
+    ('completed', 'Completed'),
+    ('canceled', 'Canceled'),
+]
+
+
+def backfill_open_bookings(apps, schema_editor):
+    """
+    Earlier history was never recorded; open bookings get one event in their current status,
+    dated at creation, so the SLA report sees them. Closed bookings are left without events.
+    """
+    BookingService = apps.get_model('workshop', 'BookingService')
+    BookingEvent = apps.get_model('workshop', 'BookingEvent')
+
+    rows = (
+        BookingService.objects.filter(booking__isnull=False, status__in=['pending', 'confirmed', 'in_progress'])
+        .values_list('booking_id', 'status', 'booking__created_at', 'booking__created_by_id')
+        .iterator(chunk_size=2000)
+    )
+    batch = []
+    for booking_id, status, created_at, created_by_id in rows:
+        batch.append(BookingEvent(
+            booking_id=booking_id,
+            to_status=status,
+            created_at=created_at,
+            created_by_id=created_by_id,
+            notes='Recorded when the booking event log was introduced',
+        ))
+        if len(batch) >= 2000:
+            BookingEvent.objects.bulk_create(batch)
+            batch = []
+    BookingEvent.objects.bulk_create(batch)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0035_slot_scheduling'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingEvent',
+            fields=[
+                ('id', models.UUIDField(default=uuid.uuid4, editable=False, primary_key=True, serialize=False)),
+                ('from_status', models.CharField(blank=True, choices=STATUS_CHOICES, max_length=20)),
+                ('to_status', models.CharField(choices=STATUS_CHOICES, max_length=20)),
+                ('created_at', models.DateTimeField(db_index=True, default=django.utils.timezone.now)),
+                ('previous_at', models.DateTimeField(blank=True, null=True)),
+                ('notes', models.TextField(blank=True)),
+                ('booking', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, related_name='events', to='workshop.booking')),
+                ('created_by', models.ForeignKey(blank=True, null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='booking_events', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'db_table': 'booking_event',
+                'ordering': ['created_at'],
+                'indexes': [
+                    models.Index(fields=['booking', 'created_at'], name='booking_event_booking_idx'),
+                    models.Index(fields=['to_status', 'created_at'], name='booking_event_status_idx'),
+                ],
+            },
+        ),
+        migrations.RunPython(backfill_open_bookings, migrations.RunPython.noop),
+    ]
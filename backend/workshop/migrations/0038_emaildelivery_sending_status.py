@@ -0,0 +1,18 @@
+# Generated by Django 5.2.4 on 2026-10-20 10:00
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('workshop', '0037_cache_table'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='emaildelivery',
+            name='status',
+            field=models.CharField(choices=[('sending', 'Sending'), ('sent', 'Sent'), ('failed', 'Failed')], max_length=20),
+        ),
+    ]
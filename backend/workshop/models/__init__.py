@@ -8,12 +8,21 @@ from .invoice import Invoice
 from .invoice_items import InvoiceItems
 from .notification import Notification
 from .daily_availability import DailyAvailability
+from .employee import Employee
+from .workshop_resource import WorkshopResource
 from .booking import Booking
 from .service import Service, ServiceItem
 from .booking_service import BookingService
 from .payment import Payment
 from .settings import BusinessSettings
-from .employee import Employee
 from .payslip import PaySlip
 from .expenses import Expense
-from .attendance import Attendance
\ No newline at end of file
+from .attendance import Attendance
+from .background_job import BackgroundJob
+from .email_delivery import EmailDelivery
+from .notification_counter import NotificationCounter
+from .customer_monthly_activity import CustomerMonthlyActivity
+from .invoice_number_counter import InvoiceNumberCounter
+from .sku_counter import SkuCounter
+from .holiday import Holiday
+from .booking_event import BookingEvent
\ No newline at end of file
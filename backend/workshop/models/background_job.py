@@ -0,0 +1,46 @@
+# workshop/models/background_job.py
+import uuid
+from django.db import models
+from django.utils import timezone
+
+
+class BackgroundJob(models.Model):
+    """
+    Database-backed job queue entry.
+    Enqueued by the request path, executed by the `run_jobs` worker command.
+    """
+
+    class Status(models.TextChoices):
+        PENDING = 'pending', 'Pending'
+        RUNNING = 'running', 'Running'
+        SUCCEEDED = 'succeeded', 'Succeeded'
+        DEAD = 'dead', 'Dead'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    task = models.CharField(max_length=100, help_text="Registered task name")
+    payload = models.JSONField(default=dict, blank=True)
+    status = models.CharField(max_length=20, choices=Status.choices, default=Status.PENDING)
+
+    # Retry bookkeeping
+    attempts = models.PositiveIntegerField(default=0)
+    max_attempts = models.PositiveIntegerField(default=5)
+    run_at = models.DateTimeField(default=timezone.now, help_text="Earliest time the job may run")
+    last_error = models.TextField(blank=True, null=True)
+
+    # Worker lease
+    locked_by = models.CharField(max_length=100, blank=True, null=True)
+    locked_at = models.DateTimeField(null=True, blank=True)
+
+    created_at = models.DateTimeField(auto_now_add=True)
+    completed_at = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        db_table = 'background_job'
+        ordering = ['run_at']
+        indexes = [
+            models.Index(fields=['status', 'run_at'], name='background_job_status_run_idx'),
+            models.Index(fields=['task', 'status'], name='background_job_task_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.task} ({self.status}, attempt {self.attempts}/{self.max_attempts})"
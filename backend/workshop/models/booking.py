@@ -4,6 +4,7 @@ from django.core.validators import MinValueValidator, MaxValueValidator
 
 from workshop.models import Car, User, Invoice
 from workshop.models.daily_availability import DailyAvailability
+from workshop.models.workshop_resource import WorkshopResource
 
 class Booking(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -13,6 +14,12 @@ class Booking(models.Model):
     invoice = models.OneToOneField(Invoice, on_delete=models.CASCADE, null=True, blank=True, related_name='bookings')
     daily_availability = models.ForeignKey(DailyAvailability, on_delete=models.CASCADE, null=False, blank=False, related_name='bookings')
     created_by = models.ForeignKey(User, on_delete=models.CASCADE, null=False, blank=False, related_name='created_bookings')
+
+    # Time slot on the booked day; bookings made without one only hold a whole-day slot
+    start_time = models.TimeField(null=True, blank=True)
+    end_time = models.TimeField(null=True, blank=True)
+    bay = models.ForeignKey(WorkshopResource, on_delete=models.SET_NULL, null=True, blank=True, related_name='bay_bookings')
+    technician = models.ForeignKey(WorkshopResource, on_delete=models.SET_NULL, null=True, blank=True, related_name='technician_bookings')
     
     # Additional Information
     special_instructions = models.TextField(null=True, blank=True)
@@ -29,6 +36,7 @@ class Booking(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['car']),
+            models.Index(fields=['daily_availability', 'start_time'], name='booking_day_start_idx'),
         ]
 
     def __str__(self):
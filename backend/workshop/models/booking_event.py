@@ -0,0 +1,49 @@
+# workshop/models/booking_event.py
+import uuid
+from django.db import models
+from django.conf import settings
+from django.utils import timezone
+
+from .booking import Booking
+from .booking_service import BookingService
+
+
+class BookingEvent(models.Model):
+    """
+    Append-only log of booking status changes, written in the same transaction as the change
+    (see BookingTransitionService). The event that opens a booking has an empty `from_status`.
+    `previous_at` is when the booking entered `from_status`, copied from the previous event so
+    time-in-state is a plain aggregate rather than a window over each booking's history.
+    """
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    booking = models.ForeignKey(Booking, on_delete=models.CASCADE, related_name='events')
+    from_status = models.CharField(max_length=20, choices=BookingService.Status.choices, blank=True)
+    to_status = models.CharField(max_length=20, choices=BookingService.Status.choices)
+    created_at = models.DateTimeField(default=timezone.now, db_index=True)
+    previous_at = models.DateTimeField(null=True, blank=True)
+    created_by = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        related_name='booking_events'
+    )
+    notes = models.TextField(blank=True)
+
+    class Meta:
+        db_table = 'booking_event'
+        ordering = ['created_at']
+        indexes = [
+            # History of one booking, and the "no later event" check behind the SLA report
+            models.Index(fields=['booking', 'created_at'], name='booking_event_booking_idx'),
+            models.Index(fields=['to_status', 'created_at'], name='booking_event_status_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.booking_id}: {self.from_status or '-'} -> {self.to_status}"
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Booking events are append-only')
+        super().save(*args, **kwargs)
@@ -1,6 +1,7 @@
 import uuid
 
 from django.db import models
+from django.contrib.postgres.indexes import GinIndex
 
 from . import User
 
@@ -19,4 +20,8 @@ class Car(models.Model):
     customer = models.ForeignKey(User, on_delete=models.CASCADE, related_name='cars')
 
     class Meta:
-        db_table = 'car'
\ No newline at end of file
+        db_table = 'car'
+        indexes = [
+            # Fuzzy autocomplete fallback and icontains plate search
+            GinIndex(fields=['license_plate'], opclasses=['gin_trgm_ops'], name='car_plate_trgm_idx'),
+        ]
\ No newline at end of file
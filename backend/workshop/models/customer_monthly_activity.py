@@ -0,0 +1,35 @@
+# workshop/models/customer_monthly_activity.py
+from django.db import models
+from django.conf import settings
+
+
+class CustomerMonthlyActivity(models.Model):
+    """
+    One row per customer per month they were invoiced: the fact table behind the cohort
+    and lifetime value reports. Maintained from invoice signals, rebuilt with
+    `manage.py rebuild_customer_activity`.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='monthly_activity'
+    )
+    month = models.DateField()
+    # Month of the customer's first invoice (or of date_joined), copied here so the
+    # cohort report never joins back to the user table
+    cohort_month = models.DateField()
+    invoice_count = models.PositiveIntegerField(default=0)
+    revenue = models.DecimalField(max_digits=12, decimal_places=2, default=0)
+
+    class Meta:
+        db_table = 'customer_monthly_activity'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'month'], name='unique_customer_month'),
+        ]
+        indexes = [
+            models.Index(fields=['cohort_month', 'month'], name='cust_activity_cohort_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.month:%Y-%m}: {self.invoice_count} invoices"
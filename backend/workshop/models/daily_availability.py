@@ -2,6 +2,7 @@
 
 import uuid
 from django.db import models
+from django.db.models import F
 from django.core.validators import MinValueValidator
 from datetime import date, timedelta
 
@@ -27,49 +28,34 @@ class DailyAvailability(models.Model):
     
     def book_slot(self):
         """Reduce available slots by 1 when booking"""
-        if self.available_slots > 0:
-            self.available_slots -= 1
-            self.save(update_fields=['available_slots'])
-            return True
-        return False
+        # Conditional UPDATE so two concurrent bookings cannot both take the last slot
+        updated = DailyAvailability.objects.filter(pk=self.pk, available_slots__gt=0).update(
+            available_slots=F('available_slots') - 1
+        )
+        self.refresh_from_db(fields=['total_slots', 'available_slots'])
+        return bool(updated)
     
     def cancel_slot(self):
         """Increase available slots by 1 when cancelling"""
-        if self.available_slots < self.total_slots:
-            self.available_slots += 1
-            self.save(update_fields=['available_slots'])
-            return True
-        return False
+        updated = DailyAvailability.objects.filter(pk=self.pk, available_slots__lt=F('total_slots')).update(
+            available_slots=F('available_slots') + 1
+        )
+        self.refresh_from_db(fields=['total_slots', 'available_slots'])
+        return bool(updated)
     
     @classmethod
-    def create_daily_availability(cls, start_date, days=14, total_slots=7):
+    def create_daily_availability(cls, start_date, days=14):
         """
-        Create daily availability for the next X days
+        Create daily availability for the next X days, with capacity planned from
+        working hours, holidays and staffing (see CapacityPlanner)
         
         Args:
             start_date: Starting date
             days: Number of days to create (default 14)
-            total_slots: Number of slots per day (default 7)
         """
-        created_dates = []
-        current_date = start_date
-        
-        for _ in range(days):
-            availability, created = cls.objects.get_or_create(
-                date=current_date,
-                defaults={
-                    'total_slots': total_slots,
-                    'available_slots': total_slots,
-                    'is_available': True
-                }
-            )
-            
-            if created:
-                created_dates.append(current_date)
-            
-            current_date += timedelta(days=1)
-        
-        return created_dates
+        from workshop.services.capacity_planner_service import CapacityPlanner
+
+        return CapacityPlanner.ensure(start_date, days)
     
     @classmethod
     def get_available_dates(cls, start_date=None, days=14):
@@ -0,0 +1,40 @@
+# workshop/models/email_delivery.py
+import uuid
+from django.db import models
+from django.conf import settings
+
+
+class EmailDelivery(models.Model):
+    """
+    Per-recipient delivery record for bulk mail sent through BulkMailDispatcher
+    """
+
+    class Status(models.TextChoices):
+        SENDING = 'sending', 'Sending'
+        SENT = 'sent', 'Sent'
+        FAILED = 'failed', 'Failed'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    batch_id = models.UUIDField(db_index=True, help_text="Groups all deliveries of one dispatch")
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.SET_NULL,
+        related_name='email_deliveries',
+        null=True,
+        blank=True
+    )
+    email = models.EmailField()
+    subject = models.CharField(max_length=255)
+    status = models.CharField(max_length=20, choices=Status.choices)
+    error = models.TextField(blank=True, null=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'email_delivery'
+        ordering = ['-created_at']
+        indexes = [
+            models.Index(fields=['batch_id', 'status'], name='email_delivery_batch_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.email} - {self.status}"
@@ -0,0 +1,19 @@
+# workshop/models/holiday.py
+import uuid
+from django.db import models
+
+
+class Holiday(models.Model):
+    """A date the workshop is closed regardless of working hours; the capacity planner gives it no slots"""
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    date = models.DateField(unique=True)
+    name = models.CharField(max_length=100)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'holiday'
+        ordering = ['date']
+
+    def __str__(self):
+        return f"{self.date} - {self.name}"
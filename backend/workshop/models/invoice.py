@@ -1,6 +1,4 @@
 import uuid
-import random
-from django.utils import timezone
 from django.db import models
 
 from workshop.models import User
@@ -29,10 +27,8 @@ class Invoice(models.Model):
 
     def save(self, *args, **kwargs):
         if not self.invoice_number:
-            # Generate invoice number
-            timestamp_suffix = str(int(timezone.now().timestamp()))[-6:]
-            random_num = random.randint(1000, 9999)
-            self.invoice_number = f"DH{timestamp_suffix}-{random_num}"
+            from workshop.services.invoice_number_service import invoice_numbers
+            self.invoice_number = invoice_numbers.next()
             
         super().save(*args, **kwargs)
 
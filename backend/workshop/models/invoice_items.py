@@ -2,6 +2,7 @@ import uuid
 from django.db import models
 from workshop.models.product_variant import ProductVariant
 from workshop.models.booking_service import BookingService
+from workshop.models.invoice import Invoice
 
 class InvoiceItems(models.Model):
     id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
@@ -10,7 +11,9 @@ class InvoiceItems(models.Model):
     total_amount = models.DecimalField(max_digits=10, decimal_places=2, null=True, blank=True)  
 
     # Relationships
-    booking_service = models.ForeignKey(BookingService, on_delete=models.CASCADE, related_name='items')
+    # Items sold during a booking hang off its service; counter sales hang off the invoice directly
+    booking_service = models.ForeignKey(BookingService, on_delete=models.CASCADE, related_name='items', null=True, blank=True)
+    invoice = models.ForeignKey(Invoice, on_delete=models.CASCADE, related_name='items', null=True, blank=True)
     product_variant = models.ForeignKey(ProductVariant, on_delete=models.CASCADE, null=False, blank=False)
 
     class Meta:
@@ -0,0 +1,18 @@
+# workshop/models/invoice_number_counter.py
+from django.db import models
+
+
+class InvoiceNumberCounter(models.Model):
+    """
+    Last invoice number handed out per fiscal period.
+    Only InvoiceNumberAllocator touches it, under a row lock.
+    """
+
+    period = models.CharField(max_length=10, unique=True)
+    last_value = models.BigIntegerField(default=0)
+
+    class Meta:
+        db_table = 'invoice_number_counter'
+
+    def __str__(self):
+        return f"{self.period}: {self.last_value}"
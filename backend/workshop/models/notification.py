@@ -49,13 +49,10 @@ class Notification(models.Model):
     
     class Meta:
         ordering = ['-created_at']
+        indexes = [
+            # Per-user inbox listing and unread filtering
+            models.Index(fields=['user', 'is_read', 'created_at'], name='notification_inbox_idx'),
+        ]
         
     def __str__(self):
         return f"{self.title} - {self.notification_type}"
-    
-    def mark_as_read(self):
-        """Mark notification as read"""
-        if not self.is_read:
-            self.is_read = True
-            self.read_at = timezone.now()
-            self.save()
@@ -0,0 +1,31 @@
+# workshop/models/notification_counter.py
+from django.db import models
+from django.conf import settings
+
+from .notification import Notification
+
+
+class NotificationCounter(models.Model):
+    """
+    Denormalized per-user, per-type notification counts.
+    Maintained by NotificationService so inbox stats never scan the notification table.
+    """
+
+    user = models.ForeignKey(
+        settings.AUTH_USER_MODEL,
+        on_delete=models.CASCADE,
+        related_name='notification_counters'
+    )
+    notification_type = models.CharField(max_length=20, choices=Notification.NOTIFICATION_TYPES)
+    total_count = models.IntegerField(default=0)
+    unread_count = models.IntegerField(default=0)
+    urgent_count = models.IntegerField(default=0)
+
+    class Meta:
+        db_table = 'notification_counter'
+        constraints = [
+            models.UniqueConstraint(fields=['user', 'notification_type'], name='unique_notification_counter'),
+        ]
+
+    def __str__(self):
+        return f"{self.user_id} {self.notification_type}: {self.unread_count}/{self.total_count}"
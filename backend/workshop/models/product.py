@@ -25,6 +25,11 @@ class Product(models.Model):
 
     class Meta:
         db_table = 'product'
+        indexes = [
+            # Catalog listing: keyset order, optionally within one category
+            models.Index(fields=['category', 'name', 'id'], name='product_category_name_idx'),
+            models.Index(fields=['name', 'id'], name='product_name_idx'),
+        ]
 
     def __str__(self):
         return self.name
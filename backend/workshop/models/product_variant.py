@@ -18,11 +18,11 @@ class ProductVariant(models.Model):
         db_table = 'product_variant'
 
     def save(self, *args, **kwargs):
+        from workshop.services.sku_service import SkuAllocator
         if not self.sku:
-            prod = ''.join([w[:3].upper() for w in self.product.name.split()])
-            var = ''.join([w[:3].upper() for w in self.variant_name.split()])
-            count = ProductVariant.objects.filter(product=self.product).count() + 1
-            self.sku = f"{prod}-{var}-{count:03d}"
+            SkuAllocator.assign([self])
+        elif self._state.adding:
+            SkuAllocator.claim([self.sku])
         super().save(*args, **kwargs)
 
     def __str__(self):
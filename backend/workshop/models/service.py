@@ -1,5 +1,6 @@
 import uuid
 from django.db import models
+from django.core.validators import MinValueValidator
 
 class Service(models.Model):
     class Category(models.TextChoices):
@@ -24,6 +25,8 @@ class Service(models.Model):
     description = models.TextField(blank=True)
     category = models.CharField(max_length=50, choices=Category.choices, default=Category.MAINTENANCE)
     price = models.DecimalField(max_digits=10, decimal_places=2)
+    # How long the job occupies a bay and a technician; used by the slot scheduler
+    duration_minutes = models.PositiveIntegerField(default=60, validators=[MinValueValidator(5)])
     is_active = models.BooleanField(default=True)
     created_at = models.DateTimeField(auto_now_add=True)
 
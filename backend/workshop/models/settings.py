@@ -43,7 +43,19 @@ class BusinessSettings(models.Model):
 
     @classmethod
     def get_settings(cls):
-        """Get or create business settings (singleton pattern)"""
+        """Cached business settings (singleton pattern); read-only, use load() to modify"""
+        from workshop.services.business_settings_service import business_settings
+        return business_settings.get()
+
+    @classmethod
+    def get_schedule(cls):
+        """Working hours parsed into a WorkingSchedule"""
+        from workshop.services.business_settings_service import business_settings
+        return business_settings.schedule()
+
+    @classmethod
+    def load(cls):
+        """Get or create business settings from the database"""
         settings, created = cls.objects.get_or_create(
             id=uuid.UUID('00000000-0000-0000-0000-000000000001'),
             defaults={
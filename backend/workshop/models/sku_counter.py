@@ -0,0 +1,18 @@
+# workshop/models/sku_counter.py
+from django.db import models
+
+
+class SkuCounter(models.Model):
+    """
+    Last SKU suffix handed out per SKU prefix (e.g. ENGOIL-SYN).
+    Only SkuAllocator touches it, with a single upsert per allocation.
+    """
+
+    prefix = models.CharField(max_length=45, unique=True)
+    last_value = models.PositiveIntegerField(default=0)
+
+    class Meta:
+        db_table = 'sku_counter'
+
+    def __str__(self):
+        return f"{self.prefix}: {self.last_value}"
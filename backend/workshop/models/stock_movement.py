@@ -3,6 +3,7 @@ from django.db import models
 from django.core.validators import MinValueValidator
 
 from .product_variant import ProductVariant
+from workshop import metrics
 
 
 class StockMovement(models.Model):
@@ -84,7 +85,8 @@ class StockMovement(models.Model):
             
             with transaction.atomic():
                 # Lock the product variant row to prevent concurrent modifications
-                variant = ProductVariant.objects.select_for_update().get(id=self.product_variant.id)
+                with metrics.observe_lock_wait():
+                    variant = ProductVariant.objects.select_for_update().get(id=self.product_variant.id)
                 
                 # Get current quantity from locked product variant
                 self.quantity_before = variant.quantity
@@ -2,6 +2,8 @@ import uuid
 from django.contrib.auth.models import AbstractBaseUser, PermissionsMixin, BaseUserManager
 from phonenumber_field.modelfields import PhoneNumberField
 from django.db import models
+from django.db.models.functions import Upper
+from django.contrib.postgres.indexes import GinIndex, OpClass
 from django.contrib.auth.hashers import make_password, check_password
 
 class UserManager(BaseUserManager):
@@ -43,6 +45,11 @@ class User(AbstractBaseUser, PermissionsMixin):
     is_active = models.BooleanField(default=True)
     is_staff = models.BooleanField(default=False)
 
+    # Denormalized from invoices (see queries/customer_analytics_queries.py)
+    visit_count = models.PositiveIntegerField(default=0)
+    first_visit_at = models.DateTimeField(null=True, blank=True)
+    last_visit_at = models.DateTimeField(null=True, blank=True)
+
     objects = UserManager()
 
     USERNAME_FIELD = 'email'
@@ -66,6 +73,17 @@ class User(AbstractBaseUser, PermissionsMixin):
 
     class Meta:
         db_table = 'user'
+        indexes = [
+            # Customer directory keyset order and typeahead prefix lookups
+            models.Index(fields=['name', 'id'], name='user_customer_dir_idx',
+                         condition=models.Q(role='customer')),
+            models.Index(OpClass(Upper('name'), name='text_pattern_ops'), name='user_name_prefix_idx',
+                         condition=models.Q(role='customer')),
+            models.Index(fields=['phone_number'], opclasses=['varchar_pattern_ops'], name='user_phone_prefix_idx',
+                         condition=models.Q(role='customer')),
+            # Fuzzy autocomplete fallback and icontains name search
+            GinIndex(fields=['name'], opclasses=['gin_trgm_ops'], name='user_name_trgm_idx'),
+        ]
 
     def __str__(self):
         return f"{self.name} ({self.role})"
\ No newline at end of file
@@ -0,0 +1,30 @@
+# workshop/models/workshop_resource.py
+import uuid
+from django.db import models
+
+from workshop.models.employee import Employee
+
+
+class WorkshopResource(models.Model):
+    """
+    A bay or a technician the slot scheduler assigns to timed bookings.
+    A technician linked to an employee is unavailable on days that employee is absent or on leave.
+    """
+
+    class Kind(models.TextChoices):
+        BAY = 'bay', 'Bay'
+        TECHNICIAN = 'technician', 'Technician'
+
+    id = models.UUIDField(primary_key=True, default=uuid.uuid4, editable=False)
+    name = models.CharField(max_length=50)
+    kind = models.CharField(max_length=20, choices=Kind.choices)
+    employee = models.ForeignKey(Employee, on_delete=models.SET_NULL, null=True, blank=True, related_name='resources')
+    is_active = models.BooleanField(default=True)
+    created_at = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        db_table = 'workshop_resource'
+        ordering = ['kind', 'name']
+
+    def __str__(self):
+        return f"{self.name} ({self.kind})"
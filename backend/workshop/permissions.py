@@ -1,6 +1,9 @@
+import logging
 from rest_framework import permissions
 from django.contrib.auth import get_user_model
 
+logger = logging.getLogger(__name__)
+
 User = get_user_model()
 
 
@@ -23,23 +26,17 @@ class IsCustomer(permissions.BasePermission):
     Works with both Customer model instances and User model (role='customer').
     """
     def has_permission(self, request, view):
-        print(f"DEBUG IsCustomer: Checking permission for user: {request.user}")
-        print(f"DEBUG IsCustomer: User type: {type(request.user)}")
-        print(f"DEBUG IsCustomer: User authenticated: {getattr(request.user, 'is_authenticated', False)}")
-        
         if not request.user or not request.user.is_authenticated:
-            print("DEBUG IsCustomer: User not authenticated")
+            logger.debug("IsCustomer denied: unauthenticated request to %s", request.path)
             return False
         
         # Check if it's a Customer model instance
         if isinstance(request.user, User):
-            print("DEBUG IsCustomer: User is Customer instance - ALLOWED")
             return True
         
         # Check if it's a User with customer role
         if isinstance(request.user, User) and request.user.role == 'customer':
-            print("DEBUG IsCustomer: User is User model with customer role - ALLOWED")
             return True
         
-        print(f"DEBUG IsCustomer: User failed all checks - DENIED")
+        logger.debug("IsCustomer denied: %s is not a customer", type(request.user).__name__)
         return False
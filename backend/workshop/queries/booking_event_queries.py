@@ -0,0 +1,139 @@
+# workshop/queries/booking_event_queries.py
+from datetime import datetime, time, timedelta
+
+from django.conf import settings
+from django.db.models import Avg, Count, DurationField, Exists, ExpressionWrapper, F, Max, OuterRef, Q
+from django.db.models.functions import TruncDate
+from django.utils import timezone
+
+from workshop.models import BookingEvent, BookingService
+
+
+Status = BookingService.Status
+
+
+def _hours(duration):
+    return round(duration.total_seconds() / 3600, 2) if duration is not None else None
+
+
+def get_booking_history(booking_id):
+    """Status changes of one booking, oldest first"""
+    return [
+        {
+            'from_status': row['from_status'] or None,
+            'to_status': row['to_status'],
+            'at': row['created_at'],
+            'hours_in_previous': _hours(row['created_at'] - row['previous_at']) if row['previous_at'] else None,
+            'by': row['created_by__name'],
+            'notes': row['notes'],
+        }
+        for row in BookingEvent.objects.filter(booking_id=booking_id)
+        .values('from_status', 'to_status', 'created_at', 'previous_at', 'created_by__name', 'notes')
+        .order_by('created_at')
+    ]
+
+
+def get_time_in_state(days=30):
+    """
+    Average and longest time bookings spent in each status before leaving it, over events of
+    the last `days` days, plus turnaround (creation to completion) of bookings completed then.
+    """
+    since = timezone.now() - timedelta(days=days)
+    in_state = ExpressionWrapper(F('created_at') - F('previous_at'), output_field=DurationField())
+    rows = (
+        BookingEvent.objects.filter(created_at__gte=since, previous_at__isnull=False)
+        .exclude(from_status='')
+        .values('from_status')
+        .annotate(transitions=Count('id'), average=Avg(in_state), longest=Max(in_state))
+        .order_by()
+    )
+    states = {row['from_status']: row for row in rows}
+
+    turnaround = (
+        BookingEvent.objects.filter(created_at__gte=since, to_status=Status.COMPLETED)
+        .aggregate(
+            completed=Count('id'),
+            average=Avg(ExpressionWrapper(F('created_at') - F('booking__created_at'), output_field=DurationField())),
+        )
+    )
+    return {
+        'days': days,
+        'states': [
+            {
+                'status': status,
+                'transitions': states[status]['transitions'],
+                'average_hours': _hours(states[status]['average']),
+                'longest_hours': _hours(states[status]['longest']),
+            }
+            for status in Status.values if status in states
+        ],
+        'completed': turnaround['completed'],
+        'average_turnaround_hours': _hours(turnaround['average']),
+    }
+
+
+def get_daily_throughput(days=30):
+    """Per day: bookings opened, and transitions into each status"""
+    first = timezone.localdate() - timedelta(days=days - 1)
+    # A bound on created_at itself rather than created_at__date, so the index is used
+    start = timezone.make_aware(datetime.combine(first, time.min))
+    rows = (
+        BookingEvent.objects.filter(created_at__gte=start)
+        .annotate(day=TruncDate('created_at'))
+        .values('day')
+        .annotate(
+            created=Count('id', filter=Q(from_status='')),
+            **{
+                status: Count('id', filter=Q(to_status=status) & ~Q(from_status=''))
+                for status in Status.values if status != Status.PENDING
+            },
+        )
+        .order_by()
+    )
+    by_day = {row.pop('day'): row for row in rows}
+    empty = {'created': 0, **{status: 0 for status in Status.values if status != Status.PENDING}}
+    return [
+        {'date': (first + timedelta(days=offset)).isoformat(), **by_day.get(first + timedelta(days=offset), empty)}
+        for offset in range(days)
+    ]
+
+
+def sla_limits():
+    """Hours a booking may stay in a status before it breaches the SLA"""
+    return {
+        Status.PENDING: getattr(settings, 'BOOKING_SLA_PENDING_HOURS', 24),
+        Status.IN_PROGRESS: getattr(settings, 'BOOKING_SLA_IN_PROGRESS_HOURS', 8),
+    }
+
+
+def get_sla_breaches(limit=100):
+    """
+    Bookings whose latest event put them in a status longer ago than that status's limit.
+    Candidates come from the (to_status, created_at) index, and the "no later event" check is
+    an anti-join on the (booking, created_at) index, so neither touches the live tables.
+    """
+    now = timezone.now()
+    limits = sla_limits()
+    overdue = Q()
+    for status, hours in limits.items():
+        overdue |= Q(to_status=status, created_at__lt=now - timedelta(hours=hours))
+
+    later = BookingEvent.objects.filter(booking_id=OuterRef('booking_id'), created_at__gt=OuterRef('created_at'))
+    rows = (
+        BookingEvent.objects.filter(overdue)
+        .filter(~Exists(later))
+        .values('booking_id', 'to_status', 'created_at', 'booking__car__license_plate', 'booking__car__customer__name')
+        .order_by('created_at')[:limit]
+    )
+    return [
+        {
+            'booking_id': str(row['booking_id']),
+            'status': row['to_status'],
+            'since': row['created_at'],
+            'hours_in_status': _hours(now - row['created_at']),
+            'limit_hours': limits[row['to_status']],
+            'license_plate': row['booking__car__license_plate'],
+            'customer': row['booking__car__customer__name'],
+        }
+        for row in rows
+    ]
@@ -1,10 +1,14 @@
 # workshop/queries/booking_queries.py
 
+import logging
+from django.core.exceptions import ValidationError
 from django.db.models import Q, Count, Sum
 from django.utils import timezone
 from datetime import datetime, date
 from workshop.models import Booking, BookingService, Car, User, InvoiceItems
 
+logger = logging.getLogger(__name__)
+
 
 # Get optimized bookings list
 def get_optimized_bookings(filters=None, page=1, page_size=10):
@@ -26,6 +30,32 @@ def get_optimized_bookings(filters=None, page=1, page_size=10):
         'invoice__id', 'invoice__total_amount', 'invoice__status'
     )
     
+    queryset = apply_booking_filters(queryset, filters)
+    
+    # Order by upcoming dates first (ascending), then creation order
+    queryset = queryset.order_by('daily_availability__date', 'created_at')
+    
+    # Pagination
+    start = (page - 1) * page_size
+    end = start + page_size
+    total_count = queryset.count()
+    paginated_queryset = queryset[start:end]
+    
+    return {
+        'queryset': paginated_queryset,
+        'pagination': {
+            'page': page,
+            'page_size': page_size,
+            'total_count': total_count,
+            'total_pages': (total_count + page_size - 1) // page_size,
+            'has_next': end < total_count,
+            'has_previous': page > 1
+        }
+    }
+
+
+# Apply booking list filters (status, customer, service, date range, search)
+def apply_booking_filters(queryset, filters=None):
     if filters:
         # Apply filters - Note: service filters need to go through BookingService
         if filters.get('status'):
@@ -65,26 +95,7 @@ def get_optimized_bookings(filters=None, page=1, page_size=10):
                 Q(special_instructions__icontains=search)
             )
     
-    # Order by upcoming dates first (ascending), then creation order
-    queryset = queryset.order_by('daily_availability__date', 'created_at')
-    
-    # Pagination
-    start = (page - 1) * page_size
-    end = start + page_size
-    total_count = queryset.count()
-    paginated_queryset = queryset[start:end]
-    
-    return {
-        'queryset': paginated_queryset,
-        'pagination': {
-            'page': page,
-            'page_size': page_size,
-            'total_count': total_count,
-            'total_pages': (total_count + page_size - 1) // page_size,
-            'has_next': end < total_count,
-            'has_previous': page > 1
-        }
-    }
+    return queryset
 
 
 def get_optimized_booking_detail(booking_id):
@@ -139,10 +150,12 @@ def get_customer_cars_optimized(customer_id):
         return None
     
     try:
-        customer = User.objects.only('id', 'name').get(pk=customer_id)
-        cars = Car.objects.filter(customer=customer).only(
+        # Filter on the foreign key directly; the customer row is only read when there are no cars
+        cars = list(Car.objects.filter(customer_id=customer_id).only(
             'id', 'make', 'model', 'year', 'license_plate', 'color'
-        )
+        ))
+        if not cars and not User.objects.filter(pk=customer_id).exists():
+            return None
         
         cars_data = []
         for car in cars:
@@ -157,7 +170,7 @@ def get_customer_cars_optimized(customer_id):
             })
         
         return {'cars': cars_data}
-    except User.DoesNotExist:
+    except ValidationError:
         return None
 
 
@@ -174,17 +187,13 @@ def get_booking_for_update(booking_id):
 
 
 def get_invoice_items(booking_id):
-    print(f"[DEBUG] get_invoice_items called with booking_id: {booking_id}")
     booking_service = BookingService.objects.filter(booking_id=booking_id).select_related('service').first()
-    print(f"[DEBUG] BookingService found: {booking_service}")
     if not booking_service:
-        print("[DEBUG] No BookingService found for this booking_id.")
+        logger.debug("No BookingService found for booking %s", booking_id)
         return []
-    invoice_items = InvoiceItems.objects.filter(booking_service=booking_service).select_related('product_variant')
-    print(f"[DEBUG] InvoiceItems count: {invoice_items.count()}")
+    invoice_items = InvoiceItems.objects.filter(booking_service=booking_service).select_related('product_variant__product')
     items = []
     for item in invoice_items:
-        print(f"[DEBUG] InvoiceItem: id={item.id}, product_variant={item.product_variant}, unit_price={item.unit_price}, quantity={item.quantity}")
         items.append({
             'id': str(item.id),
             'booking_service_id': str(booking_service.id),
@@ -195,5 +204,5 @@ def get_invoice_items(booking_id):
             'quantity': float(item.quantity),
             'total_amount': float(item.total_amount) if item.total_amount is not None else None,
         })
-    print(f"[DEBUG] Returning {len(items)} invoice items.")
+    logger.debug("Returning %d invoice items for booking %s", len(items), booking_id)
     return items
@@ -1,10 +1,7 @@
 from workshop.models import BusinessSettings
 
 def get_contact_info():
-    settings = BusinessSettings.objects.first()
-    if not settings:
-        return {}
-    
+    settings = BusinessSettings.get_settings()
     return {
         "name": settings.name,
         "address": settings.address,
@@ -0,0 +1,259 @@
+# workshop/queries/customer_analytics_queries.py
+from datetime import date, datetime, time
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DateField, Exists, F, OuterRef, Q, Subquery, Sum, Min, Max, Value
+from django.db.models.functions import Coalesce, Greatest, Least, TruncMonth
+from django.utils import timezone
+
+from workshop.models import User, Invoice, CustomerMonthlyActivity
+from workshop.helper.date_utils import get_start_of_week
+
+
+# A visit is any invoice that was not cancelled. The visit stats on User, the returning
+# customer count and the cohort fact table all count visits by this one definition.
+VISIT = ~Q(status=Invoice.Status.CANCELLED)
+
+
+def get_customer_stats():
+    """Total, returning (2+ visits) and new-this-week customers in a single query"""
+    # OFFSET 1 LIMIT 1: a customer is returning as soon as a second visit row exists,
+    # so the probe stops there instead of counting all of their invoices
+    has_second_invoice = Exists(Invoice.objects.filter(VISIT, user=OuterRef('pk')).order_by()[1:2])
+
+    return User.objects.filter(role=User.Role.customer).aggregate(
+        total=Count('id'),
+        returning=Count('id', filter=has_second_invoice),
+        new_this_week=Count('id', filter=Q(date_joined__gte=get_start_of_week())),
+    )
+
+
+def record_visit(user_id, visited_at):
+    """Count one new, not cancelled invoice against the customer's visit stats, atomically in SQL"""
+    User.objects.filter(pk=user_id).update(
+        visit_count=F('visit_count') + 1,
+        first_visit_at=Least(Coalesce('first_visit_at', Value(visited_at)), Value(visited_at)),
+        last_visit_at=Greatest(Coalesce('last_visit_at', Value(visited_at)), Value(visited_at)),
+    )
+
+
+def record_visits(visits_by_user, visited_at):
+    """record_visit for many customers at once: one UPDATE per distinct visit count"""
+    users_by_count = {}
+    for user_id, count in visits_by_user.items():
+        users_by_count.setdefault(count, []).append(user_id)
+    for count, user_ids in users_by_count.items():
+        User.objects.filter(pk__in=user_ids).update(
+            visit_count=F('visit_count') + count,
+            first_visit_at=Least(Coalesce('first_visit_at', Value(visited_at)), Value(visited_at)),
+            last_visit_at=Greatest(Coalesce('last_visit_at', Value(visited_at)), Value(visited_at)),
+        )
+
+
+def _visit_stats():
+    visits = Invoice.objects.filter(VISIT, user=OuterRef('pk')).order_by().values('user')
+    return {
+        'visit_count': Coalesce(Subquery(visits.annotate(c=Count('id')).values('c')), 0),
+        'first_visit_at': Subquery(visits.annotate(first=Min('created_at')).values('first')),
+        'last_visit_at': Subquery(visits.annotate(last=Max('created_at')).values('last')),
+    }
+
+
+def refresh_visit_stats(user_ids):
+    """Recompute the visit stats of a few customers, for invoices that were cancelled or deleted"""
+    return User.objects.filter(pk__in=user_ids).update(**_visit_stats())
+
+
+def rebuild_visit_stats():
+    """
+    Recompute visit_count / first_visit_at / last_visit_at for every customer from invoices.
+    Needed after bulk loads that skip signals.
+    """
+    return User.objects.filter(role=User.Role.customer).update(**_visit_stats())
+
+
+# -- cohort fact table -----------------------------------------------------------
+# Revenue is the total of paid invoices.
+
+def month_start(value):
+    """First day of the (local) month of a date or datetime"""
+    if isinstance(value, datetime):
+        value = timezone.localtime(value).date()
+    return value.replace(day=1)
+
+
+def add_months(month, count):
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def _month_bounds(month):
+    start = timezone.make_aware(datetime.combine(month, time.min))
+    end = timezone.make_aware(datetime.combine(add_months(month, 1), time.min))
+    return start, end
+
+
+def _fact_totals():
+    return {
+        'invoice_count': Count('id', filter=VISIT),
+        'revenue': Coalesce(Sum('total_amount', filter=Q(status=Invoice.Status.PAID)), Value(Decimal('0'))),
+    }
+
+
+def refresh_customer_month(user_id, month):
+    """Recompute one customer-month fact row from that customer's invoices in the month"""
+    refresh_customers_month([user_id], month)
+
+
+def refresh_customers_month(user_ids, month):
+    """Recompute the month's fact rows of several customers in a fixed number of queries"""
+    start, end = _month_bounds(month)
+    totals = {
+        row['user_id']: row
+        for row in Invoice.objects.filter(user_id__in=user_ids, created_at__gte=start, created_at__lt=end)
+        .values('user_id')
+        .annotate(**_fact_totals())
+    }
+    active = [user_id for user_id, row in totals.items() if row['invoice_count'] or row['revenue']]
+    CustomerMonthlyActivity.objects.filter(user_id__in=user_ids, month=month).exclude(user_id__in=active).delete()
+    if not active:
+        return
+
+    cohorts = {
+        user_id: month_start(first_visit_at or date_joined)
+        for user_id, first_visit_at, date_joined in User.objects.filter(pk__in=active).values_list(
+            'id', 'first_visit_at', 'date_joined'
+        )
+    }
+    CustomerMonthlyActivity.objects.bulk_create(
+        [
+            CustomerMonthlyActivity(
+                user_id=user_id,
+                month=month,
+                cohort_month=cohorts[user_id],
+                invoice_count=totals[user_id]['invoice_count'],
+                revenue=totals[user_id]['revenue'],
+            )
+            for user_id in active
+        ],
+        update_conflicts=True,
+        unique_fields=['user', 'month'],
+        update_fields=['cohort_month', 'invoice_count', 'revenue'],
+    )
+
+
+def rebuild_customer_activity(batch_size=5000):
+    """Rebuild the whole fact table from invoices; run after rebuild_visit_stats"""
+    rows = (
+        Invoice.objects.order_by()
+        .values(
+            'user_id',
+            month=TruncMonth('created_at', output_field=DateField()),
+            cohort=TruncMonth(Coalesce('user__first_visit_at', 'user__date_joined'), output_field=DateField()),
+        )
+        .annotate(**_fact_totals())
+    )
+
+    created = 0
+    with transaction.atomic():
+        CustomerMonthlyActivity.objects.all().delete()
+        batch = []
+        for row in rows.iterator(chunk_size=batch_size):
+            if not row['invoice_count'] and not row['revenue']:
+                continue
+            batch.append(CustomerMonthlyActivity(
+                user_id=row['user_id'],
+                month=row['month'],
+                cohort_month=row['cohort'],
+                invoice_count=row['invoice_count'],
+                revenue=row['revenue'],
+            ))
+            if len(batch) >= batch_size:
+                CustomerMonthlyActivity.objects.bulk_create(batch)
+                created += len(batch)
+                batch = []
+        CustomerMonthlyActivity.objects.bulk_create(batch)
+        created += len(batch)
+    return created
+
+
+def get_cohort_report(months=12):
+    """
+    Month-N retention and cumulative revenue for the last `months` monthly cohorts.
+    One grouped query on users for cohort sizes and one on the fact table for the cells,
+    so the cost does not grow with the number of invoices.
+    """
+    current = month_start(timezone.localdate())
+    first = add_months(current, -(months - 1))
+    first_start, _ = _month_bounds(first)
+
+    sizes = dict(
+        User.objects.filter(role=User.Role.customer)
+        .filter(Q(first_visit_at__gte=first_start) | Q(first_visit_at__isnull=True, date_joined__gte=first_start))
+        .annotate(cohort=TruncMonth(Coalesce('first_visit_at', 'date_joined'), output_field=DateField()))
+        .values('cohort')
+        .annotate(customers=Count('id'))
+        .values_list('cohort', 'customers')
+        .order_by()
+    )
+
+    cells = {}
+    for row in (
+        CustomerMonthlyActivity.objects.filter(cohort_month__gte=first)
+        .values('cohort_month', 'month')
+        .annotate(active=Count('id'), revenue=Sum('revenue'))
+        .order_by()
+    ):
+        cells[(row['cohort_month'], row['month'])] = (row['active'], row['revenue'])
+
+    cohorts = []
+    for index in range(months):
+        cohort = add_months(first, index)
+        size = sizes.get(cohort, 0)
+        active, retention, cumulative = [], [], []
+        running = Decimal('0')
+        for offset in range(months - index):
+            count, revenue = cells.get((cohort, add_months(cohort, offset)), (0, Decimal('0')))
+            running += revenue
+            active.append(count)
+            retention.append(round(count / size * 100, 1) if size else 0.0)
+            cumulative.append(float(running))
+        cohorts.append({
+            'cohort': cohort.strftime('%Y-%m'),
+            'customers': size,
+            'active_customers': active,
+            'retention': retention,
+            'cumulative_revenue': cumulative,
+            'lifetime_value': round(float(running) / size, 2) if size else 0.0,
+        })
+    return cohorts
+
+
+def get_top_customers_by_value(limit=20):
+    """Customers ranked by lifetime paid revenue"""
+    rows = (
+        CustomerMonthlyActivity.objects.values('user_id')
+        .annotate(
+            revenue=Sum('revenue'),
+            invoices=Sum('invoice_count'),
+            active_months=Count('id'),
+            first_month=Min('month'),
+            last_month=Max('month'),
+        )
+        .order_by('-revenue')[:limit]
+    )
+    rows = list(rows)
+    names = dict(User.objects.filter(id__in=[row['user_id'] for row in rows]).values_list('id', 'name'))
+    return [
+        {
+            'customer_id': row['user_id'],
+            'name': names.get(row['user_id'], ''),
+            'revenue': float(row['revenue']),
+            'invoices': row['invoices'],
+            'active_months': row['active_months'],
+            'first_month': row['first_month'].strftime('%Y-%m'),
+            'last_month': row['last_month'].strftime('%Y-%m'),
+        }
+        for row in rows
+    ]
@@ -1,6 +1,6 @@
-from django.db.models import Count
-from workshop.models import User
-from workshop.helper.date_utils import get_start_of_week, get_start_of_week_percentage
+from django.db.models import Prefetch, Q
+from workshop.models import User, Car
+from workshop.queries.customer_analytics_queries import get_customer_stats
 
 def get_customer_by_id(customer_id: str) -> User:
     try:
@@ -13,33 +13,39 @@ def get_customer_by_id(customer_id: str) -> User:
         return None
     
 
-def get_total_customers():
-    return User.objects.filter(role=User.Role.customer).count()
+def get_customer_stats_data():
+    stats = get_customer_stats()
+    
+    return {
+        "total": stats['total'],
+        "returning": stats['returning'],
+        "new_this_week": stats['new_this_week']
+    }
 
 
+DIRECTORY_FIELDS = ('id', 'email', 'name', 'phone_number', 'date_joined')
+DIRECTORY_CAR_FIELDS = ('id', 'customer_id', 'make', 'model', 'year', 'license_plate', 'color')
 
-def get_returning_customers():
-    return (
+
+def get_customer_directory(search: str = None):
+    # Only the columns CustomerDetailSerializer renders, with all cars of a page in one extra query
+    queryset = (
         User.objects.filter(role=User.Role.customer)
-        .annotate(invoice_count=Count('invoices'))
-        .filter(invoice_count__gt=1)
-        .count()
+        .only(*DIRECTORY_FIELDS)
+        .prefetch_related(Prefetch('cars', queryset=Car.objects.only(*DIRECTORY_CAR_FIELDS)))
     )
-
-
-def get_new_customers_this_week():
-    return User.objects.filter(
-        role=User.Role.customer,
-        date_joined__gte=get_start_of_week()).count()
-
-
-def get_customer_stats_data():
-    total = get_total_customers()
-    returning = get_returning_customers()
-    new_this_week = get_new_customers_this_week()
-    
-    return {
-        "total": total,
-        "returning": returning,
-        "new_this_week": new_this_week
-    }
+    if search:
+        queryset = queryset.filter(
+            Q(name__icontains=search) |
+            Q(email__icontains=search) |
+            Q(phone_number__icontains=search)
+        )
+    return queryset
+
+
+def get_customer_typeahead(search: str, limit: int = 10):
+    # Prefix match served by the (role, name) / (role, phone_number) indexes, no model instances built
+    queryset = User.objects.filter(role=User.Role.customer)
+    if search:
+        queryset = queryset.filter(Q(name__istartswith=search) | Q(phone_number__startswith=search))
+    return list(queryset.order_by('name', 'id').values('id', 'name', 'phone_number')[:limit])
@@ -0,0 +1,147 @@
+# workshop/queries/export_queries.py
+
+from datetime import datetime
+from workshop.models import Invoice, Booking, StockMovement, Expense
+from workshop.queries.invoice_queries import apply_invoice_filters
+from workshop.queries.booking_queries import apply_booking_filters
+
+
+# Each export is a (header, values_list queryset) pair. Rows are plain tuples so
+# they can be streamed with QuerySet.iterator() without building model instances.
+
+INVOICE_EXPORT_COLUMNS = [
+    ('Invoice Number', 'invoice_number'),
+    ('Created At', 'created_at'),
+    ('Status', 'status'),
+    ('Subtotal', 'subtotal'),
+    ('Discount', 'discount_amount'),
+    ('Total', 'total_amount'),
+    ('Customer', 'user__name'),
+    ('Email', 'user__email'),
+    ('Phone', 'user__phone_number'),
+]
+
+BOOKING_EXPORT_COLUMNS = [
+    ('Booking ID', 'id'),
+    ('Date', 'daily_availability__date'),
+    ('Status', 'service__status'),
+    ('Service', 'service__service__name'),
+    ('Service Price', 'service__price'),
+    ('Products Price', 'service__product_items_price'),
+    ('Customer', 'car__customer__name'),
+    ('Email', 'car__customer__email'),
+    ('Phone', 'car__customer__phone_number'),
+    ('Make', 'car__make'),
+    ('Model', 'car__model'),
+    ('License Plate', 'car__license_plate'),
+    ('Invoice Number', 'invoice__invoice_number'),
+    ('Invoice Total', 'invoice__total_amount'),
+    ('Invoice Status', 'invoice__status'),
+    ('Created At', 'created_at'),
+]
+
+STOCK_MOVEMENT_EXPORT_COLUMNS = [
+    ('Date', 'updated_at'),
+    ('SKU', 'product_variant__sku'),
+    ('Product', 'product_variant__product__name'),
+    ('Variant', 'product_variant__variant_name'),
+    ('Reason', 'reason'),
+    ('Change', 'change_amount'),
+    ('Quantity Before', 'quantity_before'),
+    ('Quantity After', 'quantity_after'),
+    ('Reference', 'reference_id'),
+    ('Created By', 'created_by'),
+]
+
+EXPENSE_EXPORT_COLUMNS = [
+    ('Paid On', 'paid_on'),
+    ('Title', 'title'),
+    ('Category', 'category'),
+    ('Amount', 'amount'),
+    ('Description', 'description'),
+    ('Recorded By', 'created_by__name'),
+    ('Created At', 'created_at'),
+]
+
+
+def _parse_date(value):
+    if not value:
+        return None
+    try:
+        return datetime.strptime(value, '%Y-%m-%d').date()
+    except ValueError:
+        return None
+
+
+def _split_columns(columns):
+    return [label for label, _ in columns], [field for _, field in columns]
+
+
+def get_invoice_export(customer_id=None, invoice_type=None, status=None, date_from=None, date_to=None):
+    """
+    Invoice rows for export, filtered the same way as get_filtered_invoices
+    """
+    header, fields = _split_columns(INVOICE_EXPORT_COLUMNS)
+    queryset = apply_invoice_filters(
+        Invoice.objects.all(),
+        customer_id=customer_id,
+        invoice_type=invoice_type,
+        date_from=date_from,
+        date_to=date_to
+    )
+    if status and status != 'all':
+        queryset = queryset.filter(status=status)
+
+    return header, queryset.order_by('-created_at').values_list(*fields)
+
+
+def get_booking_export(filters=None):
+    """
+    Booking rows for export, filtered the same way as get_optimized_bookings
+    """
+    header, fields = _split_columns(BOOKING_EXPORT_COLUMNS)
+    queryset = apply_booking_filters(Booking.objects.all(), filters)
+
+    return header, queryset.order_by('daily_availability__date', 'created_at').values_list(*fields)
+
+
+def get_stock_movement_export(variant_id=None, reason=None, date_from=None, date_to=None):
+    """
+    Stock movement rows for export
+    """
+    header, fields = _split_columns(STOCK_MOVEMENT_EXPORT_COLUMNS)
+    queryset = StockMovement.objects.all()
+
+    if variant_id:
+        queryset = queryset.filter(product_variant_id=variant_id)
+    if reason:
+        queryset = queryset.filter(reason=reason)
+
+    date_from = _parse_date(date_from)
+    if date_from:
+        queryset = queryset.filter(updated_at__date__gte=date_from)
+    date_to = _parse_date(date_to)
+    if date_to:
+        queryset = queryset.filter(updated_at__date__lte=date_to)
+
+    return header, queryset.order_by('-updated_at').values_list(*fields)
+
+
+def get_expense_export(category=None, date_from=None, date_to=None):
+    """
+    Expense rows for export
+    """
+    header, fields = _split_columns(EXPENSE_EXPORT_COLUMNS)
+    queryset = Expense.objects.all()
+
+    if category:
+        queryset = queryset.filter(category=category)
+
+    date_from = _parse_date(date_from)
+    if date_from:
+        queryset = queryset.filter(paid_on__gte=date_from)
+    date_to = _parse_date(date_to)
+    if date_to:
+        queryset = queryset.filter(paid_on__lte=date_to)
+
+    return header, queryset.order_by('-paid_on').values_list(*fields)
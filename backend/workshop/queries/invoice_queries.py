@@ -29,7 +29,8 @@ def get_invoices_with_items_and_variants() -> QuerySet:
     return Invoice.objects.select_related('user').prefetch_related(
         'bookings__car',                    # For booking car info  
         'bookings__service__service',       # For booking service info
-        'bookings__daily_availability'      # For booking date info
+        'bookings__daily_availability',     # For booking date info
+        'items__product_variant'            # For counter-sale items
     )
 
 
@@ -43,41 +44,14 @@ def get_invoices_with_booking_data() -> QuerySet:
 
 
 def get_invoice_booking_data(invoice_ids: list) -> QuerySet:
-    print(f"=== DEBUG QUERY: Looking for bookings with invoice_ids: {invoice_ids} ===")
-    
-    try:
-        # Fix the query - the relationship path should be correct
-        queryset = Booking.objects.filter(
-            invoice_id__in=invoice_ids
-        ).select_related(
-            'car__customer',    # Car -> Customer (User)
-            'daily_availability',
-            'service__service',  # BookingService -> Service
-            'invoice'           # Include invoice relationship for financial data
-        )
-        
-        print(f"=== DEBUG QUERY: Booking queryset SQL: {queryset.query} ===")
-        print(f"=== DEBUG QUERY: Found {queryset.count()} bookings ===")
-        
-        # Let's also check all bookings to see what's in the database
-        all_bookings = Booking.objects.all()
-        print(f"=== DEBUG QUERY: Total bookings in database: {all_bookings.count()} ===")
-        for booking in all_bookings:
-            print(f"=== DEBUG QUERY: Booking {booking.id} -> Invoice {booking.invoice_id} ===")
-            # Check if booking has service
-            if hasattr(booking, 'service') and booking.service:
-                print(f"=== DEBUG QUERY: Booking {booking.id} has service: {booking.service.service.name} ===")
-            else:
-                print(f"=== DEBUG QUERY: Booking {booking.id} has NO service ===")
-        
-        return queryset
-        
-    except Exception as e:
-        print(f"=== DEBUG QUERY ERROR: {e} ===")
-        import traceback
-        print(f"=== DEBUG QUERY TRACEBACK: {traceback.format_exc()} ===")
-        # Return empty queryset on error
-        return Booking.objects.none()
+    return Booking.objects.filter(
+        invoice_id__in=invoice_ids
+    ).select_related(
+        'car__customer',    # Car -> Customer (User)
+        'daily_availability',
+        'service__service',  # BookingService -> Service
+        'invoice'           # Include invoice relationship for financial data
+    )
 
 
 def apply_invoice_search_filter(queryset: QuerySet, search: str) -> QuerySet:
@@ -91,12 +65,10 @@ def apply_invoice_status_filter(queryset: QuerySet, status_filter: str) -> Query
     return queryset.filter(status=status_filter)
 
 
-def get_filtered_invoices(customer_id=None, invoice_type=None, page=1, page_size=10, date_from=None, date_to=None):
+def apply_invoice_filters(queryset, customer_id=None, invoice_type=None, date_from=None, date_to=None):
     """
-    Get filtered invoices with all related data in a single optimized query
+    Apply the invoice list filters (customer, type, created_at date range) to a queryset
     """
-    queryset = get_invoices_with_items_and_variants()
-    
     if customer_id:
         queryset = queryset.filter(user_id=customer_id)
         
@@ -119,6 +91,21 @@ def get_filtered_invoices(customer_id=None, invoice_type=None, page=1, page_size
             queryset = queryset.filter(created_at__date__lte=date_to_obj)
         except ValueError:
             pass
+
+    return queryset
+
+
+def get_filtered_invoices(customer_id=None, invoice_type=None, page=1, page_size=10, date_from=None, date_to=None):
+    """
+    Get filtered invoices with all related data in a single optimized query
+    """
+    queryset = apply_invoice_filters(
+        get_invoices_with_items_and_variants(),
+        customer_id=customer_id,
+        invoice_type=invoice_type,
+        date_from=date_from,
+        date_to=date_to
+    )
     
     total_count = queryset.count()
     
@@ -0,0 +1,40 @@
+# workshop/queries/product_queries.py
+from decimal import Decimal
+
+from django.db.models import Count, DecimalField, ExpressionWrapper, F, Prefetch, Q, Sum, Value
+from django.db.models.functions import Coalesce
+
+from workshop.models import Product, ProductVariant
+
+ZERO = Value(Decimal('0'), output_field=DecimalField(max_digits=14, decimal_places=2))
+
+
+def get_catalog(category=None, search=None, low_stock_threshold=5):
+    """
+    Products with their variants (one prefetch query per page) and per-product stock
+    totals computed in SQL.
+    """
+    stock_value = ExpressionWrapper(
+        F('variants__quantity') * F('variants__price'),
+        output_field=DecimalField(max_digits=14, decimal_places=2),
+    )
+    queryset = (
+        Product.objects
+        .annotate(
+            variant_count=Count('variants'),
+            total_stock=Coalesce(Sum('variants__quantity'), ZERO),
+            stock_value=Coalesce(Sum(stock_value), ZERO),
+            low_stock_variants=Count('variants', filter=Q(variants__quantity__lte=low_stock_threshold)),
+        )
+        .prefetch_related(Prefetch(
+            'variants',
+            queryset=ProductVariant.objects.only(
+                'id', 'product_id', 'variant_name', 'sku', 'price', 'quantity', 'created_at'
+            ).order_by('variant_name'),
+        ))
+    )
+    if category:
+        queryset = queryset.filter(category=category)
+    if search:
+        queryset = queryset.filter(name__icontains=search)
+    return queryset
@@ -53,6 +53,64 @@ class TopSparePartsSerializer(serializers.Serializer):
     count = serializers.IntegerField(help_text="Quantity of parts used")
 
 
+class CustomerCohortSerializer(serializers.Serializer):
+    """Serializer for one monthly customer cohort; list index N is month N after the cohort month."""
+    cohort = serializers.CharField(max_length=7, help_text="First-visit month in YYYY-MM format")
+    customers = serializers.IntegerField(help_text="Customers in the cohort")
+    active_customers = serializers.ListField(child=serializers.IntegerField(), help_text="Customers invoiced in month N")
+    retention = serializers.ListField(child=serializers.FloatField(), help_text="Month-N retention percentage")
+    cumulative_revenue = serializers.ListField(child=serializers.FloatField(), help_text="Paid revenue up to month N")
+    lifetime_value = serializers.FloatField(help_text="Cumulative revenue per cohort customer")
+
+
+class CustomerLifetimeValueSerializer(serializers.Serializer):
+    """Serializer for customers ranked by lifetime revenue."""
+    customer_id = serializers.UUIDField()
+    name = serializers.CharField(max_length=255)
+    revenue = serializers.FloatField(help_text="Lifetime paid revenue")
+    invoices = serializers.IntegerField(help_text="Invoices that were not cancelled")
+    active_months = serializers.IntegerField(help_text="Months with at least one invoice")
+    first_month = serializers.CharField(max_length=7)
+    last_month = serializers.CharField(max_length=7)
+
+
+class BookingStateTimeSerializer(serializers.Serializer):
+    """Serializer for the time bookings spent in one status."""
+    status = serializers.CharField(max_length=20)
+    transitions = serializers.IntegerField(help_text="Bookings that left the status in the period")
+    average_hours = serializers.FloatField(allow_null=True)
+    longest_hours = serializers.FloatField(allow_null=True)
+
+
+class BookingTimeInStateSerializer(serializers.Serializer):
+    """Serializer for time-in-state and turnaround from the booking event log."""
+    days = serializers.IntegerField()
+    states = BookingStateTimeSerializer(many=True)
+    completed = serializers.IntegerField(help_text="Bookings completed in the period")
+    average_turnaround_hours = serializers.FloatField(allow_null=True, help_text="Creation to completion")
+
+
+class BookingThroughputSerializer(serializers.Serializer):
+    """Serializer for one day of booking throughput."""
+    date = serializers.CharField(max_length=10)
+    created = serializers.IntegerField()
+    confirmed = serializers.IntegerField()
+    in_progress = serializers.IntegerField()
+    completed = serializers.IntegerField()
+    canceled = serializers.IntegerField()
+
+
+class BookingSlaBreachSerializer(serializers.Serializer):
+    """Serializer for a booking that has stayed in its status past the SLA limit."""
+    booking_id = serializers.UUIDField()
+    status = serializers.CharField(max_length=20)
+    since = serializers.DateTimeField()
+    hours_in_status = serializers.FloatField()
+    limit_hours = serializers.IntegerField()
+    license_plate = serializers.CharField(max_length=20, allow_null=True)
+    customer = serializers.CharField(max_length=255, allow_null=True)
+
+
 class AnalyticsMetricsSerializer(serializers.Serializer):
     """Serializer for analytics metrics data."""
     monthlyRevenue = serializers.FloatField(help_text="Current month revenue")
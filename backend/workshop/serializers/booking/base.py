@@ -76,8 +76,10 @@ class BaseAvailabilityMixin:
             # Book slot for new date
             new_daily_availability.book_slot()
             
-            # Update booking's daily availability
+            # Update booking's daily availability; the time slot belonged to the old date
             instance.daily_availability = new_daily_availability
+            instance.start_time = instance.end_time = None
+            instance.bay = instance.technician = None
             instance.save()
             
         return instance
@@ -2,7 +2,11 @@
 
 from rest_framework import serializers
 from decimal import Decimal
+from django.db import transaction
 from workshop.models import Booking, BookingService, Invoice, User
+from workshop.services.slot_scheduler_service import SlotScheduler
+from workshop.services.booking_transition_service import BookingTransitionService
+from workshop import metrics
 from .base import BaseBookingSerializer
 from .validators import BookingValidationMixin
 
@@ -13,12 +17,14 @@ class BookingCreateSerializer(BaseBookingSerializer, BookingValidationMixin):
     service = serializers.CharField(write_only=True)
     booking_date = serializers.DateField(write_only=True)
     price = serializers.DecimalField(max_digits=10, decimal_places=2, write_only=True, required=False)
+    # Optional concrete start from bookings/slots/; without it the booking only holds a day slot
+    start_time = serializers.TimeField(write_only=True, required=False)
     
     class Meta:
         model = BaseBookingSerializer.Meta.model
         fields = [
             'customer', 'car', 'service', 'booking_date', 'price',
-            'special_instructions'
+            'start_time', 'special_instructions'
         ]
 
     def validate(self, data):
@@ -52,12 +58,22 @@ class BookingCreateSerializer(BaseBookingSerializer, BookingValidationMixin):
 
         return data
 
+    @transaction.atomic
     def create(self, validated_data):
         
         # Extract service-related data
         service = validated_data.pop('resolved_service')
         service_price = validated_data.pop('service_price')
         daily_availability = validated_data['daily_availability']
+
+        # Assign a bay and technician for the requested start, checked under the day's row lock
+        start_time = validated_data.pop('start_time', None)
+        if start_time is not None:
+            try:
+                validated_data.update(SlotScheduler.reserve(daily_availability, service, start_time))
+            except ValueError as e:
+                metrics.SLOT_CONFLICTS.labels('time_taken').inc()
+                raise serializers.ValidationError({'start_time': str(e)})
         
         # Set created_by from request context
         request = self.context.get('request')
@@ -97,8 +113,12 @@ class BookingCreateSerializer(BaseBookingSerializer, BookingValidationMixin):
             price=service_price,
             status='pending'
         )
+        BookingTransitionService.open_booking(booking, validated_data['created_by'])
         
-        # Book the slot in daily availability
-        daily_availability.book_slot()
+        # Book the slot in daily availability; False means another booking took the last slot,
+        # and raising rolls back the booking and invoice created above
+        if not daily_availability.book_slot():
+            metrics.SLOT_CONFLICTS.labels('lost_race').inc()
+            raise serializers.ValidationError({'booking_date': 'No available slots for this date'})
         
         return booking
@@ -32,7 +32,8 @@ class BookingDetailSerializer(BaseBookingSerializer):
         fields = [
             'id', 'customer_details', 'car', 'car_details',
             'service_details', 'service_id', 'availability_details',
-            'scheduled_date', 'special_instructions',
+            'scheduled_date', 'start_time', 'end_time', 'bay', 'technician',
+            'special_instructions',
             'created_at', 'payment_status', 'invoice_details',
             'customer_rating', 'customer_feedback'
         ]
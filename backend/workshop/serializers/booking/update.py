@@ -2,7 +2,8 @@
 
 from rest_framework import serializers
 from decimal import Decimal
-from workshop.models import Booking
+from workshop.models import Booking, BookingService
+from workshop.services.booking_transition_service import BookingTransitionService, can_transition
 from .base import BaseBookingSerializer, BaseBookingServiceMixin, BaseAvailabilityMixin
 from .validators import BookingValidationMixin
 
@@ -50,6 +51,18 @@ class BookingUpdateSerializer(BaseBookingSerializer, BaseBookingServiceMixin, Ba
 
             data['new_daily_availability'] = new_daily_availability
 
+        # Status changes follow the booking state machine; resending the current status is a no-op
+        new_status = data.get('status')
+        if new_status:
+            current = (
+                BookingService.objects.filter(booking_id=self.context.get('pk'))
+                .values_list('status', flat=True)
+                .first()
+            )
+            if new_status == current:
+                data.pop('status')
+            elif current is not None and not can_transition(current, new_status):
+                raise serializers.ValidationError({'status': f"Cannot change status from {current} to {new_status}"})
 
         return data
 
@@ -70,12 +83,11 @@ class BookingUpdateSerializer(BaseBookingSerializer, BaseBookingServiceMixin, Ba
         status = validated_data.pop('status', None)
 
         # Update BookingService if any service-related changes
-        if resolved_service or price is not None or status:
+        if resolved_service or price is not None:
             self.update_booking_service(
                 booking_obj,
                 service=resolved_service,
                 price=price,
-                status=status
             )
 
             # Update invoice if price changed
@@ -84,6 +96,13 @@ class BookingUpdateSerializer(BaseBookingSerializer, BaseBookingServiceMixin, Ba
                 booking_obj.invoice.total_amount = booking_obj.invoice.subtotal - booking_obj.invoice.discount_amount
                 booking_obj.invoice.save()
 
+        # Status goes through the transition service so slots, invoices and the event log follow
+        if status:
+            request = self.context.get('request')
+            result, errors = BookingTransitionService.transition([booking_obj.pk], status, getattr(request, 'user', None))
+            if errors or result['rejected']:
+                raise serializers.ValidationError({'status': (errors or result['rejected'][0])['error']})
+
         # Update remaining booking fields (special_instructions, customer_rating, customer_feedback)
         updated_booking = super().update(booking_obj, validated_data)
 
@@ -1,7 +1,9 @@
 # workshop/serializers/booking/validators.py
 
 from rest_framework import serializers
-from workshop.models import Service, DailyAvailability, User, Car
+from workshop.models import Service, User, Car
+from workshop.services.capacity_planner_service import CapacityPlanner
+from workshop import metrics
 
 
 class BookingValidationMixin:
@@ -32,24 +34,16 @@ class BookingValidationMixin:
     
     def get_or_create_availability(self, booking_date):
         """Get or create daily availability for date"""
-        daily_availability, created = DailyAvailability.objects.get_or_create(
-            date=booking_date,
-            defaults={
-                'total_slots': 7,
-                'available_slots': 7,
-                'is_available': True
-            }
-        )
-        return daily_availability
+        return CapacityPlanner.get_or_create_day(booking_date)
     
     def validate_availability(self, daily_availability, current_date=None):
         """Check if date has availability"""
         # Only check availability if it's a different date
-        print('===', current_date, daily_availability.date)
         if current_date and daily_availability.date == current_date:
             return True
             
         if not daily_availability.has_availability():
+            metrics.SLOT_CONFLICTS.labels('fully_booked').inc()
             raise serializers.ValidationError({'booking_date': 'No slots available for this date'})
         
         return True
@@ -31,7 +31,7 @@ class ServiceSerializer(serializers.ModelSerializer):
         model = Service
         fields = [
             'id', 'name', 'description', 'category',
-            'price', 'is_active', 'created_at', 'items'
+            'price', 'duration_minutes', 'is_active', 'created_at', 'items'
         ]
 
 
@@ -45,7 +45,7 @@ class ServiceCreateSerializer(serializers.ModelSerializer):
         model = Service
         fields = [
             'name', 'description', 'category',
-            'price', 'is_active', 'items'
+            'price', 'duration_minutes', 'is_active', 'items'
         ]
     
     def create(self, validated_data):
@@ -64,7 +64,7 @@ class ServiceListSerializer(serializers.ModelSerializer):
     """
     class Meta:
         model = Service
-        fields = ['id', 'name', 'category', 'price', 'is_active']
+        fields = ['id', 'name', 'category', 'price', 'duration_minutes', 'is_active']
 
 
 class AvailabilitySerializer(serializers.ModelSerializer):
@@ -3,7 +3,8 @@ from workshop.models import User, Car
 
 # Serializer for car details
 class CarSerializer(serializers.ModelSerializer):
-    customer = serializers.UUIDField(source='customer.id')
+    # customer_id avoids loading the customer row for every car
+    customer = serializers.UUIDField(source='customer_id')
 
     class Meta:
         model = Car
@@ -1,5 +1,6 @@
 # workshop/serializers.py
 
+import logging
 import uuid
 
 from rest_framework import serializers
@@ -7,6 +8,8 @@ from workshop.helper import is_valid_email_domain, is_valid_phone_number
 from workshop.serializers.car_serializer import CarSerializer
 from workshop.models import User
 
+logger = logging.getLogger(__name__)
+
 # Customer Creation Serializer
 class CustomerCreateSerializer(serializers.ModelSerializer):
 
@@ -45,7 +48,7 @@ class CustomerCreateSerializer(serializers.ModelSerializer):
             
             return customer
         except Exception as e:
-            print(f"Error creating customer: {str(e)}")
+            logger.exception("Error creating customer")
             raise
     
     def validate(self, attrs):
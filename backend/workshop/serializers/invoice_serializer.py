@@ -1,12 +1,12 @@
+import logging
 from rest_framework import serializers
 
-from workshop.models.product import Product
-from workshop.models import User
-from workshop.models.invoice_items import InvoiceItems
-from workshop.models.product_variant import ProductVariant
 from workshop.serializers.invoice_item_serializer import InvoiceItemCreateSerializer, InvoiceItemSerializer
 from workshop.models.invoice import Invoice
 from workshop.serializers.customer_serializer import CustomerInvoiceSerializer
+from workshop.services.invoice_builder_service import InvoiceBuilder, InvoiceBuildError
+
+logger = logging.getLogger(__name__)
 
 # Invoice serializer for listing invoices
 class InvoiceSerializer(serializers.ModelSerializer):
@@ -31,7 +31,7 @@ class InvoiceSerializer(serializers.ModelSerializer):
         """
         Fetch all product items for the booking service related to this invoice, with defensive checks.
         """
-        items = []
+        items = self.get_product_items(obj.items.all())
         booking = getattr(obj, 'bookings', None)
         if not booking:
             return items
@@ -59,8 +59,15 @@ class InvoiceSerializer(serializers.ModelSerializer):
         except Exception:
             pass
         # Add all product items linked to this booking service
+        if hasattr(booking_service, 'items'):
+            items.extend(self.get_product_items(booking_service.items.all()))
+        return items
+
+    @staticmethod
+    def get_product_items(invoice_items):
+        items = []
         try:
-            for invoice_item in getattr(booking_service, 'items', []).all() if hasattr(booking_service, 'items') else []:
+            for invoice_item in invoice_items:
                 pv = getattr(invoice_item, 'product_variant', None)
                 items.append({
                     'id': str(getattr(invoice_item, 'id', '')),
@@ -103,68 +110,21 @@ class InvoiceCreateSerializer(serializers.ModelSerializer):
         ]
 
     def validate(self, data):
-        print("=== INVOICE VALIDATE METHOD ===")
-        print("Input data:", data)
-        print("Data keys:", list(data.keys()))
-        
         # Map frontend fields to model fields
         if 'discount' in data:
-            print("Mapping discount to discount_amount")
             data['discount_amount'] = data.pop('discount')
         if 'grand_total' in data:
-            print("Mapping grand_total to total_amount")
             data['total_amount'] = data.pop('grand_total')
-        
-        print("Output data after mapping:", data)
-        print("=== END VALIDATE ===")
         return data
 
     def create(self, validated_data):
-        # Extract items data and customer_id
-        items_data = validated_data.pop('items')
-        customer_id = validated_data.pop('customer_id')
-
-        # Get the customer
-        try:
-            customer = User.objects.get(id=customer_id, role=User.Role.customer)
-        except User.DoesNotExist:
-            raise serializers.ValidationError({"customer_id": "Customer not found."})
-
-        # Step 1: Create the invoice first
+        # Totals are recomputed from variant prices; client subtotal / grand_total are not trusted
         try:
-            invoice = Invoice.objects.create(
-                user=customer,
-                subtotal=validated_data.get('subtotal', 0),
+            return InvoiceBuilder().build(
+                customer_id=validated_data['customer_id'],
+                items=validated_data['items'],
                 discount_amount=validated_data.get('discount_amount', 0),
-                total_amount=validated_data.get('total_amount', 0),
-                status=validated_data.get('status', 'pending')
+                status=validated_data.get('status', Invoice.Status.PENDING),
             )
-            print(f"Created invoice: {invoice}")
-        except Exception as e:
-            print(f"Error creating invoice: {e}")
-            raise serializers.ValidationError({"invoice": f"Error creating invoice: {str(e)}"})
-
-        # Step 2: Create invoice items
-        for item_data in items_data:
-            try:
-                # Map total_price to total_amount for each item
-                if 'total_price' in item_data:
-                    item_data['total_amount'] = item_data.pop('total_price')
-                
-                # Get the product variant
-                product_variant = ProductVariant.objects.get(id=item_data['product_variant'])
-                
-                # Create the invoice item
-                item = InvoiceItems.objects.create(
-                    invoice=invoice,
-                    product_variant=product_variant,
-                    quantity=item_data['quantity'],
-                    unit_price=item_data.get('unit_price', product_variant.price),
-                    total_amount=item_data.get('total_amount', 0)
-                )
-                print(f"Created item: {item}")
-            except Exception as e:
-                print(f"Error creating item: {e}")
-                raise serializers.ValidationError({"items": f"Error creating item: {str(e)}"})
-
-        return invoice
\ No newline at end of file
+        except InvoiceBuildError as e:
+            raise serializers.ValidationError(e.errors)
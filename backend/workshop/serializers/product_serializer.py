@@ -1,10 +1,13 @@
 # serializers/product_serializer.py
+import logging
 from rest_framework import serializers
 from workshop.models.product import Product
 from workshop.models.product_variant import ProductVariant
 from workshop.services.stock_movement_service import StockMovementService
 from django.db import transaction
 
+logger = logging.getLogger(__name__)
+
 # Serializer for product variants
 class ProductVariantSerializer(serializers.ModelSerializer):
     class Meta:
@@ -19,6 +22,21 @@ class ProductSerializer(serializers.ModelSerializer):
         model = Product
         fields = ['id', 'name', 'category', 'created_at', 'variants']
 
+# Catalog listing row: product, its variants and stock totals annotated by product_queries.get_catalog
+class CatalogProductSerializer(serializers.ModelSerializer):
+    variants = ProductVariantSerializer(many=True, read_only=True)
+    variant_count = serializers.IntegerField(read_only=True)
+    total_stock = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    stock_value = serializers.DecimalField(max_digits=14, decimal_places=2, read_only=True)
+    low_stock_variants = serializers.IntegerField(read_only=True)
+
+    class Meta:
+        model = Product
+        fields = [
+            'id', 'name', 'category', 'created_at',
+            'variant_count', 'total_stock', 'stock_value', 'low_stock_variants', 'variants',
+        ]
+
 class ProductVariantCreateSerializer(serializers.ModelSerializer):
     class Meta:
         model = ProductVariant
@@ -62,7 +80,7 @@ class ProductCreateSerializer(serializers.ModelSerializer):
                 
                 if error:
                     # Log the error but don't fail the product creation
-                    print(f"Warning: Failed to create initial stock movement: {error}")
+                    logger.warning("Initial stock movement for product %s failed: %s", product.id, error)
             
             return product
     
@@ -74,4 +92,15 @@ class VariantStockUpdateSerializer(serializers.ModelSerializer):
 class ProductInvoiceItemSerializer(serializers.ModelSerializer):
     class Meta:
         model = Product
-        fields = ['name']
\ No newline at end of file
+        fields = ['name']
+# One row of a catalog import file (see CatalogImportService)
+class CatalogImportRowSerializer(serializers.Serializer):
+    product_name = serializers.CharField(max_length=100)
+    category = serializers.ChoiceField(choices=Product.CATEGORY_CHOICES)
+    variant_name = serializers.CharField(max_length=30)
+    sku = serializers.CharField(max_length=50, required=False, allow_blank=True, allow_null=True, default='')
+    price = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0)
+    quantity = serializers.DecimalField(max_digits=10, decimal_places=2, min_value=0, required=False, default=0)
+
+    def validate_sku(self, value):
+        return (value or '').strip()
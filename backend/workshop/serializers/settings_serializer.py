@@ -4,6 +4,7 @@ from rest_framework import serializers
 from django.contrib.auth import authenticate
 from django.contrib.auth.password_validation import validate_password
 from workshop.models.settings import BusinessSettings
+from workshop.models.holiday import Holiday
 
 
 class BusinessSettingsSerializer(serializers.ModelSerializer):
@@ -38,6 +39,14 @@ class BusinessSettingsSerializer(serializers.ModelSerializer):
         return value
 
 
+class HolidaySerializer(serializers.ModelSerializer):
+
+    class Meta:
+        model = Holiday
+        fields = ['id', 'date', 'name', 'created_at']
+        read_only_fields = ['id', 'created_at']
+
+
 class ChangePasswordSerializer(serializers.Serializer):
     current_password = serializers.CharField(write_only=True)
     new_password = serializers.CharField(write_only=True)
@@ -7,6 +7,9 @@ from django.utils import timezone
 from datetime import datetime, timedelta
 from workshop.models import Invoice, BookingService, PaySlip, Expense, Booking, InvoiceItems
 from workshop.queries.analytics_queries import AnalyticsQueries
+from workshop.queries import customer_analytics_queries as caq
+from workshop.queries import booking_event_queries as beq
+from workshop import metrics
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,13 @@ class AnalyticsService:
     
     CACHE_TIMEOUT = 300
 
+    @staticmethod
+    def _cache_get(cache_key, report):
+        """cache.get that also counts hits and misses per report"""
+        cached_data = cache.get(cache_key)
+        metrics.ANALYTICS_CACHE.labels(report, 'miss' if cached_data is None else 'hit').inc()
+        return cached_data
+
 
     def analytics():
         total_sales = Invoice.objects.filter(status='paid').aggregate(total=Sum('total_amount'))['total'] or 0
@@ -41,9 +51,9 @@ class AnalyticsService:
         
         try:
             # Try to get from cache first
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'monthly_report')
             if cached_data is not None:
-                logger.info(f"Retrieved monthly report from cache for {month} {year}")
+                logger.debug("Retrieved monthly report from cache for %s %s", month, year)
                 return cached_data
             
             # Convert month name to number
@@ -225,12 +235,12 @@ class AnalyticsService:
             
             # Cache the result
             cache.set(cache_key, report_data, cls.CACHE_TIMEOUT)
-            logger.info(f"Generated and cached monthly report for {month} {year}")
+            logger.info("Generated and cached monthly report for %s %s", month, year)
             
             return report_data
             
         except Exception as e:
-            logger.error(f"Error generating monthly analytics report: {str(e)}")
+            logger.error("Error generating monthly analytics report: %s", e)
             return {}
 
     @classmethod
@@ -239,9 +249,9 @@ class AnalyticsService:
         
         try:
             # Try to get from cache first
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'monthly_revenue')
             if cached_data is not None:
-                logger.info(f"Retrieved monthly revenue data from cache for {months} months")
+                logger.debug("Retrieved monthly revenue data from cache for %s months", months)
                 return cached_data
             
             # If not in cache, get from database
@@ -249,12 +259,12 @@ class AnalyticsService:
             
             # Cache the result
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info(f"Cached monthly revenue data for {months} months")
+            logger.debug("Cached monthly revenue data for %s months", months)
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting monthly revenue data: {str(e)}")
+            logger.error("Error getting monthly revenue data: %s", e)
             return []
     
     @classmethod
@@ -262,19 +272,19 @@ class AnalyticsService:
         cache_key = f"analytics_daily_bookings_{days}"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'daily_bookings')
             if cached_data is not None:
-                logger.info(f"Retrieved daily bookings data from cache for {days} days")
+                logger.debug("Retrieved daily bookings data from cache for %s days", days)
                 return cached_data
             
             data = AnalyticsQueries.get_daily_bookings(days)
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info(f"Cached daily bookings data for {days} days")
+            logger.debug("Cached daily bookings data for %s days", days)
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting daily bookings data: {str(e)}")
+            logger.error("Error getting daily bookings data: %s", e)
             return []
     
     @classmethod
@@ -282,19 +292,19 @@ class AnalyticsService:
         cache_key = f"analytics_top_services_{limit}"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'top_services')
             if cached_data is not None:
-                logger.info(f"Retrieved top services data from cache (limit: {limit})")
+                logger.debug("Retrieved top services data from cache (limit: %s)", limit)
                 return cached_data
             
             data = AnalyticsQueries.get_top_services(limit)
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info(f"Cached top services data (limit: {limit})")
+            logger.debug("Cached top services data (limit: %s)", limit)
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting top services data: {str(e)}")
+            logger.error("Error getting top services data: %s", e)
             return []
     
     @classmethod
@@ -302,19 +312,19 @@ class AnalyticsService:
         cache_key = "analytics_car_types_distribution"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'car_types_distribution')
             if cached_data is not None:
-                logger.info("Retrieved car types distribution data from cache")
+                logger.debug("Retrieved car types distribution data from cache")
                 return cached_data
             
             data = AnalyticsQueries.get_car_types_distribution()
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info("Cached car types distribution data")
+            logger.debug("Cached car types distribution data")
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting car types distribution data: {str(e)}")
+            logger.error("Error getting car types distribution data: %s", e)
             return []
     
     @classmethod
@@ -322,19 +332,19 @@ class AnalyticsService:
         cache_key = "analytics_yearly_car_distribution"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'yearly_car_distribution')
             if cached_data is not None:
-                logger.info("Retrieved yearly car distribution data from cache")
+                logger.debug("Retrieved yearly car distribution data from cache")
                 return cached_data
             
             data = AnalyticsQueries.get_yearly_car_distribution()
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info("Cached yearly car distribution data")
+            logger.debug("Cached yearly car distribution data")
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting yearly car distribution data: {str(e)}")
+            logger.error("Error getting yearly car distribution data: %s", e)
             return []
     
     @classmethod
@@ -342,19 +352,19 @@ class AnalyticsService:
         cache_key = f"analytics_profitable_services_{limit}"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'profitable_services')
             if cached_data is not None:
-                logger.info(f"Retrieved profitable services data from cache (limit: {limit})")
+                logger.debug("Retrieved profitable services data from cache (limit: %s)", limit)
                 return cached_data
             
             data = AnalyticsQueries.get_profitable_services(limit)
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info(f"Cached profitable services data (limit: {limit})")
+            logger.debug("Cached profitable services data (limit: %s)", limit)
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting profitable services data: {str(e)}")
+            logger.error("Error getting profitable services data: %s", e)
             return []
     
     @classmethod
@@ -362,19 +372,19 @@ class AnalyticsService:
         cache_key = f"analytics_popular_services_{limit}"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'popular_services')
             if cached_data is not None:
-                logger.info(f"Retrieved popular services data from cache (limit: {limit})")
+                logger.debug("Retrieved popular services data from cache (limit: %s)", limit)
                 return cached_data
             
             data = AnalyticsQueries.get_popular_services(limit)
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info(f"Cached popular services data (limit: {limit})")
+            logger.debug("Cached popular services data (limit: %s)", limit)
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting popular services data: {str(e)}")
+            logger.error("Error getting popular services data: %s", e)
             return []
     
     @classmethod
@@ -382,19 +392,19 @@ class AnalyticsService:
         cache_key = f"analytics_top_spare_parts_{limit}"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'top_spare_parts')
             if cached_data is not None:
-                logger.info(f"Retrieved top spare parts data from cache (limit: {limit})")
+                logger.debug("Retrieved top spare parts data from cache (limit: %s)", limit)
                 return cached_data
             
             data = AnalyticsQueries.get_top_spare_parts(limit)
             cache.set(cache_key, data, cls.CACHE_TIMEOUT)
-            logger.info(f"Cached top spare parts data (limit: {limit})")
+            logger.debug("Cached top spare parts data (limit: %s)", limit)
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting top spare parts data: {str(e)}")
+            logger.error("Error getting top spare parts data: %s", e)
             return []
     
     @classmethod
@@ -402,21 +412,21 @@ class AnalyticsService:
         cache_key = "analytics_metrics"
         
         try:
-            cached_data = cache.get(cache_key)
+            cached_data = cls._cache_get(cache_key, 'metrics')
             if cached_data is not None:
-                logger.info("Retrieved analytics metrics data from cache")
+                logger.debug("Retrieved analytics metrics data from cache")
                 return cached_data
             
             data = AnalyticsQueries.get_analytics_metrics()
             
             # Use shorter cache timeout for metrics (2 minutes) as they change more frequently
             cache.set(cache_key, data, 120)
-            logger.info("Cached analytics metrics data")
+            logger.debug("Cached analytics metrics data")
             
             return data
             
         except Exception as e:
-            logger.error(f"Error getting analytics metrics data: {str(e)}")
+            logger.error("Error getting analytics metrics data: %s", e)
             return {
                 'monthlyRevenue': 0,
                 'totalBookings': 0,
@@ -428,6 +438,95 @@ class AnalyticsService:
                 'servicesChange': 0,
             }
     
+    @classmethod
+    def get_customer_cohorts(cls, months: int = 12) -> List[Dict[str, Any]]:
+        cache_key = f"analytics_customer_cohorts_{months}"
+        
+        try:
+            cached_data = cls._cache_get(cache_key, 'customer_cohorts')
+            if cached_data is not None:
+                logger.debug("Retrieved customer cohorts from cache (%s months)", months)
+                return cached_data
+            
+            data = caq.get_cohort_report(months)
+            cache.set(cache_key, data, cls.CACHE_TIMEOUT)
+            logger.debug("Cached customer cohorts (%s months)", months)
+            
+            return data
+            
+        except Exception as e:
+            logger.error("Error getting customer cohorts: %s", e)
+            return []
+    
+    @classmethod
+    def get_customer_lifetime_value(cls, limit: int = 20) -> List[Dict[str, Any]]:
+        cache_key = f"analytics_customer_ltv_{limit}"
+        
+        try:
+            cached_data = cls._cache_get(cache_key, 'customer_ltv')
+            if cached_data is not None:
+                logger.debug("Retrieved customer lifetime value from cache (limit: %s)", limit)
+                return cached_data
+            
+            data = caq.get_top_customers_by_value(limit)
+            cache.set(cache_key, data, cls.CACHE_TIMEOUT)
+            logger.debug("Cached customer lifetime value (limit: %s)", limit)
+            
+            return data
+            
+        except Exception as e:
+            logger.error("Error getting customer lifetime value: %s", e)
+            return []
+    
+    @classmethod
+    def get_booking_time_in_state(cls, days: int = 30) -> Dict[str, Any]:
+        cache_key = f"analytics_booking_time_in_state_{days}"
+        
+        try:
+            cached_data = cls._cache_get(cache_key, 'booking_time_in_state')
+            if cached_data is not None:
+                logger.debug("Retrieved booking time in state from cache (%s days)", days)
+                return cached_data
+            
+            data = beq.get_time_in_state(days)
+            cache.set(cache_key, data, cls.CACHE_TIMEOUT)
+            logger.debug("Cached booking time in state (%s days)", days)
+            
+            return data
+            
+        except Exception as e:
+            logger.error("Error getting booking time in state: %s", e)
+            return {'days': days, 'states': [], 'completed': 0, 'average_turnaround_hours': None}
+    
+    @classmethod
+    def get_booking_throughput(cls, days: int = 30) -> List[Dict[str, Any]]:
+        cache_key = f"analytics_booking_throughput_{days}"
+        
+        try:
+            cached_data = cls._cache_get(cache_key, 'booking_throughput')
+            if cached_data is not None:
+                logger.debug("Retrieved booking throughput from cache (%s days)", days)
+                return cached_data
+            
+            data = beq.get_daily_throughput(days)
+            cache.set(cache_key, data, cls.CACHE_TIMEOUT)
+            logger.debug("Cached booking throughput (%s days)", days)
+            
+            return data
+            
+        except Exception as e:
+            logger.error("Error getting booking throughput: %s", e)
+            return []
+    
+    @classmethod
+    def get_booking_sla_breaches(cls, limit: int = 100) -> List[Dict[str, Any]]:
+        # Not cached: the list is acted on and should drop a booking as soon as it moves
+        try:
+            return beq.get_sla_breaches(limit)
+        except Exception as e:
+            logger.error("Error getting booking SLA breaches: %s", e)
+            return []
+    
     @classmethod
     def clear_analytics_cache(cls) -> None:
         try:
@@ -449,4 +548,4 @@ class AnalyticsService:
             logger.info("Cleared all analytics cache data")
             
         except Exception as e:
-            logger.error(f"Error clearing analytics cache: {str(e)}")
+            logger.error("Error clearing analytics cache: %s", e)
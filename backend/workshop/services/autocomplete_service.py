@@ -0,0 +1,340 @@
+# workshop/services/autocomplete_service.py
+import re
+import time
+import logging
+import threading
+from bisect import bisect_left
+
+from django.conf import settings
+from django.contrib.postgres.search import TrigramSimilarity
+from django.db import connection
+from django.db.models import Q
+
+from workshop.models import User, Car
+
+logger = logging.getLogger(__name__)
+
+
+_NON_DIGITS = re.compile(r'\D')
+_NON_ALNUM = re.compile(r'[^0-9A-Z]')
+
+
+def normalize_name(value):
+    return (value or '').casefold().split()
+
+
+def normalize_phone(value):
+    """Digits of a phone number, plus the local 03... form of a +92 number"""
+    digits = _NON_DIGITS.sub('', str(value or ''))
+    if not digits:
+        return []
+    if digits.startswith('92'):
+        return [digits, '0' + digits[2:]]
+    return [digits]
+
+
+def normalize_plate(value):
+    return _NON_ALNUM.sub('', (value or '').upper())
+
+
+class PrefixIndex:
+    """
+    Sorted parallel arrays of (key, id); a prefix query is one bisect plus a short scan.
+    An id can appear under several keys (every word of a name, both phone forms).
+    """
+
+    def __init__(self):
+        self.keys = []
+        self.ids = []
+        self.keys_by_id = {}
+
+    def add(self, id, keys):
+        self.remove(id)
+        keys = sorted(set(k for k in keys if k))
+        for key in keys:
+            position = bisect_left(self.keys, key)
+            self.keys.insert(position, key)
+            self.ids.insert(position, id)
+        if keys:
+            self.keys_by_id[id] = keys
+
+    def remove(self, id):
+        for key in self.keys_by_id.pop(id, ()):
+            position = bisect_left(self.keys, key)
+            while position < len(self.keys) and self.keys[position] == key:
+                if self.ids[position] == id:
+                    del self.keys[position]
+                    del self.ids[position]
+                    break
+                position += 1
+
+    def load(self, rows):
+        """Bulk build from (id, keys) rows; one sort instead of repeated inserts"""
+        pairs = []
+        self.keys_by_id = {}
+        for id, keys in rows:
+            keys = sorted(set(k for k in keys if k))
+            if keys:
+                self.keys_by_id[id] = keys
+                pairs.extend((key, id) for key in keys)
+        pairs.sort(key=lambda pair: pair[0])
+        self.keys = [key for key, _ in pairs]
+        self.ids = [id for _, id in pairs]
+
+    def search(self, prefix, limit):
+        found = []
+        position = bisect_left(self.keys, prefix)
+        while position < len(self.keys) and self.keys[position].startswith(prefix):
+            id = self.ids[position]
+            if id not in found:
+                found.append(id)
+                if len(found) >= limit:
+                    break
+            position += 1
+        return found
+
+
+class AutocompleteIndex:
+    """
+    Per-process prefix index over customer names, customer phone numbers and car license plates.
+
+    Kept current by the signals in workshop/signals.py for saves made in this process, and
+    rebuilt after AUTOCOMPLETE_REFRESH_SECONDS to pick up writes from other workers and bulk
+    operations that skip signals. Builds run on a background thread, never in a request:
+    until the first build finishes searches fall back to the database, and during a rebuild
+    the previous index keeps serving. Writes signalled while a build reads the tables are
+    replayed onto the new index before it is swapped in.
+    """
+
+    # After a failed build, requests wait this long before starting another
+    RETRY_SECONDS = 30
+
+    def __init__(self):
+        self._lock = threading.RLock()
+        self._build_lock = threading.Lock()
+        self._built_at = None
+        self._failed_at = None
+        self._pending = None  # writes seen during a background build, or None when not building
+        self.customers = {}
+        self.cars = {}
+        self.names = PrefixIndex()
+        self.phones = PrefixIndex()
+        self.plates = PrefixIndex()
+
+    @property
+    def is_built(self):
+        return self._built_at is not None
+
+    @property
+    def tracks_writes(self):
+        """Whether signalled writes matter: an index exists or one is being built"""
+        return self._built_at is not None or self._pending is not None
+
+    def ensure_fresh(self):
+        """Start a background rebuild when the index is missing or stale; never waits for it"""
+        now = time.monotonic()
+        max_age = getattr(settings, 'AUTOCOMPLETE_REFRESH_SECONDS', 300)
+        if self._built_at is not None and now - self._built_at <= max_age:
+            return
+        if self._failed_at is not None and now - self._failed_at < self.RETRY_SECONDS:
+            return
+        if not self._build_lock.acquire(blocking=False):
+            return  # a rebuild is already running
+        with self._lock:
+            self._pending = []
+        threading.Thread(target=self._rebuild_in_background, name='autocomplete-rebuild', daemon=True).start()
+
+    def _rebuild_in_background(self):
+        try:
+            self.rebuild()
+            self._failed_at = None
+        except Exception:
+            logger.exception("Autocomplete index rebuild failed")
+            with self._lock:
+                self._pending = None
+            self._failed_at = time.monotonic()
+        finally:
+            # The thread got its own database connection; don't leave it open
+            connection.close()
+            self._build_lock.release()
+
+    def rebuild(self):
+        started = time.perf_counter()
+        customers = {
+            id: (name, str(phone) if phone else '')
+            for id, name, phone in User.objects.filter(role=User.Role.customer, is_active=True)
+            .values_list('id', 'name', 'phone_number').iterator(chunk_size=5000)
+        }
+        cars = {
+            id: (plate, make, model, year, customer_id)
+            for id, plate, make, model, year, customer_id in Car.objects.filter(is_active=True)
+            .values_list('id', 'license_plate', 'make', 'model', 'year', 'customer_id').iterator(chunk_size=5000)
+        }
+
+        names, phones, plates = PrefixIndex(), PrefixIndex(), PrefixIndex()
+        names.load((id, normalize_name(name)) for id, (name, _) in customers.items())
+        phones.load((id, normalize_phone(phone)) for id, (_, phone) in customers.items())
+        plates.load((id, [normalize_plate(car[0])]) for id, car in cars.items())
+
+        with self._lock:
+            self.customers, self.cars = customers, cars
+            self.names, self.phones, self.plates = names, phones, plates
+            for operation, args in self._pending or ():
+                operation(*args)
+            self._pending = None
+            self._built_at = time.monotonic()
+
+        logger.info(
+            "Autocomplete index built customers=%d cars=%d in %.0f ms",
+            len(customers), len(cars), (time.perf_counter() - started) * 1000
+        )
+
+    def _apply(self, operation, *args):
+        with self._lock:
+            if self._pending is not None:
+                self._pending.append((operation, args))
+            operation(*args)
+
+    def upsert_customer(self, user):
+        self._apply(self._upsert_customer, user)
+
+    def remove_customer(self, customer_id):
+        self._apply(self._remove_customer, customer_id)
+
+    def _upsert_customer(self, user):
+        if user.role != User.Role.customer or not user.is_active:
+            self._remove_customer(user.pk)
+            return
+        phone = str(user.phone_number) if user.phone_number else ''
+        self.customers[user.pk] = (user.name, phone)
+        self.names.add(user.pk, normalize_name(user.name))
+        self.phones.add(user.pk, normalize_phone(phone))
+
+    def _remove_customer(self, customer_id):
+        self.customers.pop(customer_id, None)
+        self.names.remove(customer_id)
+        self.phones.remove(customer_id)
+
+    def upsert_car(self, car):
+        self._apply(self._upsert_car, car)
+
+    def remove_car(self, car_id):
+        self._apply(self._remove_car, car_id)
+
+    def _upsert_car(self, car):
+        if not car.is_active:
+            self._remove_car(car.pk)
+            return
+        self.cars[car.pk] = (car.license_plate, car.make, car.model, car.year, car.customer_id)
+        self.plates.add(car.pk, [normalize_plate(car.license_plate)])
+
+    def _remove_car(self, car_id):
+        self.cars.pop(car_id, None)
+        self.plates.remove(car_id)
+
+    def search(self, term, limit, include_customers=True, include_cars=True):
+        self.ensure_fresh()
+        if not self.is_built:
+            return [], []
+        with self._lock:
+            customer_ids = []
+            if include_customers:
+                words = normalize_name(term)
+                if words:
+                    # Every word must prefix-match some word of the name: "ali kh" finds "Ali Khan"
+                    candidates = self.names.search(words[0], limit if len(words) == 1 else limit * 20)
+                    customer_ids = [
+                        id for id in candidates
+                        if all(any(part.startswith(word) for part in self.names.keys_by_id.get(id, ()))
+                               for word in words[1:])
+                    ][:limit]
+                digits = _NON_DIGITS.sub('', term)
+                if len(digits) >= 3 and len(customer_ids) < limit:
+                    for id in self.phones.search(digits, limit):
+                        if id not in customer_ids:
+                            customer_ids.append(id)
+                    customer_ids = customer_ids[:limit]
+
+            car_ids = []
+            plate = normalize_plate(term)
+            if include_cars and plate:
+                car_ids = self.plates.search(plate, limit)
+
+            return (
+                [self._customer_row(id) for id in customer_ids],
+                [self._car_row(id) for id in car_ids],
+            )
+
+    def _customer_row(self, id):
+        name, phone = self.customers[id]
+        return {'id': id, 'name': name, 'phone_number': phone}
+
+    def _car_row(self, id):
+        plate, make, model, year, customer_id = self.cars[id]
+        customer = self.customers.get(customer_id)
+        return {
+            'id': id,
+            'license_plate': plate,
+            'display_name': f"{year} {make} {model} ({plate})",
+            'customer_id': customer_id,
+            'customer_name': customer[0] if customer else None,
+        }
+
+
+autocomplete_index = AutocompleteIndex()
+
+
+class AutocompleteService:
+
+    @staticmethod
+    def search(term, limit=8, types=('customers', 'cars')):
+        term = (term or '').strip()
+        if not term:
+            return {'customers': [], 'cars': [], 'source': 'index'}
+
+        include_customers, include_cars = 'customers' in types, 'cars' in types
+        customers, cars = autocomplete_index.search(term, limit, include_customers, include_cars)
+        if customers or cars:
+            return {'customers': customers, 'cars': cars, 'source': 'index'}
+
+        # No prefix match: typos, infix matches, rows written by another worker since the last
+        # rebuild, or the index is still being built
+        return {
+            'customers': AutocompleteService.search_customers_db(term, limit) if include_customers else [],
+            'cars': AutocompleteService.search_cars_db(term, limit) if include_cars else [],
+            'source': 'database',
+        }
+
+    @classmethod
+    def search_customers_db(cls, term, limit):
+        rows = (
+            User.objects.filter(role=User.Role.customer, is_active=True)
+            .filter(Q(name__trigram_similar=term) | Q(name__icontains=term) | Q(phone_number__contains=term))
+            .annotate(similarity=TrigramSimilarity('name', term))
+            .order_by('-similarity', 'name')
+            .values('id', 'name', 'phone_number')[:limit]
+        )
+        return [
+            {'id': row['id'], 'name': row['name'], 'phone_number': str(row['phone_number'] or '')}
+            for row in rows
+        ]
+
+    @classmethod
+    def search_cars_db(cls, term, limit):
+        rows = (
+            Car.objects.filter(is_active=True)
+            .filter(Q(license_plate__trigram_similar=term) | Q(license_plate__icontains=term))
+            .annotate(similarity=TrigramSimilarity('license_plate', term))
+            .order_by('-similarity', 'license_plate')
+            .values('id', 'license_plate', 'make', 'model', 'year', 'customer_id', 'customer__name')[:limit]
+        )
+        return [
+            {
+                'id': row['id'],
+                'license_plate': row['license_plate'],
+                'display_name': f"{row['year']} {row['make']} {row['model']} ({row['license_plate']})",
+                'customer_id': row['customer_id'],
+                'customer_name': row['customer__name'],
+            }
+            for row in rows
+        ]
@@ -2,6 +2,7 @@
 from workshop.models.booking import Booking
 from workshop.models.car import Car
 from workshop.models.daily_availability import DailyAvailability
+from workshop.models.service import Service
 from workshop.serializers.booking_serializer import (
     BookingListSerializer, BookingDetailSerializer, 
     BookingCreateSerializer, BookingUpdateSerializer,
@@ -9,11 +10,14 @@ from workshop.serializers.booking_serializer import (
 from workshop.serializers.invoice_item_serializer import InvoiceItemsListSerializer
 from workshop.queries import booking_queries as bq
 from workshop.queries import daily_availability_queries as daq
-from workshop.helper.booking_helpers import (
-    handle_booking_status_change, 
-    is_booking_cancellable
-)
+from workshop.queries import booking_event_queries as beq
+from workshop.services.job_service import JobService
+from workshop.services.event_service import EventService
+from workshop.services.slot_scheduler_service import SlotScheduler
+from workshop.services.capacity_planner_service import CapacityPlanner
+from workshop.services.booking_transition_service import BookingTransitionService, Status
 from django.db.models import Q
+from django.core.exceptions import ValidationError
 from django.utils import timezone
 from datetime import datetime, date, timedelta
 
@@ -70,6 +74,7 @@ class BookingService:
         serializer = BookingCreateSerializer(data=data, context={'request': request})
         if serializer.is_valid():
             booking = serializer.save()
+            EventService.publish('booking.created', {'booking_id': str(booking.id)})
             return {
                 'message': 'Booking created successfully',
                 'booking_id': str(booking.id)
@@ -81,6 +86,13 @@ class BookingService:
         serializer = BookingCreateSerializer(data=data, context={'request': request})
         if serializer.is_valid():
             booking = serializer.save()
+            EventService.publish('booking.created', {'booking_id': str(booking.id)})
+            JobService.enqueue('notifications.fan_out', {
+                'title': 'New Booking Request',
+                'message': f'{booking.car.customer.name} requested a booking for their {booking.car.make} {booking.car.model}.',
+                'notification_type': 'booking',
+                'booking_id': str(booking.id),
+            })
             return {
                 'message': 'Customer booking created successfully',
                 'booking_id': str(booking.id)
@@ -104,37 +116,56 @@ class BookingService:
 
 
     # Update status of booking
-    def update_status(self, pk, new_status):
-        booking_service = bq.get_booking_for_update(pk)
-        if not booking_service:
-            return None, {'error': 'Booking not found'}
-
-        if booking_service.status != new_status:
-            booking_service.status = new_status
-            booking_service.save()
-        else:
-            return None, {'error': 'No changes detected'}
-        
+    def update_status(self, pk, new_status, user=None, notes=''):
+        result, errors = BookingTransitionService.transition([pk], new_status, user, notes)
+        if errors:
+            return None, errors
+        if result['rejected']:
+            return None, {'error': result['rejected'][0]['error']}
+
+        EventService.publish('booking.status_changed', {
+            'booking_id': str(pk),
+            'old_status': result['updated'][0]['old_status'],
+            'status': new_status,
+        })
         return {
             'message': 'Booking status updated successfully',
         }, None
 
 
+    # Move many bookings to one status in a single transaction
+    def bulk_update_status(self, booking_ids, new_status, user=None, notes=''):
+        if not isinstance(booking_ids, list):
+            return None, {'error': 'booking_ids must be a list'}
+        result, errors = BookingTransitionService.transition(booking_ids, new_status, user, notes)
+        if errors:
+            return None, errors
+
+        if result['updated']:
+            EventService.publish('booking.bulk_status_changed', {
+                'booking_ids': [row['booking_id'] for row in result['updated']],
+                'status': new_status,
+            })
+        return result, None
+
+
     def cancel_booking(self, pk, user, reason):
-        booking = bq.get_booking_for_update(pk)
-        if not booking:
-            return None, {'error': 'Booking not found'}
-            
-        if not is_booking_cancellable(booking):
-            return None, {'error': f'Cannot cancel booking with status: {booking.status}'}
-        
-        # Use helper function to handle cancellation
-        cancelled_booking = handle_booking_status_change(
-            booking, booking.status, 'cancelled', user, reason or 'Booking cancelled'
-        )
-        
+        result, errors = BookingTransitionService.transition([pk], Status.CANCELED, user, reason)
+        if errors:
+            return None, errors
+        if result['rejected']:
+            return None, {'error': result['rejected'][0]['error']}
+
+        EventService.publish('booking.status_changed', {
+            'booking_id': str(pk),
+            'old_status': result['updated'][0]['old_status'],
+            'status': Status.CANCELED,
+        })
         return {'message': 'Booking cancelled successfully'}, None
 
+    def get_booking_history(self, pk):
+        return beq.get_booking_history(pk)
+
     def get_booking_stats(self):
         return bq.get_booking_stats()
 
@@ -162,6 +193,48 @@ class BookingService:
         except Exception as e:
             return None, {'error': f'Error fetching available dates: {str(e)}'}
 
+    def resolve_schedulable_service(self, service_id):
+        if not service_id:
+            return None
+        try:
+            return Service.objects.filter(id=service_id, is_active=True).first()
+        except ValidationError:
+            return None
+
+    def get_time_slots(self, date_param, service_id, limit=None):
+        service = self.resolve_schedulable_service(service_id)
+        if service is None:
+            return None, {'error': 'A valid active service is required'}
+        try:
+            target_date = datetime.strptime(date_param or '', '%Y-%m-%d').date()
+        except ValueError:
+            return None, {'error': 'Invalid date format. Use YYYY-MM-DD'}
+        if not CapacityPlanner.in_horizon(target_date):
+            return None, {'error': f'Date must be within the next {CapacityPlanner.horizon_days()} days'}
+
+        return {
+            'date': target_date.isoformat(),
+            'service_id': str(service.id),
+            'duration_minutes': service.duration_minutes,
+            'slots': SlotScheduler.available_starts(target_date, service, limit),
+        }, None
+
+    def get_next_slot(self, service_id, start_date=None, days=14):
+        service = self.resolve_schedulable_service(service_id)
+        if service is None:
+            return None, {'error': 'A valid active service is required'}
+        try:
+            start_date = datetime.strptime(start_date, '%Y-%m-%d').date() if start_date else date.today()
+        except ValueError:
+            return None, {'error': 'Invalid date format. Use YYYY-MM-DD'}
+        if not CapacityPlanner.in_horizon(start_date):
+            return None, {'error': f'Start date must be within the next {CapacityPlanner.horizon_days()} days'}
+
+        slot = SlotScheduler.next_available(service, start_date, days)
+        if slot is None:
+            return None, {'error': f'No free time in the next {days} days'}
+        return {'service_id': str(service.id), 'duration_minutes': service.duration_minutes, 'slot': slot}, None
+
     def get_availability_for_date(self, date_param):
         if not date_param:
             return None, {'error': 'Date parameter is required (format: YYYY-MM-DD)'}
@@ -0,0 +1,195 @@
+# workshop/services/booking_transition_service.py
+import uuid
+import logging
+from collections import Counter
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import F, Max
+from django.db.models.functions import Greatest, Least
+from django.utils import timezone
+
+from workshop.models import Booking, BookingEvent, BookingService, DailyAvailability, Invoice
+from workshop.queries.customer_analytics_queries import record_visits, refresh_customers_month, month_start
+from workshop.services.invoice_number_service import invoice_numbers
+
+logger = logging.getLogger(__name__)
+
+Status = BookingService.Status
+
+# Statuses that hold one of the day's DailyAvailability slots
+SLOT_HOLDING = {Status.PENDING, Status.CONFIRMED, Status.IN_PROGRESS}
+
+ALLOWED_TRANSITIONS = {
+    Status.PENDING: {Status.CONFIRMED, Status.IN_PROGRESS, Status.COMPLETED, Status.CANCELED},
+    Status.CONFIRMED: {Status.PENDING, Status.IN_PROGRESS, Status.COMPLETED, Status.CANCELED},
+    Status.IN_PROGRESS: {Status.CONFIRMED, Status.COMPLETED, Status.CANCELED},
+    Status.COMPLETED: set(),
+    Status.CANCELED: set(),
+}
+
+
+def can_transition(from_status, to_status):
+    return to_status in ALLOWED_TRANSITIONS.get(from_status, ())
+
+
+class BookingTransitionService:
+    """
+    Moves many bookings to one status in a single transaction with set-based side effects.
+
+    The booking rows are locked and read in one query, and every booking whose current status
+    allows the move is updated with one UPDATE ... WHERE id IN. Slots freed or taken are
+    summed per day and applied with F() deltas, one UPDATE per distinct delta. Completed
+    bookings without an invoice get one, bulk created with a single block of invoice numbers.
+    Every move is appended to the BookingEvent log in the same transaction.
+    Bookings that cannot move are reported in `rejected` and left unchanged.
+    """
+
+    MAX_BATCH = 500
+
+    @classmethod
+    def transition(cls, booking_ids, new_status, user=None, notes=''):
+        if new_status not in Status.values:
+            return None, {'error': f"Unknown status '{new_status}'"}
+
+        booking_ids = list(dict.fromkeys(str(booking_id) for booking_id in booking_ids or []))
+        if not booking_ids:
+            return None, {'error': 'At least one booking id is required'}
+        if len(booking_ids) > cls.MAX_BATCH:
+            return None, {'error': f'At most {cls.MAX_BATCH} bookings can be updated at once'}
+
+        rejected, valid_ids = [], []
+        for booking_id in booking_ids:
+            try:
+                valid_ids.append(str(uuid.UUID(booking_id)))
+            except ValueError:
+                rejected.append({'booking_id': booking_id, 'error': 'Invalid booking id'})
+
+        with transaction.atomic():
+            rows = {
+                str(row['booking_id']): row
+                for row in BookingService.objects.select_for_update(of=('self',))
+                .filter(booking_id__in=valid_ids)
+                .values(
+                    'id', 'booking_id', 'status', 'price', 'product_items_price',
+                    'booking__invoice_id', 'booking__daily_availability_id', 'booking__car__customer_id',
+                    'booking__created_at',
+                )
+            }
+
+            moving = []
+            for booking_id in valid_ids:
+                row = rows.get(booking_id)
+                if row is None:
+                    rejected.append({'booking_id': booking_id, 'error': 'Booking not found'})
+                elif row['status'] == new_status:
+                    rejected.append({'booking_id': booking_id, 'error': 'No changes detected'})
+                elif not can_transition(row['status'], new_status):
+                    rejected.append({
+                        'booking_id': booking_id,
+                        'error': f"Cannot change status from {row['status']} to {new_status}",
+                    })
+                else:
+                    moving.append(row)
+
+            if moving:
+                BookingService.objects.filter(id__in=[row['id'] for row in moving]).update(status=new_status)
+                cls.apply_slot_deltas(moving, new_status)
+                cls.record_events(moving, new_status, user, notes)
+            invoices = cls.create_missing_invoices(moving) if new_status == Status.COMPLETED else []
+
+        if moving:
+            logger.info(
+                "Bookings moved to %s: %d updated, %d invoices created, %d rejected",
+                new_status, len(moving), len(invoices), len(rejected)
+            )
+        return {
+            'status': new_status,
+            'updated': [
+                {'booking_id': str(row['booking_id']), 'old_status': row['status']} for row in moving
+            ],
+            'invoices_created': len(invoices),
+            'rejected': rejected,
+        }, None
+
+    @staticmethod
+    def open_booking(booking, user=None):
+        """Log the event that opens a new booking; call in the transaction that creates it"""
+        return BookingEvent.objects.create(
+            booking=booking,
+            to_status=Status.PENDING,
+            created_at=booking.created_at or timezone.now(),
+            created_by=user,
+        )
+
+    @staticmethod
+    def record_events(moving, new_status, user=None, notes=''):
+        """Append one event per moved booking, each carrying the time its previous state began"""
+        entered = dict(
+            BookingEvent.objects.filter(booking_id__in=[row['booking_id'] for row in moving])
+            .values('booking_id')
+            .annotate(last=Max('created_at'))
+            .values_list('booking_id', 'last')
+            .order_by()
+        )
+        now = timezone.now()
+        BookingEvent.objects.bulk_create([
+            BookingEvent(
+                booking_id=row['booking_id'],
+                from_status=row['status'],
+                to_status=new_status,
+                created_at=now,
+                previous_at=entered.get(row['booking_id'], row['booking__created_at']),
+                created_by=user,
+                notes=notes or '',
+            )
+            for row in moving
+        ])
+
+    @staticmethod
+    def apply_slot_deltas(moving, new_status):
+        """Return or take DailyAvailability slots for bookings that stop or start holding one"""
+        deltas = Counter()
+        for row in moving:
+            held, holds = row['status'] in SLOT_HOLDING, new_status in SLOT_HOLDING
+            if held != holds:
+                deltas[row['booking__daily_availability_id']] += 1 if held else -1
+
+        days_by_delta = {}
+        for availability_id, delta in deltas.items():
+            if delta:
+                days_by_delta.setdefault(delta, []).append(availability_id)
+        for delta, availability_ids in days_by_delta.items():
+            DailyAvailability.objects.filter(id__in=availability_ids).update(
+                available_slots=Least(Greatest(F('available_slots') + delta, 0), F('total_slots'))
+            )
+
+    @staticmethod
+    def create_missing_invoices(moving):
+        missing = [row for row in moving if row['booking__invoice_id'] is None and row['booking__car__customer_id']]
+        if not missing:
+            return []
+
+        invoices = []
+        for row, number in zip(missing, invoice_numbers.allocate(len(missing))):
+            subtotal = row['price'] + row['product_items_price']
+            invoices.append(Invoice(
+                invoice_number=number,
+                user_id=row['booking__car__customer_id'],
+                subtotal=subtotal,
+                discount_amount=Decimal('0.00'),
+                total_amount=subtotal,
+                status=Invoice.Status.PENDING,
+            ))
+        Invoice.objects.bulk_create(invoices)
+        Booking.objects.bulk_update(
+            [Booking(id=row['booking_id'], invoice=invoice) for row, invoice in zip(missing, invoices)],
+            ['invoice'],
+        )
+
+        # bulk_create skips the Invoice signals that keep customer analytics current
+        visited_at = invoices[0].created_at
+        visits = Counter(invoice.user_id for invoice in invoices)
+        record_visits(visits, visited_at)
+        refresh_customers_month(list(visits), month_start(visited_at))
+        return invoices
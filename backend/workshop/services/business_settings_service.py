@@ -0,0 +1,138 @@
+# workshop/services/business_settings_service.py
+import re
+import time
+import logging
+import threading
+from datetime import datetime
+
+from django.conf import settings
+from django.core.cache import cache
+
+logger = logging.getLogger(__name__)
+
+
+DAYS = ('monday', 'tuesday', 'wednesday', 'thursday', 'friday', 'saturday', 'sunday')
+TIME_FORMATS = ('%I:%M %p', '%I %p', '%H:%M')
+_RANGE_SEPARATOR = re.compile(r'\s*(?:-|–|to)\s*', re.IGNORECASE)
+
+
+def parse_time(value):
+    value = value.strip().upper().replace('.', '')
+    for fmt in TIME_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).time()
+        except ValueError:
+            continue
+    raise ValueError(f"Unrecognised time '{value}'")
+
+
+def parse_day_hours(value):
+    """(opens, closes) for a working hours entry like '8:00 AM - 8:00 PM'; None when closed"""
+    if not value or str(value).strip().lower() == 'closed':
+        return None
+    parts = _RANGE_SEPARATOR.split(str(value).strip(), maxsplit=1)
+    if len(parts) != 2:
+        raise ValueError(f"Expected an 'opens - closes' range, got '{value}'")
+    opens, closes = parse_time(parts[0]), parse_time(parts[1])
+    if closes <= opens:
+        raise ValueError(f"Closing time must be after opening time in '{value}'")
+    return opens, closes
+
+
+class WorkingSchedule:
+    """
+    Working hours parsed once per settings version: weekday (0 = Monday) -> (opens, closes) or None.
+    Entries that cannot be parsed are logged and treated as closed.
+    """
+
+    def __init__(self, working_hours):
+        self.days = {}
+        for weekday, day in enumerate(DAYS):
+            try:
+                self.days[weekday] = parse_day_hours((working_hours or {}).get(day))
+            except ValueError as e:
+                logger.warning("Ignoring working hours for %s: %s", day, e)
+                self.days[weekday] = None
+
+    def hours_for(self, day):
+        return self.days[day.weekday()]
+
+    def is_open(self, day):
+        return self.days[day.weekday()] is not None
+
+    def minutes_open(self, day):
+        hours = self.hours_for(day)
+        if hours is None:
+            return 0
+        opens, closes = hours
+        return (closes.hour * 60 + closes.minute) - (opens.hour * 60 + opens.minute)
+
+
+class BusinessSettingsCache:
+    """
+    Process-local copy of the BusinessSettings row, backed by the shared cache.
+
+    Reads return the local copy; at most every BUSINESS_SETTINGS_CHECK_SECONDS a read also
+    compares the version stamp in the shared cache. Saves replace the stamp after commit
+    (see workshop/signals.py), and workers that see a new stamp load the row from the
+    shared cache, touching the database only when no worker has loaded that version yet.
+    A copy older than BUSINESS_SETTINGS_MAX_AGE_SECONDS is reloaded from the database even
+    when the stamp is unchanged, so a missed stamp (e.g. a cache flush) cannot pin old values.
+    The returned instance is shared and must be treated as read-only; writes go through
+    BusinessSettings.load().
+    """
+
+    VERSION_KEY = 'business_settings_version'
+    # Loaded rows are kept under their version; superseded ones simply expire
+    ROW_TIMEOUT = 60 * 60 * 24
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._version = None
+        self._instance = None
+        self._schedule = None
+        self._checked_at = None
+        self._loaded_at = None
+
+    def get(self):
+        self._refresh()
+        return self._instance
+
+    def schedule(self):
+        self._refresh()
+        return self._schedule
+
+    def invalidate(self):
+        cache.set(self.VERSION_KEY, time.time_ns(), None)
+        with self._lock:
+            self._checked_at = None
+
+    def _refresh(self):
+        max_age = getattr(settings, 'BUSINESS_SETTINGS_CHECK_SECONDS', 5)
+        if self._checked_at is not None and time.monotonic() - self._checked_at <= max_age:
+            return
+
+        version = cache.get_or_set(self.VERSION_KEY, time.time_ns(), None)
+        expired = (
+            self._loaded_at is not None
+            and time.monotonic() - self._loaded_at > getattr(settings, 'BUSINESS_SETTINGS_MAX_AGE_SECONDS', 300)
+        )
+        if version == self._version and self._instance is not None and not expired:
+            self._checked_at = time.monotonic()
+            return
+
+        key = f"business_settings:{version}"
+        instance = None if expired else cache.get(key)
+        if instance is None:
+            from workshop.models import BusinessSettings
+            instance = BusinessSettings.load()
+            cache.set(key, instance, self.ROW_TIMEOUT)
+            logger.debug("Business settings loaded from the database for version %s", version)
+
+        schedule = WorkingSchedule(instance.working_hours)
+        with self._lock:
+            self._instance, self._schedule, self._version = instance, schedule, version
+            self._checked_at = self._loaded_at = time.monotonic()
+
+
+business_settings = BusinessSettingsCache()
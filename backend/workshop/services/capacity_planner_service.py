@@ -0,0 +1,167 @@
+# workshop/services/capacity_planner_service.py
+import logging
+from datetime import date, timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Count, Max, Q
+
+from workshop.models import DailyAvailability, Holiday, Employee, Attendance, BusinessSettings
+
+logger = logging.getLogger(__name__)
+
+
+class CapacityPlanner:
+    """
+    Derives each day's booking capacity from working hours, holidays and available staff,
+    and keeps DailyAvailability rows in step with it.
+
+    A day's capacity is the number of CAPACITY_JOB_MINUTES jobs that fit into its opening
+    hours on each of CAPACITY_BAYS bays, further limited by the staff minutes available
+    when every job needs CAPACITY_STAFF_PER_JOB people. Staff are the active employees
+    minus those on leave or absent that day (a half day counts half); with no employees
+    on record the staff limit is skipped. Holidays and closed days get no capacity.
+
+    Missing rows are created a whole date range at a time with one bulk insert, and
+    existing future rows are recomputed with one bulk update when an input changes
+    (see workshop/signals.py). Existing bookings are kept: a day whose capacity drops
+    below its bookings keeps them and simply has no slots left.
+    """
+
+    @staticmethod
+    def horizon_days():
+        return getattr(settings, 'CAPACITY_HORIZON_DAYS', 60)
+
+    @staticmethod
+    def capacity_for(day, schedule, holidays, employees, absences):
+        minutes = schedule.minutes_open(day)
+        if day in holidays or minutes <= 0:
+            return 0
+
+        job_minutes = getattr(settings, 'CAPACITY_JOB_MINUTES', 100)
+        capacity = getattr(settings, 'CAPACITY_BAYS', 1) * (minutes // job_minutes)
+        if employees:
+            staff = max(employees - absences.get(day, 0), 0)
+            staff_per_job = getattr(settings, 'CAPACITY_STAFF_PER_JOB', 2)
+            capacity = min(capacity, int(staff * minutes // (job_minutes * staff_per_job)))
+        return capacity
+
+    @classmethod
+    def plan(cls, dates):
+        """Capacity per date for an iterable of dates, in four queries however many dates"""
+        dates = sorted(set(dates))
+        if not dates:
+            return {}
+        first, last = dates[0], dates[-1]
+
+        schedule = BusinessSettings.get_schedule()
+        holidays = set(Holiday.objects.filter(date__range=(first, last)).values_list('date', flat=True))
+        employees = Employee.objects.filter(is_active=True).count()
+        absences = {
+            row['date']: row['away'] + row['half_day'] / 2
+            for row in Attendance.objects.filter(date__range=(first, last), employee__is_active=True)
+            .values('date')
+            .annotate(
+                away=Count('id', filter=Q(status__in=['Absent', 'Leave'])),
+                half_day=Count('id', filter=Q(status='Half-Day')),
+            )
+        }
+        return {day: cls.capacity_for(day, schedule, holidays, employees, absences) for day in dates}
+
+    @classmethod
+    def ensure(cls, start_date, days):
+        """Create the range's missing DailyAvailability rows with planned capacity; returns created dates"""
+        dates = [start_date + timedelta(days=offset) for offset in range(days)]
+        existing = set(
+            DailyAvailability.objects.filter(date__range=(dates[0], dates[-1])).values_list('date', flat=True)
+        )
+        missing = [day for day in dates if day not in existing]
+        if not missing:
+            return []
+
+        capacities = cls.plan(missing)
+        # Another request may generate the same day concurrently; its row wins
+        DailyAvailability.objects.bulk_create(
+            [
+                DailyAvailability(date=day, total_slots=capacity, available_slots=capacity, is_available=capacity > 0)
+                for day, capacity in capacities.items()
+            ],
+            ignore_conflicts=True,
+        )
+        return missing
+
+    @classmethod
+    def generate(cls, start_date=None, days=None):
+        """Create missing rows for the horizon and bring existing future ones up to date"""
+        start_date = start_date or date.today()
+        days = days or cls.horizon_days()
+        created = cls.ensure(start_date, days)
+        updated = cls.recompute([start_date + timedelta(days=offset) for offset in range(days)])
+        return created, updated
+
+    @classmethod
+    def recompute(cls, dates=None):
+        """
+        Recompute capacity of existing future rows: the given dates, or every future row when
+        the inputs of all days change (working hours, headcount). Past days are left alone.
+        Returns the number of rows changed.
+        """
+        today = date.today()
+        if dates is None:
+            last = DailyAvailability.objects.filter(date__gte=today).aggregate(last=Max('date'))['last']
+            if last is None:
+                return 0
+            dates = [today + timedelta(days=offset) for offset in range((last - today).days + 1)]
+        else:
+            dates = [day for day in dates if day >= today]
+
+        capacities = cls.plan(dates)
+        if not capacities:
+            return 0
+
+        with transaction.atomic():
+            # Locked so concurrent book_slot / cancel_slot updates are not overwritten
+            rows = list(
+                DailyAvailability.objects.select_for_update()
+                .filter(date__in=list(capacities))
+                .order_by('date')
+            )
+            changed = []
+            for row in rows:
+                capacity = capacities[row.date]
+                booked = row.total_slots - row.available_slots
+                total = max(capacity, booked)
+                if (row.total_slots, row.available_slots, row.is_available) != (total, total - booked, capacity > 0):
+                    row.total_slots, row.available_slots, row.is_available = total, total - booked, capacity > 0
+                    changed.append(row)
+            DailyAvailability.objects.bulk_update(changed, ['total_slots', 'available_slots', 'is_available'])
+
+        if changed:
+            logger.info("Capacity recomputed for %d days, %d changed", len(rows), len(changed))
+        return len(changed)
+
+    @classmethod
+    def in_horizon(cls, day):
+        """Whether a date lies between today and the end of the planning horizon"""
+        today = date.today()
+        return today <= day < today + timedelta(days=cls.horizon_days())
+
+    @classmethod
+    def planned_day(cls, day):
+        """DailyAvailability for a date without writing: the stored row, or an unsaved one with planned capacity"""
+        availability = DailyAvailability.objects.filter(date=day).first()
+        if availability is None:
+            capacity = cls.plan([day])[day]
+            availability = DailyAvailability(
+                date=day, total_slots=capacity, available_slots=capacity, is_available=capacity > 0
+            )
+        return availability
+
+    @classmethod
+    def get_or_create_day(cls, day):
+        """DailyAvailability for a date, generated with planned capacity when missing"""
+        availability = DailyAvailability.objects.filter(date=day).first()
+        if availability is None:
+            cls.ensure(day, 1)
+            availability = DailyAvailability.objects.get(date=day)
+        return availability
@@ -0,0 +1,267 @@
+# workshop/services/catalog_import_service.py
+import csv
+import logging
+from itertools import islice
+
+import orjson
+from django.db import transaction
+
+from workshop.models import Product, ProductVariant, StockMovement
+from workshop.serializers.product_serializer import CatalogImportRowSerializer
+from workshop.services.sku_service import SkuAllocator
+from workshop.services.catalog_service import CatalogService
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogImportError(Exception):
+    """The import file itself is unreadable (as opposed to individual bad rows)"""
+
+
+class UnreadableRow:
+    """Stands in for a row that could not be decoded or parsed; reported like an invalid row"""
+
+    def __init__(self, message):
+        self.message = message
+
+
+class CatalogImportService:
+    """
+    Bulk product / variant import from CSV, JSON or JSON Lines.
+
+    Rows are read lazily and processed in chunks of `chunk_size`. Every chunk is validated,
+    then written in its own transaction with a handful of bulk statements: products are
+    matched by name (new ones bulk created), variants are upserted on SKU, and new variants
+    get their INITIAL stock movement in one bulk insert. Invalid rows, including lines that
+    are not UTF-8 or cannot be parsed, are reported with their row number and skipped; the
+    rest of the file is still imported. If the file becomes unreadable part way through, the
+    report says so and still counts the rows already committed.
+
+    Existing variants keep their quantity: stock levels only change through stock movements.
+    """
+
+    CHUNK_SIZE = 500
+    MAX_REPORTED_ERRORS = 500
+    FORMATS = ('csv', 'json', 'jsonl')
+
+    def __init__(self, chunk_size=None, created_by='Catalog import', dry_run=False):
+        self.chunk_size = chunk_size or self.CHUNK_SIZE
+        self.created_by = created_by
+        self.dry_run = dry_run
+        self.products = {}
+        self.seen_skus = set()
+        self.report = {'rows': 0, 'created': 0, 'updated': 0, 'failed': 0, 'errors': [], 'dry_run': dry_run}
+
+    # -- reading -------------------------------------------------------------------
+
+    @classmethod
+    def detect_format(cls, filename, requested=None):
+        fmt = (requested or filename.rsplit('.', 1)[-1]).lower()
+        if fmt == 'ndjson':
+            fmt = 'jsonl'
+        if fmt not in cls.FORMATS:
+            raise CatalogImportError(f"Unsupported format '{fmt}'; use one of {', '.join(cls.FORMATS)}")
+        return fmt
+
+    @classmethod
+    def iter_rows(cls, stream, fmt):
+        """
+        Yield row dicts from a binary stream without loading CSV / JSON Lines files whole;
+        rows that cannot be decoded or parsed are yielded as UnreadableRow
+        """
+        if fmt == 'csv':
+            yield from cls.iter_csv_rows(stream)
+        elif fmt == 'jsonl':
+            for number, line in enumerate(stream, start=1):
+                if line.strip():
+                    try:
+                        yield orjson.loads(line)
+                    except orjson.JSONDecodeError as exc:
+                        yield UnreadableRow(f"Line {number} is not valid JSON: {exc}")
+        else:
+            try:
+                rows = orjson.loads(stream.read())
+            except orjson.JSONDecodeError as exc:
+                raise CatalogImportError(f"File is not valid JSON: {exc}")
+            if not isinstance(rows, list):
+                raise CatalogImportError('A JSON import must be an array of row objects')
+            yield from rows
+
+    @staticmethod
+    def iter_csv_rows(stream):
+        """
+        CSV rows decoded a line at a time, so one line that is not UTF-8 or a malformed
+        record costs that row only instead of failing the whole upload
+        """
+        skipped = []
+
+        def decoded_lines():
+            for number, line in enumerate(stream, start=1):
+                try:
+                    yield line.decode('utf-8-sig' if number == 1 else 'utf-8')
+                except UnicodeDecodeError as exc:
+                    skipped.append(UnreadableRow(f"Line {number} is not valid UTF-8: {exc.reason}"))
+
+        reader = csv.DictReader(decoded_lines())
+        while True:
+            try:
+                row = next(reader)
+            except StopIteration:
+                break
+            except csv.Error as exc:
+                row = UnreadableRow(f"Could not be parsed: {exc}")
+            while skipped:
+                yield skipped.pop(0)
+            yield row
+        yield from skipped
+
+    # -- importing -----------------------------------------------------------------
+
+    def run(self, rows):
+        rows = iter(rows)
+        offset = 0
+        while True:
+            try:
+                chunk = list(islice(rows, self.chunk_size))
+            except CatalogImportError as e:
+                # Earlier chunks are committed; report them along with why reading stopped
+                self.report['error'] = str(e)
+                break
+            if not chunk:
+                break
+            self.import_chunk(chunk, offset)
+            offset += len(chunk)
+            self.report['rows'] = offset
+
+        if (self.report['created'] or self.report['updated']) and not self.dry_run:
+            # bulk_create sends no signals, so retire cached catalog pages here
+            CatalogService.invalidate()
+
+        logger.info(
+            "Catalog import rows=%d created=%d updated=%d failed=%d dry_run=%s",
+            self.report['rows'], self.report['created'], self.report['updated'], self.report['failed'], self.dry_run
+        )
+        return self.report
+
+    def import_chunk(self, chunk, offset):
+        valid = []
+        for index, row in enumerate(chunk, start=offset + 1):
+            if isinstance(row, UnreadableRow):
+                self.add_error(index, None, {'row': [row.message]})
+                continue
+            if not isinstance(row, dict):
+                self.add_error(index, None, {'row': ['Expected an object with column names as keys']})
+                continue
+            serializer = CatalogImportRowSerializer(data=row)
+            if not serializer.is_valid():
+                self.add_error(index, row.get('sku'), serializer.errors)
+                continue
+            data = serializer.validated_data
+            if data['sku']:
+                if data['sku'] in self.seen_skus:
+                    self.add_error(index, data['sku'], {'sku': ['Duplicate SKU earlier in this import']})
+                    continue
+                self.seen_skus.add(data['sku'])
+            valid.append((index, data))
+
+        if not valid:
+            return
+
+        try:
+            with transaction.atomic():
+                created, updated = self.write(valid)
+                if self.dry_run:
+                    transaction.set_rollback(True)
+        except Exception as e:
+            logger.exception("Catalog import chunk starting at row %d failed", valid[0][0])
+            for index, data in valid:
+                self.add_error(index, data['sku'], {'non_field_errors': [f'Chunk could not be saved: {e}']})
+            return
+
+        self.report['created'] += created
+        self.report['updated'] += updated
+
+    def write(self, valid):
+        products = self.resolve_products({data['product_name']: data['category'] for _, data in valid})
+
+        existing = set(
+            ProductVariant.objects.filter(sku__in=[data['sku'] for _, data in valid if data['sku']])
+            .values_list('sku', flat=True)
+        )
+
+        explicit, generated = [], []
+        for _, data in valid:
+            variant = ProductVariant(
+                product=products[data['product_name']],
+                variant_name=data['variant_name'],
+                sku=data['sku'],
+                price=data['price'],
+                quantity=data['quantity'],
+            )
+            (explicit if variant.sku else generated).append(variant)
+
+        # Explicit SKUs are upserted. Any that look generated move their counters first, so the
+        # SKUs reserved below cannot land on them
+        SkuAllocator.claim([variant.sku for variant in explicit])
+        ProductVariant.objects.bulk_create(
+            explicit,
+            update_conflicts=True,
+            unique_fields=['sku'],
+            update_fields=['product', 'variant_name', 'price'],
+        )
+
+        # SKU-less rows are always new variants; one statement reserves all their suffixes.
+        # A plain insert, so a generated SKU that still collides fails the chunk instead of
+        # overwriting an existing variant
+        SkuAllocator.assign(generated)
+        ProductVariant.objects.bulk_create(generated)
+
+        new_variants = [variant for variant in explicit if variant.sku not in existing] + generated
+
+        # Written directly: StockMovement.save() would lock each variant and add the quantity again
+        StockMovement.objects.bulk_create([
+            StockMovement(
+                product_variant=variant,
+                change_amount=variant.quantity,
+                reason='INITIAL',
+                quantity_before=0,
+                quantity_after=variant.quantity,
+                reference_id=f"Initial_Stock_{variant.id}",
+                created_by=self.created_by,
+            )
+            for variant in new_variants if variant.quantity > 0
+        ])
+        return len(new_variants), len(explicit) + len(generated) - len(new_variants)
+
+    def resolve_products(self, categories):
+        """Product per name: cached, existing (oldest wins) or bulk created"""
+        missing = [name for name in categories if name not in self.products]
+        if missing:
+            for product in Product.objects.filter(name__in=missing).order_by('-created_at'):
+                self.products[product.name] = product
+
+        to_create = [
+            Product(name=name, category=categories[name])
+            for name in categories if name not in self.products
+        ]
+        Product.objects.bulk_create(to_create)
+
+        to_update = []
+        for name, category in categories.items():
+            product = self.products.get(name)
+            if product is not None and product.category != category:
+                product.category = category
+                to_update.append(product)
+        Product.objects.bulk_update(to_update, ['category'])
+
+        # Cached only after the chunk commits, so a rolled back chunk leaves no phantom products
+        if not self.dry_run:
+            transaction.on_commit(lambda: self.products.update({p.name: p for p in to_create}))
+        return {**self.products, **{p.name: p for p in to_create}}
+
+    def add_error(self, row, sku, errors):
+        self.report['failed'] += 1
+        if len(self.report['errors']) < self.MAX_REPORTED_ERRORS:
+            self.report['errors'].append({'row': row, 'sku': sku or None, 'errors': errors})
+        else:
+            self.report['errors_truncated'] = True
@@ -0,0 +1,51 @@
+# workshop/services/catalog_service.py
+import time
+import logging
+
+from django.conf import settings
+from django.core.cache import cache
+
+from workshop.queries import product_queries as pq
+from workshop.services.stock_movement_service import StockMovementService
+
+logger = logging.getLogger(__name__)
+
+
+class CatalogService:
+    """
+    Cached catalog pages. Every cached page is keyed by the current catalog version,
+    which product, variant and stock changes replace, so a stock change retires all
+    cached pages at once instead of deleting keys one by one.
+    """
+
+    VERSION_KEY = 'catalog_version'
+
+    @classmethod
+    def version(cls):
+        return cache.get_or_set(cls.VERSION_KEY, time.time_ns(), None)
+
+    @classmethod
+    def invalidate(cls):
+        cache.set(cls.VERSION_KEY, time.time_ns(), None)
+
+    @classmethod
+    def cache_key(cls, request):
+        return f"catalog:{cls.version()}:{request.get_full_path()}"
+
+    @staticmethod
+    def get_catalog(params):
+        return pq.get_catalog(
+            category=params.get('category') or None,
+            search=params.get('search') or None,
+            low_stock_threshold=StockMovementService.LOW_STOCK_THRESHOLD,
+        )
+
+    @staticmethod
+    def get_cached_page(key):
+        return cache.get(key)
+
+    @staticmethod
+    def cache_page(key, data):
+        # Stored under the version read before the page was built, so a page that raced
+        # a stock change is already retired when it lands
+        cache.set(key, data, getattr(settings, 'CATALOG_CACHE_TIMEOUT', 300))
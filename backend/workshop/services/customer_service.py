@@ -19,7 +19,7 @@ class CustomerService(BaseService):
     # Get all customers
     def get_all_customers(self) -> Dict[str, Any]:
         try:
-            customers = User.objects.filter(role=User.Role.customer)
+            customers = cq.get_customer_directory()
             serializer = CustomerDetailSerializer(customers, many=True)
             return self.success_response(
                 message="Customers retrieved successfully",
@@ -45,16 +45,21 @@ class CustomerService(BaseService):
                 details=str(e)
             )
     
+    # Invoice customer picker: results for a search term are capped, the full list is not
+    INVOICE_PICKER_LIMIT = 50
+
     def get_customers_for_invoices(self, search_term: Optional[str] = None) -> Dict[str, Any]:
         try:
-            queryset = User.objects.filter(role=User.Role.customer)
+            queryset = User.objects.filter(role=User.Role.customer).only('id', 'email', 'name', 'phone_number')
             
+            queryset = queryset.order_by('name', 'id')
             if search_term:
+                # Only searches are capped; the dashboard's plain picker lists every customer
                 queryset = queryset.filter(
                     Q(name__icontains=search_term) |
                     Q(email__icontains=search_term) |
                     Q(phone_number__icontains=search_term)
-                )
+                )[:self.INVOICE_PICKER_LIMIT]
             
             serializer = CustomerInvoiceSerializer(queryset, many=True)
             return self.success_response(
@@ -67,6 +72,22 @@ class CustomerService(BaseService):
                 details=str(e)
             )
 
+    # Directory queryset, paginated by the view
+    def get_customer_directory(self, search_term: Optional[str] = None):
+        return cq.get_customer_directory(search_term)
+
+    def get_customer_typeahead(self, search_term: Optional[str], limit: int) -> Dict[str, Any]:
+        try:
+            return self.success_response(
+                message="Customers retrieved successfully",
+                data=cq.get_customer_typeahead(search_term, limit)
+            )
+        except Exception as e:
+            return self.error_response(
+                message="Failed to retrieve customers",
+                details=str(e)
+            )
+
     # Create Customer
     def create_customer(self, customer_data: Dict[str, Any]) -> Dict[str, Any]:
         try:
@@ -79,7 +100,6 @@ class CustomerService(BaseService):
                     data=CustomerDetailSerializer(customer).data
                 )
             else:
-                print('====================================', serializer.errors)
                 return self.error_response(
                     message="Invalid customer data",
                     details=serializer.errors
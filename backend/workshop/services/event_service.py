@@ -0,0 +1,215 @@
+# workshop/services/event_service.py
+import json
+import time
+import queue
+import select
+import logging
+import threading
+import uuid
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import connection, transaction
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+# PostgreSQL NOTIFY payloads are limited to 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+
+
+class LocalEventBus:
+    """
+    In-process pub/sub that every stream subscribes to. On PostgreSQL the process's LISTEN
+    thread feeds it; otherwise (tests, local sqlite) events are published to it directly
+    and only reach subscribers in the same process.
+    """
+
+    def __init__(self):
+        self._subscribers = set()
+        self._lock = threading.Lock()
+
+    def publish(self, event):
+        with self._lock:
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.put_nowait(event)
+            except queue.Full:
+                # Slow consumer; drop rather than block the publisher
+                pass
+
+    @contextmanager
+    def subscribe(self):
+        subscriber = queue.Queue(maxsize=1000)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            yield subscriber
+        finally:
+            with self._lock:
+                self._subscribers.discard(subscriber)
+
+
+local_bus = LocalEventBus()
+
+
+class EventService:
+    """
+    Publishes live events for the admin dashboard and streams them to SSE clients.
+
+    On PostgreSQL events travel over LISTEN/NOTIFY, so every gunicorn worker sees
+    events published by any other worker. Each worker process holds one LISTEN
+    connection, whose thread fans events out to the streams through the local bus, so
+    an open dashboard costs no database connection of its own. Events are sent after
+    the surrounding transaction commits, so clients never see changes that were rolled back.
+    """
+
+    CHANNEL = getattr(settings, 'EVENT_STREAM_CHANNEL', 'workshop_events')
+    LISTENER_RETRY_SECONDS = 5
+
+    _listener = None
+    _listener_lock = threading.Lock()
+
+    @staticmethod
+    def _uses_postgres():
+        return connection.vendor == 'postgresql'
+
+    @classmethod
+    def publish(cls, event_type, data=None, user_ids=None):
+        """
+        Queue an event for delivery once the current transaction commits.
+        `user_ids` limits delivery to those users; otherwise all admin streams receive it.
+        """
+        event = {
+            'id': uuid.uuid4().hex,
+            'type': event_type,
+            'data': data or {},
+            'ts': timezone.now().isoformat(),
+        }
+        if user_ids is not None:
+            event['user_ids'] = [str(user_id) for user_id in user_ids]
+
+        payload = json.dumps(event, cls=DjangoJSONEncoder)
+        if len(payload.encode('utf-8')) > MAX_PAYLOAD_BYTES:
+            # Too big for NOTIFY: tell clients something changed and let them refetch
+            event['data'] = {'truncated': True}
+            payload = json.dumps(event, cls=DjangoJSONEncoder)
+
+        transaction.on_commit(lambda: cls._send(payload))
+
+    @classmethod
+    def _send(cls, payload):
+        try:
+            if cls._uses_postgres():
+                with connection.cursor() as cursor:
+                    cursor.execute('SELECT pg_notify(%s, %s)', [cls.CHANNEL, payload])
+            else:
+                local_bus.publish(json.loads(payload))
+        except Exception as e:
+            # Live updates are best effort; never fail the request that triggered them
+            logger.warning("Failed to publish event: %s", e)
+
+    @classmethod
+    def listen(cls, heartbeat_seconds=15):
+        """
+        Yield events as dicts, or None every `heartbeat_seconds` without traffic.
+        Close the generator to unsubscribe.
+        """
+        if cls._uses_postgres():
+            cls._ensure_listener()
+        with local_bus.subscribe() as subscriber:
+            while True:
+                try:
+                    yield subscriber.get(timeout=heartbeat_seconds)
+                except queue.Empty:
+                    yield None
+
+    @classmethod
+    def _ensure_listener(cls):
+        """Start this process's LISTEN thread unless it is already running"""
+        with cls._listener_lock:
+            if cls._listener is None or not cls._listener.is_alive():
+                cls._listener = threading.Thread(target=cls._pump_postgres, name='event-listener', daemon=True)
+                cls._listener.start()
+
+    @classmethod
+    def _pump_postgres(cls):
+        """Relay NOTIFY events to the local bus for as long as the process lives"""
+        while True:
+            try:
+                for event in cls._listen_postgres(heartbeat_seconds=60):
+                    if event is not None:
+                        local_bus.publish(event)
+            except Exception as e:
+                logger.warning("Event listener lost its connection, reconnecting: %s", e)
+                time.sleep(cls.LISTENER_RETRY_SECONDS)
+
+    @classmethod
+    def _listen_postgres(cls, heartbeat_seconds):
+        import psycopg2
+        import psycopg2.extensions
+
+        db = settings.DATABASES['default']
+        conn = psycopg2.connect(
+            dbname=db['NAME'],
+            user=db['USER'],
+            password=db['PASSWORD'],
+            host=db['HOST'],
+            port=db['PORT'],
+        )
+        try:
+            conn.set_isolation_level(psycopg2.extensions.ISOLATION_LEVEL_AUTOCOMMIT)
+            with conn.cursor() as cursor:
+                cursor.execute(f'LISTEN "{cls.CHANNEL}"')
+
+            while True:
+                readable, _, _ = select.select([conn], [], [], heartbeat_seconds)
+                if not readable:
+                    yield None
+                    continue
+
+                conn.poll()
+                while conn.notifies:
+                    notify = conn.notifies.pop(0)
+                    try:
+                        yield json.loads(notify.payload)
+                    except ValueError:
+                        logger.warning("Ignoring malformed event payload on %s", cls.CHANNEL)
+        finally:
+            conn.close()
+
+    @staticmethod
+    def format_sse(event):
+        """Encode one event in text/event-stream framing"""
+        data = json.dumps({'data': event['data'], 'ts': event.get('ts')}, cls=DjangoJSONEncoder)
+        return f"id: {event['id']}\nevent: {event['type']}\ndata: {data}\n\n"
+
+    @classmethod
+    def stream_for_user(cls, user, max_seconds=None, heartbeat_seconds=15):
+        """SSE body for one client; ends after max_seconds so the browser reconnects"""
+        max_seconds = max_seconds or getattr(settings, 'EVENT_STREAM_MAX_SECONDS', 300)
+        deadline = time.monotonic() + max_seconds
+        user_id = str(user.id)
+
+        # The stream never touches the ORM; hand back the connection authentication used
+        # instead of holding it until the stream ends
+        connection.close()
+
+        # Browser reconnect delay in milliseconds
+        yield 'retry: 3000\n\n'
+
+        events = cls.listen(heartbeat_seconds=heartbeat_seconds)
+        try:
+            for event in events:
+                if event is None:
+                    yield ': keep-alive\n\n'
+                elif 'user_ids' not in event or user_id in event['user_ids']:
+                    yield cls.format_sse(event)
+
+                if time.monotonic() >= deadline:
+                    break
+        finally:
+            events.close()
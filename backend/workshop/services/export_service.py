@@ -0,0 +1,83 @@
+# workshop/services/export_service.py
+import io
+import csv
+from django.utils import timezone
+from django.http import StreamingHttpResponse
+
+from workshop.queries import export_queries as eq
+
+
+class ExportService:
+    """
+    Streams CSV exports straight from the database.
+
+    Rows come from values_list querysets consumed with iterator(chunk_size=...),
+    so memory stays flat regardless of how many rows match the filters.
+    """
+
+    # Rows fetched per database round trip and written per response chunk
+    CHUNK_SIZE = 2000
+
+    def stream_csv(self, header, queryset):
+        """Yield CSV text in chunks of CHUNK_SIZE rows"""
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+
+        # BOM so Excel opens UTF-8 exports (customer names, descriptions) correctly
+        buffer.write('\ufeff')
+        writer.writerow(header)
+
+        for count, row in enumerate(queryset.iterator(chunk_size=self.CHUNK_SIZE), start=1):
+            writer.writerow(row)
+            if count % self.CHUNK_SIZE == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+
+        yield buffer.getvalue()
+
+    def csv_response(self, name, header, queryset):
+        """Wrap a streamed export in an attachment response"""
+        filename = f"{name}-{timezone.now().strftime('%Y%m%d-%H%M%S')}.csv"
+        response = StreamingHttpResponse(
+            self.stream_csv(header, queryset),
+            content_type='text/csv; charset=utf-8'
+        )
+        response['Content-Disposition'] = f'attachment; filename="{filename}"'
+        return response
+
+    def export_invoices(self, params):
+        header, queryset = eq.get_invoice_export(
+            customer_id=params.get('customer_id'),
+            invoice_type=params.get('invoice_type'),
+            status=params.get('status'),
+            date_from=params.get('date_from'),
+            date_to=params.get('date_to')
+        )
+        return self.csv_response('invoices', header, queryset)
+
+    def export_bookings(self, params):
+        filters = {
+            key: params[key]
+            for key in ('status', 'customer', 'service', 'date_from', 'date_to', 'search')
+            if params.get(key)
+        }
+        header, queryset = eq.get_booking_export(filters)
+        return self.csv_response('bookings', header, queryset)
+
+    def export_stock_movements(self, params):
+        header, queryset = eq.get_stock_movement_export(
+            variant_id=params.get('variant_id'),
+            reason=params.get('reason'),
+            date_from=params.get('date_from'),
+            date_to=params.get('date_to')
+        )
+        return self.csv_response('stock-movements', header, queryset)
+
+    def export_expenses(self, params):
+        header, queryset = eq.get_expense_export(
+            category=params.get('category'),
+            date_from=params.get('date_from'),
+            date_to=params.get('date_to')
+        )
+        return self.csv_response('expenses', header, queryset)
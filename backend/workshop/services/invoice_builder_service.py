@@ -0,0 +1,134 @@
+# workshop/services/invoice_builder_service.py
+import logging
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import prefetch_related_objects
+
+from workshop.models import User, Invoice, InvoiceItems, ProductVariant, StockMovement
+from workshop.services.catalog_service import CatalogService
+from workshop.services.stock_movement_service import StockMovementService
+from workshop import metrics
+
+logger = logging.getLogger(__name__)
+
+CENT = Decimal('0.01')
+
+
+class InvoiceBuildError(Exception):
+    """Invoice input that cannot be turned into an invoice; `errors` is keyed by field"""
+
+    def __init__(self, errors):
+        super().__init__(errors)
+        self.errors = errors
+
+
+class InvoiceBuilder:
+    """
+    Creates a counter-sale invoice, its items and the matching stock deductions in one transaction.
+
+    All referenced variants are loaded and locked in one query, prices and totals are computed
+    here from the variant prices (client totals are ignored), and the items, SALE movements and
+    new variant quantities are each written with one bulk statement, so the number of round
+    trips does not grow with the number of items. Any failure rolls the whole invoice back.
+    """
+
+    def __init__(self, created_by='System'):
+        self.created_by = created_by
+
+    def build(self, customer_id, items, discount_amount=0, status=Invoice.Status.PENDING):
+        if not items:
+            raise InvoiceBuildError({'items': ['At least one item is required.']})
+
+        # Repeated lines for the same variant are merged so stock is checked against the combined quantity
+        quantities = {}
+        for item in items:
+            quantity = Decimal(item['quantity'])
+            if quantity <= 0:
+                raise InvoiceBuildError({'items': ['Item quantities must be positive.']})
+            variant_id = item['product_variant']
+            quantities[variant_id] = quantities.get(variant_id, Decimal(0)) + quantity
+
+        with transaction.atomic():
+            customer = User.objects.filter(id=customer_id, role=User.Role.customer).first()
+            if customer is None:
+                raise InvoiceBuildError({'customer_id': ['Customer not found.']})
+
+            variants = self.lock_variants(quantities)
+            self.check_stock(variants, quantities)
+
+            lines = [
+                (variants[variant_id], quantity, (variants[variant_id].price * quantity).quantize(CENT))
+                for variant_id, quantity in quantities.items()
+            ]
+            subtotal = sum((total for _, _, total in lines), Decimal(0))
+            discount = min(max(Decimal(discount_amount or 0), Decimal(0)), subtotal)
+
+            invoice = Invoice.objects.create(
+                user=customer,
+                subtotal=subtotal,
+                discount_amount=discount,
+                total_amount=subtotal - discount,
+                status=status,
+            )
+
+            # bulk_create skips InvoiceItems.save(), so total_amount is set here
+            InvoiceItems.objects.bulk_create([
+                InvoiceItems(
+                    invoice=invoice,
+                    product_variant=variant,
+                    quantity=quantity,
+                    unit_price=variant.price,
+                    total_amount=total,
+                )
+                for variant, quantity, total in lines
+            ])
+
+            movements = []
+            for variant, quantity, _ in lines:
+                before = variant.quantity
+                variant.quantity = before - quantity
+                movements.append(StockMovement(
+                    product_variant=variant,
+                    change_amount=-quantity,
+                    reason='SALE',
+                    quantity_before=before,
+                    quantity_after=variant.quantity,
+                    reference_id=invoice.invoice_number,
+                    created_by=self.created_by,
+                ))
+            StockMovement.objects.bulk_create(movements)
+            ProductVariant.objects.bulk_update([variant for variant, _, _ in lines], ['quantity'])
+
+            for movement in movements:
+                StockMovementService._publish_low_stock(movement.product_variant, movement)
+            # bulk writes send no signals, so cached catalog pages are retired here
+            transaction.on_commit(CatalogService.invalidate)
+
+        prefetch_related_objects([invoice], 'items__product_variant')
+        logger.info("Invoice %s built items=%d total=%s", invoice.invoice_number, len(lines), invoice.total_amount)
+        return invoice
+
+    @staticmethod
+    def lock_variants(quantities):
+        # Locked in primary key order so two invoices sharing variants cannot deadlock
+        with metrics.observe_lock_wait():
+            variants = {
+                variant.pk: variant
+                for variant in ProductVariant.objects.select_for_update().filter(pk__in=quantities).order_by('pk')
+            }
+        missing = [str(variant_id) for variant_id in quantities if variant_id not in variants]
+        if missing:
+            raise InvoiceBuildError({'items': [f"Product variant not found: {', '.join(missing)}"]})
+        return variants
+
+    @staticmethod
+    def check_stock(variants, quantities):
+        errors = [
+            f"Insufficient stock for {variants[variant_id].sku}: "
+            f"{variants[variant_id].quantity} available, {quantity} requested"
+            for variant_id, quantity in quantities.items()
+            if quantity > variants[variant_id].quantity
+        ]
+        if errors:
+            raise InvoiceBuildError({'items': errors})
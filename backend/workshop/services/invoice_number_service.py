@@ -0,0 +1,132 @@
+# workshop/services/invoice_number_service.py
+import threading
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from workshop.models import InvoiceNumberCounter
+
+
+def fiscal_period(when=None):
+    """Fiscal year label for a datetime: the calendar year the fiscal year starts in"""
+    when = timezone.localtime(when) if when else timezone.localtime()
+    start_month = getattr(settings, 'FISCAL_YEAR_START_MONTH', 1)
+    return str(when.year if when.month >= start_month else when.year - 1)
+
+
+def format_invoice_number(period, value):
+    return f"DH{period}-{value:06d}"
+
+
+class InvoiceNumberAllocator:
+    """
+    Hands out invoice numbers from a row-locked counter per fiscal period.
+
+    Each process reserves INVOICE_NUMBER_BLOCK_SIZE numbers per round trip and serves
+    the rest of the block from memory, one cache per period. Inside a transaction the
+    spare part of a block is kept for that transaction only, so later calls in it draw
+    from the block instead of reserving another; it joins the process cache once the
+    transaction commits. A rolled back reservation is dropped with the counter update,
+    so its numbers can never be handed out twice. Numbers are unique; with several
+    workers they interleave, and a worker that exits leaves the rest of its block unused.
+    A block size of 1 gives strictly sequential numbers at one round trip per invoice.
+    """
+
+    def __init__(self, block_size=None):
+        self._block_size = block_size
+        self._lock = threading.Lock()
+        self._blocks = {}
+        self._local = threading.local()
+
+    @property
+    def block_size(self):
+        return self._block_size or getattr(settings, 'INVOICE_NUMBER_BLOCK_SIZE', 20)
+
+    def next(self, when=None):
+        return self.allocate(1, when)[0]
+
+    def allocate(self, count, when=None, period=None):
+        """`count` invoice numbers for the fiscal period of `when` (now by default)"""
+        period = period or fiscal_period(when)
+        values = self._take_pending(period, count)
+        values.extend(self._take_cached(period, count - len(values)))
+
+        missing = count - len(values)
+        if missing:
+            spare = self.block_size - missing % self.block_size if missing % self.block_size else 0
+            start = self._reserve(period, missing + spare)
+            values.extend(range(start, start + missing))
+            if spare:
+                self._hold(period, start + missing, start + missing + spare)
+
+        return [format_invoice_number(period, value) for value in values]
+
+    def _reserve(self, period, count):
+        """Advance the period's counter by `count` and return the first reserved value"""
+        with transaction.atomic():
+            counter, _ = InvoiceNumberCounter.objects.select_for_update().get_or_create(period=period)
+            InvoiceNumberCounter.objects.filter(pk=counter.pk).update(last_value=F('last_value') + count)
+        return counter.last_value + 1
+
+    def _hold(self, period, start, end):
+        """Keep a reserved block for the current transaction; the process cache gets what is left on commit"""
+        if not transaction.get_connection().in_atomic_block:
+            self._put_cached(period, start, end)
+            return
+
+        block = [start, end]
+
+        def publish():
+            if block[0] < block[1]:
+                self._put_cached(period, block[0], block[1])
+
+        transaction.on_commit(publish)
+        self._pending()[period] = (block, publish)
+
+    def _pending(self):
+        if not hasattr(self._local, 'blocks'):
+            self._local.blocks = {}
+        return self._local.blocks
+
+    def _take_pending(self, period, count):
+        pending = self._pending()
+        held = pending.get(period)
+        if not held:
+            return []
+        block, publish = held
+        # The callback is gone once the transaction (or the savepoint that reserved the block) ends;
+        # after a commit it has already published the rest, after a rollback the block no longer exists
+        if not any(entry[1] is publish for entry in transaction.get_connection().run_on_commit):
+            del pending[period]
+            return []
+        start, end = block
+        taken = min(count, end - start)
+        block[0] = start + taken
+        return list(range(start, start + taken))
+
+    def _take_cached(self, period, count):
+        values = []
+        with self._lock:
+            blocks = self._blocks.get(period, [])
+            while blocks and len(values) < count:
+                start, end = blocks[0]
+                taken = min(count - len(values), end - start)
+                values.extend(range(start, start + taken))
+                if start + taken >= end:
+                    blocks.pop(0)
+                else:
+                    blocks[0] = (start + taken, end)
+            if not blocks:
+                self._blocks.pop(period, None)
+        return values
+
+    def _put_cached(self, period, start, end):
+        with self._lock:
+            blocks = self._blocks.setdefault(period, [])
+            blocks.append((start, end))
+            blocks.sort()
+
+
+invoice_numbers = InvoiceNumberAllocator()
@@ -1,4 +1,5 @@
 # services/invoice_service.py
+import logging
 from typing import Dict, Any, Optional
 from django.db.models import Q
 from django.core.paginator import Paginator, EmptyPage, PageNotAnInteger
@@ -19,13 +20,18 @@ from workshop.serializers.combined_invoice_serializer import (
 )
 from .base_service import BaseService
 
+logger = logging.getLogger(__name__)
+
 
 class InvoiceService(BaseService):
 
     # Get Invoices
     @staticmethod
     def get_invoices_paginated(customer_id=None, invoice_type=None, page=1, page_size=10, date_from=None, date_to=None):
-        print(f"Fetching invoices for customer_id={customer_id}, invoice_type={invoice_type}, date_from={date_from}, date_to={date_to}, page={page}, page_size={page_size}")
+        logger.debug(
+            "Fetching invoices customer_id=%s invoice_type=%s date_from=%s date_to=%s page=%s page_size=%s",
+            customer_id, invoice_type, date_from, date_to, page, page_size
+        )
         try:
             result = get_filtered_invoices(
                 customer_id=customer_id,
@@ -35,14 +41,10 @@ class InvoiceService(BaseService):
                 date_from=date_from,
                 date_to=date_to
             )
-            print(result)
-        except Exception as e:
-            import traceback
-            print("Error in get_filtered_invoices:", e)
-            traceback.print_exc()
+        except Exception:
+            logger.exception("get_filtered_invoices failed")
             raise
         invoices_data = InvoiceSerializer(result['invoices'], many=True).data
-        print(invoices_data)
         return {
             'invoices': invoices_data,
             'pagination': result['pagination']
@@ -0,0 +1,227 @@
+# workshop/services/job_service.py
+import os
+import random
+import socket
+import logging
+import threading
+import importlib
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+from django.utils import timezone
+
+from workshop.models import BackgroundJob
+
+logger = logging.getLogger(__name__)
+
+
+# Registry of task name -> callable(payload). Populated by @task in workshop/tasks.py
+_TASKS = {}
+
+
+def task(name):
+    """Register a function as a background task under `name`"""
+    def decorator(func):
+        _TASKS[name] = func
+        return func
+    return decorator
+
+
+# The job run_job is executing in this thread, for heartbeat()
+_current = threading.local()
+
+
+def _load_tasks():
+    importlib.import_module('workshop.tasks')
+
+
+class JobService:
+    """
+    Enqueue, claim and execute BackgroundJob rows.
+
+    Jobs are claimed with SELECT ... FOR UPDATE SKIP LOCKED so several workers can
+    drain the queue concurrently. Failed jobs are retried with exponential backoff
+    and moved to the dead state once max_attempts is reached.
+    """
+
+    DEFAULT_MAX_ATTEMPTS = 5
+    BACKOFF_BASE_SECONDS = 30
+    BACKOFF_MAX_SECONDS = 60 * 60
+    # A running job whose worker has not finished (or called heartbeat()) within this window is presumed lost
+    LEASE_TIMEOUT = timedelta(minutes=10)
+
+    @staticmethod
+    def enqueue(task_name, payload=None, delay_seconds=0, max_attempts=None):
+        run_at = timezone.now() + timedelta(seconds=delay_seconds)
+        job = BackgroundJob.objects.create(
+            task=task_name,
+            payload=payload or {},
+            run_at=run_at,
+            max_attempts=max_attempts or JobService.DEFAULT_MAX_ATTEMPTS,
+        )
+
+        # Eager mode runs the job in-process once the surrounding transaction commits.
+        # Useful for tests and local development without a worker.
+        if getattr(settings, 'BACKGROUND_JOBS_EAGER', False):
+            transaction.on_commit(lambda: JobService.run_job(job))
+
+        return job
+
+    @staticmethod
+    def worker_id():
+        return f"{socket.gethostname()}:{os.getpid()}"
+
+    @staticmethod
+    def claim_jobs(worker, limit=10):
+        """Lease up to `limit` due jobs to `worker`"""
+        now = timezone.now()
+        with transaction.atomic():
+            jobs = list(
+                BackgroundJob.objects.select_for_update(skip_locked=True)
+                .filter(status=BackgroundJob.Status.PENDING, run_at__lte=now)
+                .order_by('run_at')[:limit]
+            )
+            if not jobs:
+                return []
+
+            BackgroundJob.objects.filter(id__in=[job.id for job in jobs]).update(
+                status=BackgroundJob.Status.RUNNING,
+                locked_by=worker,
+                locked_at=now,
+                attempts=F('attempts') + 1,
+            )
+
+        for job in jobs:
+            job.status = BackgroundJob.Status.RUNNING
+            job.locked_by = worker
+            job.locked_at = now
+            job.attempts += 1
+        return jobs
+
+    @staticmethod
+    def backoff_seconds(attempts):
+        delay = min(JobService.BACKOFF_BASE_SECONDS * (2 ** (attempts - 1)), JobService.BACKOFF_MAX_SECONDS)
+        # Jitter so failures from one outage do not all retry in the same second
+        return delay * random.uniform(0.8, 1.2)
+
+    @staticmethod
+    def run_job(job):
+        """Execute a claimed (or eager) job and record the outcome"""
+        _load_tasks()
+
+        if job.status in (BackgroundJob.Status.SUCCEEDED, BackgroundJob.Status.DEAD):
+            return job.status == BackgroundJob.Status.SUCCEEDED
+
+        if job.status != BackgroundJob.Status.RUNNING:
+            job.attempts += 1
+
+        handler = _TASKS.get(job.task)
+        if handler is None:
+            JobService._mark_dead(job, f"Unknown task '{job.task}'")
+            return False
+
+        _current.job = job
+        try:
+            handler(job.payload)
+        except Exception as e:
+            error = f"{type(e).__name__}: {e}"
+            if job.attempts >= job.max_attempts:
+                JobService._mark_dead(job, error)
+            else:
+                delay = JobService.backoff_seconds(job.attempts)
+                job.status = BackgroundJob.Status.PENDING
+                job.run_at = timezone.now() + timedelta(seconds=delay)
+                job.last_error = error
+                job.locked_by = None
+                job.locked_at = None
+                job.save(update_fields=['status', 'attempts', 'run_at', 'last_error', 'locked_by', 'locked_at'])
+                logger.warning("Job %s (%s) failed on attempt %s, retrying in %.0fs: %s", job.id, job.task, job.attempts, delay, error)
+            return False
+        finally:
+            _current.job = None
+
+        job.status = BackgroundJob.Status.SUCCEEDED
+        job.completed_at = timezone.now()
+        job.last_error = None
+        job.locked_by = None
+        job.locked_at = None
+        job.save(update_fields=['status', 'attempts', 'completed_at', 'last_error', 'locked_by', 'locked_at'])
+        return True
+
+    @staticmethod
+    def heartbeat():
+        """Renew the lease of the job running in this thread; long tasks call it as they progress"""
+        job = getattr(_current, 'job', None)
+        if job is None or job.status != BackgroundJob.Status.RUNNING:
+            return
+        now = timezone.now()
+        BackgroundJob.objects.filter(
+            pk=job.pk, status=BackgroundJob.Status.RUNNING, locked_by=job.locked_by
+        ).update(locked_at=now)
+        job.locked_at = now
+
+    @staticmethod
+    def _mark_dead(job, error):
+        job.status = BackgroundJob.Status.DEAD
+        job.last_error = error
+        job.completed_at = timezone.now()
+        job.locked_by = None
+        job.locked_at = None
+        job.save(update_fields=['status', 'attempts', 'last_error', 'completed_at', 'locked_by', 'locked_at'])
+        logger.error("Job %s (%s) moved to dead letter after %s attempt(s): %s", job.id, job.task, job.attempts, error)
+
+    @staticmethod
+    def requeue_stale():
+        """
+        Return jobs leased by a crashed worker to the queue. A job that has used up its
+        attempts is dead-lettered instead, so one that keeps killing its worker stops there.
+        """
+        now = timezone.now()
+        stale = BackgroundJob.objects.filter(
+            status=BackgroundJob.Status.RUNNING,
+            locked_at__lt=now - JobService.LEASE_TIMEOUT,
+        )
+        dead = stale.filter(attempts__gte=F('max_attempts')).update(
+            status=BackgroundJob.Status.DEAD,
+            last_error='Worker lost while running the job',
+            completed_at=now,
+            locked_by=None,
+            locked_at=None,
+        )
+        if dead:
+            logger.error("%s stale job(s) moved to dead letter after using up their attempts", dead)
+        return stale.update(status=BackgroundJob.Status.PENDING, locked_by=None, locked_at=None)
+
+    @staticmethod
+    def retry_dead(task_name=None):
+        """Move dead-lettered jobs back to the queue with a fresh attempt budget"""
+        queryset = BackgroundJob.objects.filter(status=BackgroundJob.Status.DEAD)
+        if task_name:
+            queryset = queryset.filter(task=task_name)
+        return queryset.update(
+            status=BackgroundJob.Status.PENDING,
+            attempts=0,
+            run_at=timezone.now(),
+            completed_at=None,
+        )
+
+    @staticmethod
+    def run_pending(limit=100):
+        """Synchronously drain due jobs. Returns (succeeded, failed)"""
+        worker = JobService.worker_id()
+        succeeded = failed = 0
+        while True:
+            jobs = JobService.claim_jobs(worker, limit=min(limit, 50))
+            if not jobs:
+                break
+            for job in jobs:
+                if JobService.run_job(job):
+                    succeeded += 1
+                else:
+                    failed += 1
+            limit -= len(jobs)
+            if limit <= 0:
+                break
+        return succeeded, failed
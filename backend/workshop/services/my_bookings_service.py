@@ -7,11 +7,8 @@ class MyBookingsService:
 
     # Get all bookings for a customer
     def get_my_bookings(self, customer):
-        print('======================', customer.id)
         bookings = get_optimized_bookings({'customer': customer.id})
-        print(bookings)
         serializer = BookingListSerializer(bookings['queryset'], many=True)
-        print(serializer.data)  # Debugging output
         return serializer.data
     
     # def get_my_bookings_by_status(self, customer, status):
@@ -1,16 +1,33 @@
 # workshop/services/notification_service.py
-from workshop.models import Notification
+from collections import defaultdict
+from datetime import timedelta
+
+from workshop.models import Notification, NotificationCounter
+from workshop.services.event_service import EventService
 from workshop.serializers import NotificationSerializer, NotificationStatsSerializer, MarkAsReadSerializer
-from django.db.models import Q, Count, Case, When, IntegerField
+from django.db import transaction
+from django.db.models import Q, F, Count
 from django.utils import timezone
 
+
 class NotificationService:
+    """
+    Per-user notification inboxes.
+
+    Every write path (create, mark read, delete, retention) also adjusts the
+    NotificationCounter rows for the affected (user, type) pairs, so stats are a
+    read of at most one row per notification type.
+    """
+
+    RETENTION_DAYS = 90
+    RETENTION_BATCH_SIZE = 1000
+
     def get_notifications(self, params, request):
         search = params.get('search', '')
         notification_type = params.get('type', '')
         priority = params.get('priority', '')
         is_read = params.get('is_read', '')
-        queryset = Notification.objects.all()
+        queryset = Notification.objects.filter(user=request.user)
         if search:
             queryset = queryset.filter(Q(title__icontains=search) | Q(message__icontains=search))
         if notification_type:
@@ -22,42 +39,195 @@ class NotificationService:
             queryset = queryset.filter(is_read=is_read_bool)
         return queryset
 
-    def get_stats(self):
-        stats = Notification.objects.aggregate(
-            total=Count('id'),
-            unread=Count(Case(When(is_read=False, then=1), output_field=IntegerField())),
-            urgent=Count(Case(When(priority='urgent', then=1), output_field=IntegerField())),
-            booking=Count(Case(When(notification_type='booking', then=1), output_field=IntegerField())),
-            payment=Count(Case(When(notification_type='payment', then=1), output_field=IntegerField())),
-            system=Count(Case(When(notification_type='system', then=1), output_field=IntegerField()))
+    def get_stats(self, user):
+        # At most one counter row per notification type
+        rows = NotificationCounter.objects.filter(user=user).values_list(
+            'notification_type', 'total_count', 'unread_count', 'urgent_count'
         )
+        stats = {'total': 0, 'unread': 0, 'urgent': 0, 'booking': 0, 'payment': 0, 'system': 0}
+        for notification_type, total, unread, urgent in rows:
+            stats['total'] += total
+            stats['unread'] += unread
+            stats['urgent'] += urgent
+            if notification_type in stats:
+                stats[notification_type] = total
         serializer = NotificationStatsSerializer(stats)
         return serializer.data
 
-    def mark_as_read(self, data):
+    def mark_as_read(self, data, user):
         serializer = MarkAsReadSerializer(data=data)
         if not serializer.is_valid():
             return None, serializer.errors
         notification_ids = serializer.validated_data.get('notification_ids', [])
-        if notification_ids:
-            updated_count = Notification.objects.filter(id__in=notification_ids, is_read=False).update(is_read=True, read_at=timezone.now())
-        else:
-            updated_count = Notification.objects.filter(is_read=False).update(is_read=True, read_at=timezone.now())
+
+        with transaction.atomic():
+            queryset = Notification.objects.select_for_update().filter(user=user, is_read=False)
+            if notification_ids:
+                queryset = queryset.filter(id__in=notification_ids)
+            rows = list(queryset.values_list('id', 'notification_type'))
+
+            updated_count = Notification.objects.filter(id__in=[pk for pk, _ in rows]).update(
+                is_read=True, read_at=timezone.now()
+            )
+
+            deltas = defaultdict(lambda: [0, 0, 0])
+            for _, notification_type in rows:
+                deltas[(user.id, notification_type)][1] -= 1
+            self.apply_counter_deltas(deltas)
+
         return {'message': f'{updated_count} notifications marked as read', 'updated_count': updated_count}, None
 
-    def delete_notification(self, pk):
+    def delete_notification(self, pk, user):
         try:
-            notification = Notification.objects.get(id=pk)
-            notification.delete()
+            with transaction.atomic():
+                notification = Notification.objects.select_for_update().get(id=pk, user=user)
+                notification.delete()
+                self.apply_counter_deltas({
+                    (user.id, notification.notification_type): self._row_delta(
+                        notification.is_read, notification.priority, sign=-1
+                    )
+                })
             return {'message': 'Notification deleted successfully'}, None
         except Notification.DoesNotExist:
             return None, {'error': 'Notification not found'}
         except Exception as e:
             return None, {'error': str(e)}
 
-    def create_notification(self, data):
+    def create_notification(self, data, user):
         serializer = NotificationSerializer(data=data)
         if serializer.is_valid():
-            serializer.save()
+            with transaction.atomic():
+                notification = serializer.save(user=user)
+                self.apply_counter_deltas({
+                    (user.id, notification.notification_type): self._row_delta(
+                        notification.is_read, notification.priority
+                    )
+                })
+                EventService.publish('notification.created', {
+                    'notification_type': notification.notification_type,
+                    'priority': notification.priority,
+                    'title': notification.title,
+                }, user_ids=[user.id])
             return {'message': 'Notification created successfully', 'data': serializer.data}, None
         return None, serializer.errors
+
+    @classmethod
+    def create_for_users(cls, user_ids, title, message, notification_type='system', priority='normal',
+                         booking_id=None, invoice_id=None):
+        """Fan a notification out to many inboxes with one insert"""
+        notifications = [
+            Notification(
+                user_id=user_id,
+                title=title,
+                message=message,
+                notification_type=notification_type,
+                priority=priority,
+                booking_id=booking_id,
+                invoice_id=invoice_id,
+            )
+            for user_id in user_ids
+        ]
+        with transaction.atomic():
+            created = Notification.objects.bulk_create(notifications)
+            cls.apply_counter_deltas({
+                (user_id, notification_type): cls._row_delta(False, priority)
+                for user_id in user_ids
+            })
+            EventService.publish('notification.created', {
+                'notification_type': notification_type,
+                'priority': priority,
+                'title': title,
+            }, user_ids=user_ids)
+        return created
+
+    @classmethod
+    def purge_read(cls, older_than_days=None, batch_size=None):
+        """Delete read notifications older than the retention window, in batches"""
+        cutoff = timezone.now() - timedelta(days=older_than_days or cls.RETENTION_DAYS)
+        batch_size = batch_size or cls.RETENTION_BATCH_SIZE
+        deleted = 0
+
+        while True:
+            with transaction.atomic():
+                rows = list(
+                    Notification.objects.select_for_update(skip_locked=True)
+                    .filter(is_read=True, created_at__lt=cutoff)
+                    .order_by('id')
+                    .values_list('id', 'user_id', 'notification_type', 'priority')[:batch_size]
+                )
+                if not rows:
+                    break
+
+                Notification.objects.filter(id__in=[row[0] for row in rows]).delete()
+
+                deltas = defaultdict(lambda: [0, 0, 0])
+                for _, user_id, notification_type, priority in rows:
+                    delta = cls._row_delta(True, priority, sign=-1)
+                    counter = deltas[(user_id, notification_type)]
+                    for i in range(3):
+                        counter[i] += delta[i]
+                cls.apply_counter_deltas(deltas)
+
+            deleted += len(rows)
+
+        return deleted
+
+    @staticmethod
+    def rebuild_counters(user_ids=None):
+        """Recompute counters from the notification table (repair tool)"""
+        notifications = Notification.objects.filter(user__isnull=False)
+        counters = NotificationCounter.objects.all()
+        if user_ids:
+            notifications = notifications.filter(user_id__in=user_ids)
+            counters = counters.filter(user_id__in=user_ids)
+
+        rows = (
+            notifications.values('user_id', 'notification_type')
+            .annotate(
+                total=Count('id'),
+                unread=Count('id', filter=Q(is_read=False)),
+                urgent=Count('id', filter=Q(priority='urgent')),
+            )
+            .order_by()
+        )
+        with transaction.atomic():
+            counters.delete()
+            NotificationCounter.objects.bulk_create([
+                NotificationCounter(
+                    user_id=row['user_id'],
+                    notification_type=row['notification_type'],
+                    total_count=row['total'],
+                    unread_count=row['unread'],
+                    urgent_count=row['urgent'],
+                )
+                for row in rows
+            ], batch_size=1000)
+
+    @staticmethod
+    def _row_delta(is_read, priority, sign=1):
+        """[total, unread, urgent] contribution of one notification"""
+        return [sign, 0 if is_read else sign, sign if priority == 'urgent' else 0]
+
+    @staticmethod
+    def apply_counter_deltas(deltas):
+        """
+        Apply {(user_id, notification_type): [total, unread, urgent]} to the counters.
+        Must run inside the transaction that changed the notifications.
+        """
+        deltas = {key: delta for key, delta in deltas.items() if key[0] and any(delta)}
+        if not deltas:
+            return
+
+        NotificationCounter.objects.bulk_create(
+            [NotificationCounter(user_id=user_id, notification_type=notification_type)
+             for user_id, notification_type in deltas],
+            ignore_conflicts=True
+        )
+        for (user_id, notification_type), (total, unread, urgent) in deltas.items():
+            NotificationCounter.objects.filter(
+                user_id=user_id, notification_type=notification_type
+            ).update(
+                total_count=F('total_count') + total,
+                unread_count=F('unread_count') + unread,
+                urgent_count=F('urgent_count') + urgent,
+            )
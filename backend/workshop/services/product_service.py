@@ -6,7 +6,7 @@ class ProductService:
 
     # Get all products with optional search
     def get_products(self, params):
-        queryset = Product.objects.all()
+        queryset = Product.objects.prefetch_related('variants')
         search = params.get('search')
         if search:
             queryset = queryset.filter(name__icontains=search)
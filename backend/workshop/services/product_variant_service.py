@@ -1,9 +1,12 @@
 # workshop/services/product_variant_service.py
+import logging
 from django.db import transaction
 from workshop.models import ProductVariant, Product, BookingService, InvoiceItems
 from workshop.serializers.product_serializer import ProductVariantSerializer, ProductVariantCreateSerializer
 from workshop.services.stock_movement_service import StockMovementService
 
+logger = logging.getLogger(__name__)
+
 class ProductVariantService:
 
     # Get all product variants
@@ -52,7 +55,7 @@ class ProductVariantService:
                         reference_id=f"Variant_Creation_{variant.id}"
                     )
                     if error:
-                        print(f"Warning: {error}")
+                        logger.warning("Initial stock movement for variant %s failed: %s", variant.id, error)
                 
                 response_serializer = ProductVariantSerializer(variant)
                 return {'message': 'Product variant created successfully', 'data': response_serializer.data}, None
@@ -86,7 +89,7 @@ class ProductVariantService:
                             updated_by=updated_by
                         )
                         if error:
-                            print(f"Warning: {error}")
+                            logger.warning("Stock movement for variant %s update failed: %s", pk, error)
                     
                     response_serializer = ProductVariantSerializer(updated_variant)
                     return {'message': 'Product variant updated successfully', 'data': response_serializer.data}, None
@@ -122,8 +125,6 @@ class ProductVariantService:
             return None, {'error': 'Booking Service not found'}
         booking_service_id = booking_service_obj.id
 
-        print(booking_service_id)
-
         created_invoice_item_ids = []
         stock_errors = []
         with transaction.atomic():
@@ -131,7 +132,6 @@ class ProductVariantService:
                 variant_id = item.get("product_variant")
                 unit_price = item.get("unit_price")
                 quantity = item.get("quantity")
-                print(f"Processing item - Variant ID: {variant_id}, Unit Price: {unit_price}, Quantity: {quantity}")
                 if not variant_id or unit_price is None or quantity is None:
                     continue  # skip invalid items
                 try:
@@ -147,8 +147,6 @@ class ProductVariantService:
                     sold_by="system"
                 )
 
-                print(f"Stock movement created: {result}")
-
                 if error:
                     stock_errors.append({"variant_id": str(variant_id), "error": error})
                     continue
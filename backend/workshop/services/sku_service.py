@@ -0,0 +1,92 @@
+# workshop/services/sku_service.py
+import re
+from collections import Counter
+
+from django.db import connection
+
+from workshop.models import SkuCounter
+
+
+# Leaves room for "-" and a suffix of up to 4 digits inside ProductVariant.sku (max_length=50)
+MAX_PREFIX_LENGTH = 45
+
+# An explicit SKU of this shape could also be generated, so it has to move its counter
+GENERATED_SKU = re.compile(r'^(.{1,%d})-(\d{1,9})$' % MAX_PREFIX_LENGTH)
+
+
+def sku_prefix(product_name, variant_name):
+    """ENGOIL-SYN for ("Engine Oil", "Synthetic"): first three letters of every word"""
+    prod = ''.join(w[:3].upper() for w in product_name.split())
+    var = ''.join(w[:3].upper() for w in variant_name.split())
+    return f"{prod}-{var}"[:MAX_PREFIX_LENGTH]
+
+
+def format_sku(prefix, value):
+    return f"{prefix}-{value:03d}"
+
+
+class SkuAllocator:
+    """
+    SKUs are <prefix>-<n>, with n drawn from a counter row per prefix. Every prefix has
+    one counter, so two variants can only get the same SKU if the counter hands out the
+    same n twice, which the upsert's row lock rules out: no COUNT query and no retries.
+    Explicit SKUs of the same shape go through claim(), which moves the counter past them.
+    """
+
+    @staticmethod
+    def reserve(counts):
+        """
+        Reserve counts[prefix] suffixes for every prefix in one INSERT ... ON CONFLICT
+        statement. Returns {prefix: first reserved suffix}.
+        """
+        if not counts:
+            return {}
+
+        table = connection.ops.quote_name(SkuCounter._meta.db_table)
+        rows = ', '.join(['(%s, %s)'] * len(counts))
+        # Rows are locked in VALUES order; a fixed order keeps concurrent imports from deadlocking
+        params = [value for prefix in sorted(counts) for value in (prefix, counts[prefix])]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (prefix, last_value) VALUES {rows} "
+                f"ON CONFLICT (prefix) DO UPDATE SET last_value = {table}.last_value + EXCLUDED.last_value "
+                f"RETURNING prefix, last_value",
+                params,
+            )
+            last_values = dict(cursor.fetchall())
+        return {prefix: last_values[prefix] - counts[prefix] + 1 for prefix in counts}
+
+    @staticmethod
+    def claim(skus):
+        """Advance the counters past explicit SKUs that look generated, in one upsert"""
+        highest = {}
+        for sku in skus:
+            match = GENERATED_SKU.match(sku or '')
+            if match:
+                prefix, value = match.group(1), int(match.group(2))
+                highest[prefix] = max(value, highest.get(prefix, 0))
+        if not highest:
+            return
+
+        table = connection.ops.quote_name(SkuCounter._meta.db_table)
+        rows = ', '.join(['(%s, %s)'] * len(highest))
+        params = [value for prefix in sorted(highest) for value in (prefix, highest[prefix])]
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f"INSERT INTO {table} (prefix, last_value) VALUES {rows} "
+                f"ON CONFLICT (prefix) DO UPDATE SET last_value = GREATEST({table}.last_value, EXCLUDED.last_value)",
+                params,
+            )
+
+    @classmethod
+    def assign(cls, variants):
+        """Set `sku` on every variant that has none; variants must have `product` set"""
+        pending = [
+            (variant, sku_prefix(variant.product.name, variant.variant_name))
+            for variant in variants if not variant.sku
+        ]
+        next_values = cls.reserve(Counter(prefix for _, prefix in pending))
+        for variant, prefix in pending:
+            variant.sku = format_sku(prefix, next_values[prefix])
+            next_values[prefix] += 1
+        return variants
@@ -0,0 +1,349 @@
+# workshop/services/slot_scheduler_service.py
+import logging
+from bisect import bisect_right, insort
+from collections import namedtuple
+from datetime import date, time, timedelta
+
+from django.conf import settings
+from django.utils import timezone
+
+from workshop.models import Attendance, Booking, BookingService, BusinessSettings, DailyAvailability, WorkshopResource
+from workshop.services.capacity_planner_service import CapacityPlanner
+
+logger = logging.getLogger(__name__)
+
+
+# Booking statuses that keep their bay and technician busy
+ACTIVE_STATUSES = (
+    BookingService.Status.PENDING,
+    BookingService.Status.CONFIRMED,
+    BookingService.Status.IN_PROGRESS,
+)
+
+# Times are minutes since midnight throughout the index
+Placement = namedtuple('Placement', 'start end bay technician')
+
+
+def to_minutes(value):
+    return value.hour * 60 + value.minute
+
+
+def to_time(minutes):
+    return time(minutes // 60, minutes % 60)
+
+
+class IntervalIndex:
+    """
+    Free time of one resource on one day: the gaps between its bookings as sorted parallel
+    arrays, plus a segment tree holding the longest gap under each node. The earliest start
+    of a job is one bisect to the gap containing `not_before` and, if that gap is too short,
+    one tree descent to the first long enough gap after it: O(log n) in the day's bookings.
+    """
+
+    def __init__(self, opens, closes, busy=()):
+        self.opens = opens
+        self.closes = closes
+        self.busy = sorted(busy)
+        self._build()
+
+    def _build(self):
+        starts, ends = [], []
+        cursor = self.opens
+        for start, end in self.busy:
+            if start > cursor:
+                starts.append(cursor)
+                ends.append(min(start, self.closes))
+            cursor = max(cursor, end)
+            if cursor >= self.closes:
+                break
+        if cursor < self.closes:
+            starts.append(cursor)
+            ends.append(self.closes)
+        self.starts, self.ends = starts, ends
+
+        size = 1
+        while size < len(starts):
+            size *= 2
+        tree = [0] * (2 * size)
+        for position, (start, end) in enumerate(zip(starts, ends)):
+            tree[size + position] = end - start
+        for node in range(size - 1, 0, -1):
+            tree[node] = max(tree[2 * node], tree[2 * node + 1])
+        self.size, self.tree = size, tree
+
+    def add(self, start, end):
+        """Mark [start, end) busy; rebuilding is O(n), queries stay O(log n)"""
+        insort(self.busy, (start, end))
+        self._build()
+
+    def earliest(self, not_before, duration):
+        """Earliest start >= not_before of a free stretch at least `duration` long, or None"""
+        position = bisect_right(self.ends, not_before)
+        if position >= len(self.starts):
+            return None
+        start = max(self.starts[position], not_before)
+        if self.ends[position] - start >= duration:
+            return start
+        position = self._first_fit(1, 0, self.size, position + 1, duration)
+        return None if position is None else self.starts[position]
+
+    def _first_fit(self, node, left, right, lowest, duration):
+        """Index of the first gap at or after `lowest` that is at least `duration` long"""
+        if right <= lowest or self.tree[node] < duration:
+            return None
+        if right - left == 1:
+            return left if left < len(self.starts) else None
+        middle = (left + right) // 2
+        found = self._first_fit(2 * node, left, middle, lowest, duration)
+        if found is None:
+            found = self._first_fit(2 * node + 1, middle, right, lowest, duration)
+        return found
+
+
+class ResourcePool:
+    """Interchangeable resources of one kind; earliest() is the best of their indexes"""
+
+    def __init__(self, indexes):
+        self.indexes = indexes  # [(resource key, IntervalIndex)]
+
+    def __bool__(self):
+        return bool(self.indexes)
+
+    def earliest(self, not_before, duration):
+        best = None
+        for key, index in self.indexes:
+            start = index.earliest(not_before, duration)
+            if start is not None and (best is None or start < best[0]):
+                best = (start, key)
+                if start == not_before:
+                    break
+        return best
+
+    def add(self, key, start, end):
+        for resource_key, index in self.indexes:
+            if resource_key == key:
+                index.add(start, end)
+                return
+
+
+class DaySchedule:
+    """
+    Bays and technicians of one day. A job needs one bay and, when technicians are set up,
+    one technician for its whole duration; earliest() alternates between the two pools,
+    moving the candidate start forward until both have a resource free from that time.
+    """
+
+    def __init__(self, opens, closes, bays, technicians, step=None, named_bays=True):
+        self.opens = opens
+        self.closes = closes
+        self.bays = bays
+        self.technicians = technicians
+        self.step = step
+        # Unnamed bays are numbered; bookings on them are saved without a bay
+        self.named_bays = named_bays
+
+    def align(self, minutes):
+        if not self.step:
+            return minutes
+        offset = max(minutes - self.opens, 0)
+        return self.opens + -(-offset // self.step) * self.step
+
+    def earliest(self, not_before, duration, aligned=True):
+        candidate = self.align(not_before) if aligned else max(not_before, self.opens)
+        while True:
+            placement = self._earliest(candidate, duration)
+            if placement is None or not aligned or placement.start == self.align(placement.start):
+                return placement
+            candidate = self.align(placement.start)
+
+    def _earliest(self, candidate, duration):
+        while True:
+            bay = self.bays.earliest(candidate, duration)
+            if bay is None:
+                return None
+            candidate = bay[0]
+            if not self.technicians:
+                return Placement(candidate, candidate + duration, bay[1], None)
+            technician = self.technicians.earliest(candidate, duration)
+            if technician is None:
+                return None
+            if technician[0] == candidate:
+                return Placement(candidate, candidate + duration, bay[1], technician[1])
+            candidate = technician[0]
+
+    def free_starts(self, duration, not_before=None, limit=None):
+        """Concrete start times on the step grid, each with the bay and technician it would get"""
+        found = []
+        candidate = self.opens if not_before is None else max(not_before, self.opens)
+        while limit is None or len(found) < limit:
+            placement = self.earliest(candidate, duration)
+            if placement is None:
+                break
+            found.append(placement)
+            candidate = placement.start + (self.step or 1)
+        return found
+
+    def reserve(self, placement):
+        self.bays.add(placement.bay, placement.start, placement.end)
+        if placement.technician is not None:
+            self.technicians.add(placement.technician, placement.start, placement.end)
+
+
+class SlotScheduler:
+    """
+    Time-slot scheduling on top of the whole-day DailyAvailability counter.
+
+    A day's schedule is built from its working hours, the active bays and technicians
+    (technicians whose employee is absent or on leave that day are left out) and the
+    timed bookings already holding them; with no bays set up, CAPACITY_BAYS unnamed bays
+    are used. Jobs need no technician only when none are set up at all; a day on which
+    every technician is away offers no slots. Start times are offered on a
+    SCHEDULING_STEP_MINUTES grid from opening time.
+    """
+
+    @staticmethod
+    def step_minutes():
+        return getattr(settings, 'SCHEDULING_STEP_MINUTES', 30)
+
+    @classmethod
+    def build_day(cls, availability):
+        """DaySchedule for a DailyAvailability row, or None when the day takes no bookings"""
+        hours = BusinessSettings.get_schedule().hours_for(availability.date)
+        if hours is None or not availability.has_availability():
+            return None
+        opens, closes = to_minutes(hours[0]), to_minutes(hours[1])
+
+        away = set(
+            Attendance.objects.filter(date=availability.date, status__in=['Absent', 'Leave'])
+            .values_list('employee_id', flat=True)
+        )
+        resources = list(WorkshopResource.objects.filter(is_active=True).values('id', 'kind', 'employee_id'))
+        bay_ids = [r['id'] for r in resources if r['kind'] == WorkshopResource.Kind.BAY]
+        technicians = [r for r in resources if r['kind'] == WorkshopResource.Kind.TECHNICIAN]
+        technician_ids = [r['id'] for r in technicians if r['employee_id'] not in away]
+        if technicians and not technician_ids:
+            # Technicians are set up but none is in today: bay-only jobs would go unstaffed
+            return None
+
+        # A day without a stored row (a planned preview) cannot have bookings yet
+        bookings = [] if availability._state.adding else (
+            Booking.objects.filter(
+                daily_availability=availability,
+                start_time__isnull=False,
+                end_time__isnull=False,
+                service__status__in=ACTIVE_STATUSES,
+            )
+            .values_list('start_time', 'end_time', 'bay_id', 'technician_id')
+            .order_by('start_time')
+        )
+        bay_busy = {bay_id: [] for bay_id in bay_ids}
+        technician_busy = {technician_id: [] for technician_id in technician_ids}
+        unplaced = []
+        for start_time, end_time, bay_id, technician_id in bookings:
+            interval = (to_minutes(start_time), to_minutes(end_time))
+            if bay_id in bay_busy:
+                bay_busy[bay_id].append(interval)
+            else:
+                unplaced.append(interval)
+            if technician_id in technician_busy:
+                technician_busy[technician_id].append(interval)
+
+        if not bay_ids:
+            # Unnamed bays: timed bookings are packed onto them first fit, in start order
+            bay_busy = {number: [] for number in range(getattr(settings, 'CAPACITY_BAYS', 1))}
+            for interval in unplaced:
+                free = [number for number, busy in bay_busy.items() if not busy or busy[-1][1] <= interval[0]]
+                number = free[0] if free else min(bay_busy, key=lambda n: bay_busy[n][-1][1])
+                bay_busy[number].append(interval)
+
+        return DaySchedule(
+            opens,
+            closes,
+            ResourcePool([(key, IntervalIndex(opens, closes, busy)) for key, busy in bay_busy.items()]),
+            ResourcePool([(key, IntervalIndex(opens, closes, busy)) for key, busy in technician_busy.items()]),
+            step=cls.step_minutes(),
+            named_bays=bool(bay_ids),
+        )
+
+    @staticmethod
+    def not_before(day):
+        """Nothing can start in the past"""
+        now = timezone.localtime()
+        if day < now.date():
+            return None
+        return to_minutes(now) + 1 if day == now.date() else 0
+
+    @classmethod
+    def available_starts(cls, day, service, limit=None):
+        # Read only: looking at a day must not create its DailyAvailability row
+        availability = CapacityPlanner.planned_day(day)
+        schedule = cls.build_day(availability)
+        not_before = cls.not_before(day)
+        if schedule is None or not_before is None:
+            return []
+        placements = schedule.free_starts(service.duration_minutes, not_before, limit)
+        return cls.describe(day, placements, schedule)
+
+    @classmethod
+    def next_available(cls, service, start_date=None, days=14):
+        """Earliest concrete start for the service within `days` days from start_date, inside the horizon"""
+        start_date = start_date or date.today()
+        horizon_end = date.today() + timedelta(days=CapacityPlanner.horizon_days())
+        days = min(days, (horizon_end - start_date).days)
+        if days <= 0:
+            return None
+        CapacityPlanner.ensure(start_date, days)
+        rows = DailyAvailability.objects.filter(
+            date__range=(start_date, start_date + timedelta(days=days - 1)),
+            is_available=True,
+            available_slots__gt=0,
+        ).order_by('date')
+        for availability in rows:
+            not_before = cls.not_before(availability.date)
+            schedule = cls.build_day(availability)
+            if schedule is None or not_before is None:
+                continue
+            placement = schedule.earliest(not_before, service.duration_minutes)
+            if placement is not None:
+                return cls.describe(availability.date, [placement], schedule)[0]
+        return None
+
+    @classmethod
+    def reserve(cls, availability, service, start_time):
+        """
+        Bay and technician for a booking starting at start_time, checked against the day's
+        bookings while the day's row is locked; raises ValueError when the time is taken.
+        Must run inside the transaction that saves the booking.
+        """
+        DailyAvailability.objects.select_for_update().get(pk=availability.pk)
+        schedule = cls.build_day(availability)
+        if schedule is None:
+            raise ValueError('No bookings are taken on this date')
+
+        start = to_minutes(start_time)
+        not_before = cls.not_before(availability.date)
+        if not_before is None or start < not_before:
+            raise ValueError('Start time is in the past')
+        placement = schedule.earliest(start, service.duration_minutes, aligned=False)
+        if placement is None or placement.start != start:
+            raise ValueError('Start time is not available for this service')
+
+        return {
+            'start_time': to_time(placement.start),
+            'end_time': to_time(placement.end),
+            'bay_id': placement.bay if schedule.named_bays else None,
+            'technician_id': placement.technician,
+        }
+
+    @staticmethod
+    def describe(day, placements, schedule):
+        return [
+            {
+                'date': day.isoformat(),
+                'start_time': to_time(placement.start).strftime('%H:%M'),
+                'end_time': to_time(placement.end).strftime('%H:%M'),
+                'bay_id': placement.bay if schedule.named_bays else None,
+                'technician_id': placement.technician,
+            }
+            for placement in placements
+        ]
@@ -1,11 +1,19 @@
 # workshop/services/stock_movement_service.py
+import logging
 from django.db import transaction
 from workshop.models.stock_movement import StockMovement
 from workshop.models.product_variant import ProductVariant
+from workshop.services.event_service import EventService
+from workshop import metrics
 from decimal import Decimal, InvalidOperation
 
+logger = logging.getLogger(__name__)
+
 
 class StockMovementService:
+
+    # Variants at or below this quantity raise a stock.low event
+    LOW_STOCK_THRESHOLD = 5
     
     @staticmethod
     def create_initial_stock(product_variant, initial_quantity, created_by="System", reference_id=""):
@@ -63,7 +71,8 @@ class StockMovementService:
         try:
             with transaction.atomic():
                 # Lock the variant to prevent race conditions
-                variant = ProductVariant.objects.select_for_update().get(id=product_variant.id)
+                with metrics.observe_lock_wait():
+                    variant = ProductVariant.objects.select_for_update().get(id=product_variant.id)
                 try:
                     original_quantity = Decimal(variant.quantity)
                     adjustment_amount = Decimal(adjustment_amount)
@@ -89,6 +98,7 @@ class StockMovementService:
                     reference_id=reference_id or f"Manual_Adjustment_{variant.id}",
                     created_by=adjusted_by
                 )
+                StockMovementService._publish_low_stock(variant, movement)
                 return {
                     'message': 'Stock adjusted successfully',
                     'variant_id': str(variant.id),
@@ -102,6 +112,18 @@ class StockMovementService:
         except Exception as e:
             return None, {'error': f'Error adjusting stock: {str(e)}'}
 
+    @staticmethod
+    def _publish_low_stock(variant, movement):
+        """Emit stock.low when a movement crosses the threshold downwards"""
+        threshold = StockMovementService.LOW_STOCK_THRESHOLD
+        if movement.quantity_after <= threshold < movement.quantity_before:
+            EventService.publish('stock.low', {
+                'variant_id': str(variant.id),
+                'sku': variant.sku,
+                'variant_name': variant.variant_name,
+                'quantity': movement.quantity_after,
+            })
+
     @staticmethod
     def get_stock_history(product_variant, limit=50):
         try:
@@ -138,7 +160,7 @@ class StockMovementService:
         if sold_quantity <= 0:
             return None, {'error': 'Sold quantity must be positive'}
 
-        print(f"Creating sale movement - Variant ID: {product_variant.id}, Sold Quantity: {sold_quantity}")
+        logger.debug("Creating sale movement for variant %s, quantity %s", product_variant.id, sold_quantity)
 
         # Use negative amount for stock decrease
         return StockMovementService.adjust_stock(
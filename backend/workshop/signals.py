@@ -0,0 +1,116 @@
+# workshop/signals.py
+"""
+Keeps the in-process autocomplete index in step with customer and car writes, the
+customer visit stats and monthly activity facts in step with invoices, retires
+cached catalog pages on product and stock changes and cached business settings on save,
+and recomputes planned booking capacity when working hours, holidays or staffing change.
+Index changes are applied after commit so rolled back saves never reach the index.
+"""
+from django.db import transaction
+from django.db.models.signals import pre_save, post_save, post_delete
+from django.dispatch import receiver
+
+from workshop.models import (
+    User, Car, Invoice, Product, ProductVariant, BusinessSettings, Holiday, Employee, Attendance,
+)
+from workshop.queries.customer_analytics_queries import (
+    record_visit, refresh_visit_stats, refresh_customer_month, month_start,
+)
+from workshop.services.autocomplete_service import autocomplete_index
+from workshop.services.catalog_service import CatalogService
+from workshop.services.business_settings_service import business_settings
+from workshop.services.capacity_planner_service import CapacityPlanner
+
+
+@receiver(post_save, sender=User, dispatch_uid='autocomplete_user_saved')
+def user_saved(sender, instance, **kwargs):
+    if autocomplete_index.tracks_writes:
+        transaction.on_commit(lambda: autocomplete_index.upsert_customer(instance))
+
+
+@receiver(post_delete, sender=User, dispatch_uid='autocomplete_user_deleted')
+def user_deleted(sender, instance, **kwargs):
+    if autocomplete_index.tracks_writes:
+        customer_id = instance.pk
+        transaction.on_commit(lambda: autocomplete_index.remove_customer(customer_id))
+
+
+@receiver(post_save, sender=Car, dispatch_uid='autocomplete_car_saved')
+def car_saved(sender, instance, **kwargs):
+    if autocomplete_index.tracks_writes:
+        transaction.on_commit(lambda: autocomplete_index.upsert_car(instance))
+
+
+@receiver(post_delete, sender=Car, dispatch_uid='autocomplete_car_deleted')
+def car_deleted(sender, instance, **kwargs):
+    if autocomplete_index.tracks_writes:
+        car_id = instance.pk
+        transaction.on_commit(lambda: autocomplete_index.remove_car(car_id))
+
+
+@receiver(pre_save, sender=Invoice, dispatch_uid='customer_visit_status_read')
+def invoice_saving(sender, instance, update_fields=None, **kwargs):
+    # Remember the stored status so invoice_saved only recomputes visits when it changes
+    instance._previous_status = None
+    if instance._state.adding or (update_fields is not None and 'status' not in update_fields):
+        return
+    instance._previous_status = (
+        Invoice.objects.filter(pk=instance.pk).values_list('status', flat=True).first()
+    )
+
+
+@receiver(post_save, sender=Invoice, dispatch_uid='customer_visit_recorded')
+def invoice_saved(sender, instance, created, **kwargs):
+    # Runs inside the invoice's transaction, so a rolled back invoice is not counted
+    cancelled = instance.status == Invoice.Status.CANCELLED
+    if created:
+        if not cancelled:
+            record_visit(instance.user_id, instance.created_at)
+    else:
+        previous = getattr(instance, '_previous_status', None)
+        # A cancelled (or reinstated) invoice changes the visit count and may move the first or last visit
+        if previous is not None and (previous == Invoice.Status.CANCELLED) != cancelled:
+            refresh_visit_stats([instance.user_id])
+    # Status and total changes move revenue, so every save refreshes the month's row
+    refresh_customer_month(instance.user_id, month_start(instance.created_at))
+
+
+@receiver(post_delete, sender=Invoice, dispatch_uid='customer_activity_invoice_deleted')
+def invoice_deleted(sender, instance, origin=None, **kwargs):
+    # Deleting the customer cascades to their activity rows as well
+    if isinstance(origin, User) or getattr(origin, 'model', None) is User:
+        return
+    refresh_visit_stats([instance.user_id])
+    refresh_customer_month(instance.user_id, month_start(instance.created_at))
+
+
+@receiver(post_save, sender=Product, dispatch_uid='catalog_product_saved')
+@receiver(post_delete, sender=Product, dispatch_uid='catalog_product_deleted')
+@receiver(post_save, sender=ProductVariant, dispatch_uid='catalog_variant_saved')
+@receiver(post_delete, sender=ProductVariant, dispatch_uid='catalog_variant_deleted')
+def catalog_changed(sender, **kwargs):
+    # Stock movements update the variant's quantity with save(), so they land here too
+    transaction.on_commit(CatalogService.invalidate)
+
+
+@receiver(post_save, sender=BusinessSettings, dispatch_uid='business_settings_saved')
+@receiver(post_delete, sender=BusinessSettings, dispatch_uid='business_settings_deleted')
+def business_settings_changed(sender, **kwargs):
+    transaction.on_commit(business_settings.invalidate)
+    # Registered after the invalidation so the planner reads the new working hours
+    transaction.on_commit(CapacityPlanner.recompute)
+
+
+@receiver(post_save, sender=Employee, dispatch_uid='capacity_employee_saved')
+@receiver(post_delete, sender=Employee, dispatch_uid='capacity_employee_deleted')
+def headcount_changed(sender, **kwargs):
+    transaction.on_commit(CapacityPlanner.recompute)
+
+
+@receiver(post_save, sender=Holiday, dispatch_uid='capacity_holiday_saved')
+@receiver(post_delete, sender=Holiday, dispatch_uid='capacity_holiday_deleted')
+@receiver(post_save, sender=Attendance, dispatch_uid='capacity_attendance_saved')
+@receiver(post_delete, sender=Attendance, dispatch_uid='capacity_attendance_deleted')
+def day_capacity_changed(sender, instance, **kwargs):
+    day = instance.date
+    transaction.on_commit(lambda: CapacityPlanner.recompute([day]))
@@ -0,0 +1,67 @@
+# workshop/tasks.py
+"""
+Background tasks executed by the `run_jobs` worker.
+Enqueue with JobService.enqueue('<name>', payload); payloads must be JSON serializable.
+"""
+from workshop.email.email import EmailHandler, BulkMailDispatcher
+from workshop.models import User
+from workshop.services.job_service import JobService, task
+from workshop.services.notification_service import NotificationService
+
+
+@task('email.contact')
+def send_contact_email(payload):
+    EmailHandler.send_contact_email(payload)
+
+
+@task('email.bulk')
+def send_bulk_email(payload):
+    """
+    Templated email to many users over reused SMTP connections.
+    Recipients are `user_ids` when given, otherwise all active users with `role`.
+    """
+    recipients = User.objects.filter(is_active=True).exclude(email__isnull=True).exclude(email='')
+    if payload.get('user_ids'):
+        recipients = recipients.filter(id__in=payload['user_ids'])
+    else:
+        recipients = recipients.filter(role=payload.get('role', User.Role.customer))
+
+    BulkMailDispatcher().dispatch(
+        recipients.only('id', 'name', 'email', 'phone_number').iterator(chunk_size=500),
+        payload['subject'],
+        payload['body'],
+        batch_id=payload.get('batch_id'),
+        # A throttled run can outlast the job lease; renewing it keeps other workers off the batch
+        heartbeat=JobService.heartbeat,
+    )
+
+
+@task('notifications.fan_out')
+def fan_out_notification(payload):
+    """
+    Create one notification per recipient.
+    Recipients are `user_ids` when given, otherwise every admin user.
+    """
+    user_ids = payload.get('user_ids')
+    if user_ids:
+        recipients = User.objects.filter(id__in=user_ids)
+    else:
+        recipients = User.objects.filter(role=User.Role.admin, is_active=True)
+
+    NotificationService.create_for_users(
+        list(recipients.values_list('id', flat=True)),
+        title=payload['title'],
+        message=payload['message'],
+        notification_type=payload.get('notification_type', 'system'),
+        priority=payload.get('priority', 'normal'),
+        booking_id=payload.get('booking_id'),
+        invoice_id=payload.get('invoice_id'),
+    )
+
+
+@task('notifications.retention')
+def purge_read_notifications(payload):
+    NotificationService.purge_read(
+        older_than_days=payload.get('days'),
+        batch_size=payload.get('batch_size'),
+    )
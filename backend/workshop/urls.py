@@ -18,6 +18,9 @@ from .views.service_view import ServiceView
 from .views.notification_view import NotificationView
 from .views.settings_view import SettingsView
 from .views.analytics_view import AnalyticsViewSet
+from .views.event_stream_view import EventStreamView
+from .views.metrics_view import metrics_view
+from .views.autocomplete_view import AutocompleteView
 
 router = DefaultRouter()
 
@@ -35,7 +38,8 @@ router.register(r'contact', ContactView, basename='contact')
 router.register(r'employees', EmployeeView, basename='employee')
 router.register(r'miscellaneous-bills', ExpenseView, basename='expense')
 router.register(r'analytics', AnalyticsViewSet, basename='analytics')
-# router.register(r'notifications', NotificationView, basename='notification')
+router.register(r'notifications', NotificationView, basename='notification')
+router.register(r'events', EventStreamView, basename='events')
 
 router.register(r'customer', MyBookingsView, basename='customer-bookings')
 
@@ -50,5 +54,11 @@ urlpatterns = [
     path('auth/admin/status/', AdminAuthStatusView.as_view(), name='admin_auth_status'),
     path('auth/profile/', ProfileView.as_view(), name='profile'),
 
+    # Customer / car / license plate typeahead
+    path('autocomplete/', AutocompleteView.as_view(), name='autocomplete'),
+
+    # Prometheus scrape endpoint
+    path('metrics', metrics_view, name='metrics'),
+
     path('', include(router.urls)),
 ]
\ No newline at end of file
@@ -16,6 +16,11 @@ from workshop.serializers.analytics_serializer import (
     ProfitableServicesSerializer,
     PopularServicesSerializer,
     TopSparePartsSerializer,
+    CustomerCohortSerializer,
+    CustomerLifetimeValueSerializer,
+    BookingTimeInStateSerializer,
+    BookingThroughputSerializer,
+    BookingSlaBreachSerializer,
     AnalyticsMetricsSerializer,
     MonthlyReportSerializer,
 )
@@ -48,7 +53,7 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error getting monthly report: {str(e)}")
+            logger.error("Error getting monthly report: %s", e)
             return Response(
                 {"error": "Failed to retrieve monthly report"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -61,7 +66,7 @@ class AnalyticsViewSet(ViewSet):
             serializer = AnalyticsMetricsSerializer(data)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception as e:
-            logger.error(f"Error getting analytics metrics: {str(e)}")
+            logger.error("Error getting analytics metrics: %s", e)
             return Response(
                 {"error": "Failed to retrieve analytics metrics"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -81,7 +86,7 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error getting monthly revenue data: {str(e)}")
+            logger.error("Error getting monthly revenue data: %s", e)
             return Response(
                 {"error": "Failed to retrieve monthly revenue data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -101,7 +106,7 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error getting daily bookings data: {str(e)}")
+            logger.error("Error getting daily bookings data: %s", e)
             return Response(
                 {"error": "Failed to retrieve daily bookings data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -121,7 +126,7 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error getting top services data: {str(e)}")
+            logger.error("Error getting top services data: %s", e)
             return Response(
                 {"error": "Failed to retrieve top services data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -135,7 +140,7 @@ class AnalyticsViewSet(ViewSet):
             serializer = CarTypesSerializer(data, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception as e:
-            logger.error(f"Error getting car types data: {str(e)}")
+            logger.error("Error getting car types data: %s", e)
             return Response(
                 {"error": "Failed to retrieve car types data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -149,7 +154,7 @@ class AnalyticsViewSet(ViewSet):
             serializer = YearlyCarSerializer(data, many=True)
             return Response(serializer.data, status=status.HTTP_200_OK)
         except Exception as e:
-            logger.error(f"Error getting yearly car data: {str(e)}")
+            logger.error("Error getting yearly car data: %s", e)
             return Response(
                 {"error": "Failed to retrieve yearly car data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -169,7 +174,7 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error getting profitable services data: {str(e)}")
+            logger.error("Error getting profitable services data: %s", e)
             return Response(
                 {"error": "Failed to retrieve profitable services data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -189,7 +194,7 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error getting popular services data: {str(e)}")
+            logger.error("Error getting popular services data: %s", e)
             return Response(
                 {"error": "Failed to retrieve popular services data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
@@ -209,12 +214,112 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_400_BAD_REQUEST
             )
         except Exception as e:
-            logger.error(f"Error getting top spare parts data: {str(e)}")
+            logger.error("Error getting top spare parts data: %s", e)
             return Response(
                 {"error": "Failed to retrieve top spare parts data"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
             )
     
+    @action(detail=False, methods=['get'], url_path='customers/cohorts')
+    def get_customer_cohorts(self, request):
+        """Get monthly customer cohorts with retention and cumulative revenue."""
+        try:
+            months = min(max(int(request.query_params.get('months', 12)), 1), 36)
+            data = AnalyticsService.get_customer_cohorts(months)
+            serializer = CustomerCohortSerializer(data, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {"error": "Invalid months parameter"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error("Error getting customer cohorts: %s", e)
+            return Response(
+                {"error": "Failed to retrieve customer cohorts"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    @action(detail=False, methods=['get'], url_path='customers/lifetime-value')
+    def get_customer_lifetime_value(self, request):
+        """Get customers ranked by lifetime revenue."""
+        try:
+            limit = min(max(int(request.query_params.get('limit', 20)), 1), 100)
+            data = AnalyticsService.get_customer_lifetime_value(limit)
+            serializer = CustomerLifetimeValueSerializer(data, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {"error": "Invalid limit parameter"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error("Error getting customer lifetime value: %s", e)
+            return Response(
+                {"error": "Failed to retrieve customer lifetime value"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    @action(detail=False, methods=['get'], url_path='bookings/time-in-state')
+    def get_booking_time_in_state(self, request):
+        """Get average time bookings spend in each status, from the booking event log."""
+        try:
+            days = min(max(int(request.query_params.get('days', 30)), 1), 365)
+            data = AnalyticsService.get_booking_time_in_state(days)
+            serializer = BookingTimeInStateSerializer(data)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {"error": "Invalid days parameter"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error("Error getting booking time in state: %s", e)
+            return Response(
+                {"error": "Failed to retrieve booking time in state"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    @action(detail=False, methods=['get'], url_path='bookings/throughput')
+    def get_booking_throughput(self, request):
+        """Get bookings opened and moved into each status per day."""
+        try:
+            days = min(max(int(request.query_params.get('days', 30)), 1), 365)
+            data = AnalyticsService.get_booking_throughput(days)
+            serializer = BookingThroughputSerializer(data, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {"error": "Invalid days parameter"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error("Error getting booking throughput: %s", e)
+            return Response(
+                {"error": "Failed to retrieve booking throughput"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
+    @action(detail=False, methods=['get'], url_path='bookings/sla-breaches')
+    def get_booking_sla_breaches(self, request):
+        """Get bookings that have stayed pending or in progress past their SLA limit."""
+        try:
+            limit = min(max(int(request.query_params.get('limit', 100)), 1), 500)
+            data = AnalyticsService.get_booking_sla_breaches(limit)
+            serializer = BookingSlaBreachSerializer(data, many=True)
+            return Response(serializer.data, status=status.HTTP_200_OK)
+        except ValueError:
+            return Response(
+                {"error": "Invalid limit parameter"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+        except Exception as e:
+            logger.error("Error getting booking SLA breaches: %s", e)
+            return Response(
+                {"error": "Failed to retrieve booking SLA breaches"},
+                status=status.HTTP_500_INTERNAL_SERVER_ERROR
+            )
+    
     @action(detail=False, methods=['post'], url_path='cache/clear')
     def clear_cache(self, request):
         """Clear analytics cache."""
@@ -225,7 +330,7 @@ class AnalyticsViewSet(ViewSet):
                 status=status.HTTP_200_OK
             )
         except Exception as e:
-            logger.error(f"Error clearing analytics cache: {str(e)}")
+            logger.error("Error clearing analytics cache: %s", e)
             return Response(
                 {"error": "Failed to clear analytics cache"},
                 status=status.HTTP_500_INTERNAL_SERVER_ERROR
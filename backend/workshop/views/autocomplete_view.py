@@ -0,0 +1,35 @@
+# workshop/views/autocomplete_view.py
+from rest_framework import status
+from rest_framework.views import APIView
+from rest_framework.response import Response
+
+from workshop.permissions import IsAdmin
+from workshop.services.autocomplete_service import AutocompleteService
+
+
+class AutocompleteView(APIView):
+    """
+    GET /autocomplete/?q=<term>&types=customers,cars&limit=8
+    Prefix matches on customer name words, phone numbers and license plates.
+    """
+
+    permission_classes = [IsAdmin]
+
+    MAX_LIMIT = 25
+    TYPES = {'customers', 'cars'}
+
+    def get(self, request):
+        try:
+            limit = min(int(request.query_params.get('limit', 8)), self.MAX_LIMIT)
+        except ValueError:
+            return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+
+        types = {t.strip() for t in request.query_params.get('types', 'customers,cars').split(',') if t.strip()}
+        if not types or types - self.TYPES:
+            return Response(
+                {'error': f"types must be a comma separated subset of {', '.join(sorted(self.TYPES))}"},
+                status=status.HTTP_400_BAD_REQUEST
+            )
+
+        result = AutocompleteService.search(request.query_params.get('q', ''), max(limit, 1), types)
+        return Response(result, status=status.HTTP_200_OK)
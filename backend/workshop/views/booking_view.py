@@ -5,12 +5,15 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 
 from workshop.services.booking_service import BookingService
+from workshop.services.export_service import ExportService
 
 class BookingView(viewsets.ViewSet):
     
     def get_permissions(self):
         if self.action in ['create_customer_booking', 'get_available_dates']:  
             permission_classes = [IsCustomer]
+        elif self.action in ['get_time_slots', 'get_next_slot']:
+            permission_classes = [IsAdmin | IsCustomer]
         else:
             permission_classes = [IsAdmin]
         return [perm() for perm in permission_classes]
@@ -18,6 +21,7 @@ class BookingView(viewsets.ViewSet):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.booking_service = BookingService()
+        self.export_service = ExportService()
     
     # List all bookings
     @action(detail=False, methods=['get'], url_path='list')
@@ -25,6 +29,12 @@ class BookingView(viewsets.ViewSet):
         result = self.booking_service.get_bookings(request.query_params)
         return Response(result)
     
+
+    # Stream bookings as CSV using the list filters
+    @action(detail=False, methods=['get'], url_path='export')
+    def export_bookings(self, request):
+        return self.export_service.export_bookings(request.query_params)
+    
     
     @action(detail=True, methods=['get'], url_path='detail')
     def get_booking_detail(self, request, pk=None):
@@ -73,13 +83,34 @@ class BookingView(viewsets.ViewSet):
         return Response(errors, status=status.HTTP_400_BAD_REQUEST)
     
     
+    # Status history of a booking from the event log
+    @action(detail=True, methods=['get'], url_path='history')
+    def get_booking_history(self, request, pk=None):
+        result = self.booking_service.get_booking_history(pk)
+        return Response(result)
+
+
+    # Move many bookings to one status in a single transaction
+    @action(detail=False, methods=['post'], url_path='bulk-status')
+    def bulk_update_status(self, request):
+        new_status = request.data.get('status')
+        if not new_status:
+            return Response({"error": "Status is required"}, status=status.HTTP_400_BAD_REQUEST)
+        result, errors = self.booking_service.bulk_update_status(
+            request.data.get('booking_ids'), new_status, request.user, request.data.get('notes', '')
+        )
+        if errors:
+            return Response({"result": result, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
+        return Response({"result": result, "errors": errors}, status=status.HTTP_200_OK)
+
+
     # Update status of booking
     @action(detail=True, methods=['patch'], url_path='status')
     def update_status(self, request, pk=None):
         new_status = request.data.get('status')
         if not new_status:
             return Response({"error": "Status is required"}, status=status.HTTP_400_BAD_REQUEST)
-        result, errors = self.booking_service.update_status(pk, new_status)
+        result, errors = self.booking_service.update_status(pk, new_status, request.user, request.data.get('notes', ''))
         if errors:
             return Response({"result": result, "errors": errors}, status=status.HTTP_400_BAD_REQUEST)
         return Response({"result": result, "errors": errors}, status=status.HTTP_200_OK)
@@ -120,6 +151,36 @@ class BookingView(viewsets.ViewSet):
         return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
     
+    # Concrete start times for a service on a date, each with the bay and technician it would get
+    @action(detail=False, methods=['get'], url_path='slots')
+    def get_time_slots(self, request):
+        try:
+            limit = min(max(int(request.query_params.get('limit', 50)), 1), 200)
+        except ValueError:
+            return Response({"error": "Invalid limit parameter"}, status=status.HTTP_400_BAD_REQUEST)
+        result, errors = self.booking_service.get_time_slots(
+            request.query_params.get('date'), request.query_params.get('service'), limit
+        )
+        if result is not None:
+            return Response(result)
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+
+    # Earliest start for a service within the next `days` days
+    @action(detail=False, methods=['get'], url_path='next-slot')
+    def get_next_slot(self, request):
+        try:
+            days = min(max(int(request.query_params.get('days', 14)), 1), 60)
+        except ValueError:
+            return Response({"error": "Invalid days parameter"}, status=status.HTTP_400_BAD_REQUEST)
+        result, errors = self.booking_service.get_next_slot(
+            request.query_params.get('service'), request.query_params.get('start_date'), days
+        )
+        if result is not None:
+            return Response(result)
+        return Response(errors, status=status.HTTP_400_BAD_REQUEST)
+
+    
     @action(detail=False, methods=['get'], url_path='availability')
     def get_date_availability(self, request):
         date_param = request.query_params.get('date')
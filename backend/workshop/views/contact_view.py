@@ -3,7 +3,7 @@ from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework import status
 
-from workshop.email.email import EmailHandler
+from workshop.services.job_service import JobService
 from workshop.queries import contact_queries as ci
 
 class ContactView(viewsets.ViewSet):
@@ -14,8 +14,13 @@ class ContactView(viewsets.ViewSet):
     @action(detail=False, methods=['post'], url_path='recieve')
     def recieve_email(self, request):
         data = request.data
+        payload = {
+            field: str(data.get(field, ''))
+            for field in ('name', 'email', 'phone', 'service', 'message')
+        }
         try:
-            EmailHandler.send_contact_email(data)
+            # SMTP happens in the job worker; the request only records the job
+            JobService.enqueue('email.contact', payload)
             return Response({'detail': 'Message sent successfully.'}, status=status.HTTP_200_OK)
         except Exception as e:
             return Response({'detail': f'Failed to send message: {str(e)}'}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
@@ -24,4 +29,3 @@ class ContactView(viewsets.ViewSet):
     @action(detail=False, methods=['post'], url_path='info')
     def contact_info(self, request):
         output = ci.get_contact_info()
-        print(output)
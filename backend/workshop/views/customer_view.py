@@ -3,8 +3,18 @@ from rest_framework import viewsets, status
 from workshop.permissions import IsAdmin
 from rest_framework.decorators import action
 from rest_framework.response import Response
+from rest_framework.pagination import CursorPagination
 
 from workshop.services.customer_service import CustomerService
+from workshop.serializers.customer_serializer import CustomerDetailSerializer
+
+
+class CustomerDirectoryPagination(CursorPagination):
+    # Keyset pagination over the (name, id) customer directory index
+    page_size = 50
+    page_size_query_param = 'limit'
+    max_page_size = 200
+    ordering = ('name', 'id')
 
 
 class CustomerView(viewsets.ViewSet):
@@ -25,6 +35,27 @@ class CustomerView(viewsets.ViewSet):
         
         return Response(result['data'], status=status.HTTP_200_OK)
 
+    # Paginated customer directory, or ?mode=typeahead for id/name/phone prefix matches
+    @action(detail=False, methods=['get'], url_path='directory')
+    def get_directory(self, request):
+        search_term = request.query_params.get('search', None)
+
+        if request.query_params.get('mode') == 'typeahead':
+            try:
+                limit = min(int(request.query_params.get('limit', 10)), 50)
+            except ValueError:
+                return Response({'error': 'limit must be an integer'}, status=status.HTTP_400_BAD_REQUEST)
+            result = self.customer_service.get_customer_typeahead(search_term, limit)
+            if 'error' in result:
+                return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
+            return Response(result['data'], status=status.HTTP_200_OK)
+
+        queryset = self.customer_service.get_customer_directory(search_term)
+        paginator = CustomerDirectoryPagination()
+        page = paginator.paginate_queryset(queryset, request)
+        serializer = CustomerDetailSerializer(page, many=True)
+        return paginator.get_paginated_response(serializer.data)
+
     # Get customer statistics
     @action(detail=False, methods=['get'], url_path='stats')
     def get_stats(self, request):
@@ -50,7 +81,6 @@ class CustomerView(viewsets.ViewSet):
     # Add a new customer
     @action(detail=False, methods=['post'], url_path='add-customer')
     def add_customer(self, request):
-        print('====================================', request.data)
         result = self.customer_service.create_customer(request.data)
         
         if 'error' in result:
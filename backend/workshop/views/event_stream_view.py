@@ -0,0 +1,41 @@
+# workshop/views/event_stream_view.py
+import json
+
+from django.http import StreamingHttpResponse
+from rest_framework import viewsets
+from rest_framework.decorators import action
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+
+from workshop.permissions import IsAdmin
+from workshop.services.event_service import EventService
+
+
+class EventStreamRenderer(BaseRenderer):
+    """
+    Lets DRF content negotiation accept `Accept: text/event-stream` (sent by EventSource).
+    Only used to render error responses; the stream itself bypasses rendering.
+    """
+    media_type = 'text/event-stream'
+    format = 'sse'
+    charset = 'utf-8'
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return f"event: error\ndata: {json.dumps(data)}\n\n".encode(self.charset)
+
+
+class EventStreamView(viewsets.ViewSet):
+
+    permission_classes = [IsAdmin]
+    renderer_classes = [EventStreamRenderer, JSONRenderer]
+
+    # Server-Sent Events: booking, stock and notification updates for the admin dashboard
+    @action(detail=False, methods=['get'], url_path='stream')
+    def stream(self, request):
+        response = StreamingHttpResponse(
+            EventService.stream_for_user(request.user),
+            content_type='text/event-stream'
+        )
+        response['Cache-Control'] = 'no-cache'
+        # Stop nginx from buffering the stream
+        response['X-Accel-Buffering'] = 'no'
+        return response
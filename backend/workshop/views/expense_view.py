@@ -5,6 +5,7 @@ from rest_framework.response import Response
 
 from workshop.permissions import IsAdmin
 from workshop.services.expense_service import ExpenseService
+from workshop.services.export_service import ExportService
 
 
 class ExpenseView(viewsets.ViewSet):
@@ -20,6 +21,7 @@ class ExpenseView(viewsets.ViewSet):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.expense_service = ExpenseService()
+        self.export_service = ExportService()
 
     @action(detail=False, methods=['get'], url_path='bills')
     def get_all_bills(self, request):
@@ -121,3 +123,8 @@ class ExpenseView(viewsets.ViewSet):
                 return Response(result, status=status.HTTP_400_BAD_REQUEST)
             return Response(result, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
         return Response(result['data'], status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export_bills(self, request):
+        """Stream bills/expenses as CSV, filtered by category and date range"""
+        return self.export_service.export_expenses(request.query_params)
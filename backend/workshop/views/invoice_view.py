@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.decorators import action
 
 from workshop.services.invoice_service import InvoiceService
+from workshop.services.export_service import ExportService
 
 
 class InvoiceView(viewsets.ViewSet):
@@ -14,6 +15,7 @@ class InvoiceView(viewsets.ViewSet):
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
         self.invoice_service = InvoiceService()
+        self.export_service = ExportService()
 
 
     # List Invoices
@@ -33,8 +35,6 @@ class InvoiceView(viewsets.ViewSet):
             page = 1
             page_size = 10
 
-        print(f"Fetching invoices for customer_id={customer_id}, invoice_type={invoice_type}, date_from={date_from}, date_to={date_to}, page={page}, page_size={page_size}")
-
         # Call service method
         result = self.invoice_service.get_invoices_paginated(
             customer_id=customer_id,
@@ -120,4 +120,9 @@ class InvoiceView(viewsets.ViewSet):
         return Response(
             {"message": result['message']}, 
             status=status.HTTP_200_OK
-        )
\ No newline at end of file
+        )
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export_invoices(self, request):
+        """Stream invoices as CSV (same filters as list-invoices, plus status)"""
+        return self.export_service.export_invoices(request.query_params)
@@ -0,0 +1,22 @@
+# workshop/views/metrics_view.py
+import hmac
+
+from django.conf import settings
+from django.http import HttpResponse
+from django.views.decorators.http import require_GET
+
+from workshop import metrics
+
+
+@require_GET
+def metrics_view(request):
+    """Prometheus scrape endpoint; requires `Authorization: Bearer <METRICS_AUTH_TOKEN>` and is hidden without a token"""
+    token = getattr(settings, 'METRICS_AUTH_TOKEN', '')
+    if not token:
+        return HttpResponse(status=404)
+    supplied = request.headers.get('Authorization', '').removeprefix('Bearer ').strip()
+    if not hmac.compare_digest(supplied.encode(), token.encode()):
+        return HttpResponse(status=401)
+
+    body, content_type = metrics.render()
+    return HttpResponse(body, content_type=content_type)
@@ -3,7 +3,7 @@ from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from rest_framework.permissions import IsAuthenticated
-from rest_framework.pagination import PageNumberPagination
+from rest_framework.pagination import CursorPagination
 from django.db.models import Q, Count, Case, When, IntegerField
 from django.utils import timezone
 
@@ -11,10 +11,12 @@ from workshop.permissions import IsAdmin
 from workshop.services.notification_service import NotificationService
 
 
-class NotificationPagination(PageNumberPagination):
+class NotificationPagination(CursorPagination):
+    # Keyset pagination over the (user, is_read, created_at) inbox index
     page_size = 20
     page_size_query_param = 'limit'
     max_page_size = 100
+    ordering = ('-created_at', '-id')
 
 
 class NotificationView(viewsets.ViewSet):
@@ -44,21 +46,21 @@ class NotificationView(viewsets.ViewSet):
     @action(detail=False, methods=['get'], url_path='stats')
     def get_stats(self, request):
         try:
-            result = self.notification_service.get_stats()
+            result = self.notification_service.get_stats(request.user)
             return Response(result)
         except Exception as e:
             return Response({'error': str(e)}, status=status.HTTP_500_INTERNAL_SERVER_ERROR)
 
     @action(detail=False, methods=['post'], url_path='mark-read')
     def mark_as_read(self, request):
-        result, errors = self.notification_service.mark_as_read(request.data)
+        result, errors = self.notification_service.mark_as_read(request.data, request.user)
         if result:
             return Response(result)
         return Response(errors, status=status.HTTP_400_BAD_REQUEST)
 
     @action(detail=True, methods=['delete'], url_path='delete')
     def delete_notification(self, request, pk=None):
-        result, errors = self.notification_service.delete_notification(pk)
+        result, errors = self.notification_service.delete_notification(pk, request.user)
         if result:
             return Response(result)
         if errors and errors.get('error') == 'Notification not found':
@@ -67,7 +69,7 @@ class NotificationView(viewsets.ViewSet):
 
     @action(detail=False, methods=['post'], url_path='create')
     def create_notification(self, request):
-        result, errors = self.notification_service.create_notification(request.data)
+        result, errors = self.notification_service.create_notification(request.data, request.user)
         if result:
             return Response(result, status=status.HTTP_201_CREATED)
         return Response(errors, status=status.HTTP_400_BAD_REQUEST)
@@ -2,10 +2,21 @@ from rest_framework import viewsets, status
 from workshop.permissions import IsAdmin
 from rest_framework.response import Response
 from rest_framework.decorators import action
+from rest_framework.pagination import CursorPagination
 
 from workshop.models.product import Product
-from workshop.serializers.product_serializer import ProductSerializer, ProductCreateSerializer
+from workshop.serializers.product_serializer import ProductSerializer, ProductCreateSerializer, CatalogProductSerializer
 from workshop.services.product_service import ProductService
+from workshop.services.catalog_import_service import CatalogImportService, CatalogImportError
+from workshop.services.catalog_service import CatalogService
+
+class CatalogPagination(CursorPagination):
+    # Keyset pagination over the (category, name) product index when filtered by category
+    page_size = 25
+    page_size_query_param = 'limit'
+    max_page_size = 100
+    ordering = ('name', 'id')
+
 
 class ProductView(viewsets.ViewSet):
     
@@ -18,10 +29,23 @@ class ProductView(viewsets.ViewSet):
     # List all products
     @action(detail = False, methods = ['get'], url_path = 'details')
     def get_details(self, request):
-        queryset = Product.objects.all()
+        queryset = Product.objects.prefetch_related('variants')
         serializer = ProductSerializer(queryset, many=True)
         return Response(serializer.data)
     
+    # Paginated catalog with stock totals, ?category=&search=; cached until the next stock change
+    @action(detail = False, methods = ['get'], url_path = 'catalog')
+    def get_catalog(self, request):
+        cache_key = CatalogService.cache_key(request)
+        data = CatalogService.get_cached_page(cache_key)
+        if data is None:
+            paginator = CatalogPagination()
+            page = paginator.paginate_queryset(CatalogService.get_catalog(request.query_params), request)
+            serializer = CatalogProductSerializer(page, many=True)
+            data = paginator.get_paginated_response(serializer.data).data
+            CatalogService.cache_page(cache_key, data)
+        return Response(data)
+    
     # Get available product categories
     @action(detail = False, methods = ['get'], url_path = 'categories')
     def get_categories(self, request):
@@ -36,6 +60,28 @@ class ProductView(viewsets.ViewSet):
             return Response(result, status=status.HTTP_201_CREATED)
         return Response(errors, status=status.HTTP_400_BAD_REQUEST)
     
+    # Bulk import products and variants from a CSV / JSON / JSON Lines upload
+    @action(detail = False, methods = ['post'], url_path = 'import')
+    def import_catalog(self, request):
+        upload = request.FILES.get('file')
+        if upload is None:
+            return Response({'error': 'Upload the catalog as multipart field "file"'}, status=status.HTTP_400_BAD_REQUEST)
+
+        try:
+            fmt = CatalogImportService.detect_format(upload.name, request.query_params.get('format'))
+            service = CatalogImportService(
+                created_by=getattr(request.user, 'email', None) or 'Catalog import',
+                dry_run=request.query_params.get('dry_run') in ('1', 'true'),
+            )
+        except CatalogImportError as e:
+            return Response({'error': str(e)}, status=status.HTTP_400_BAD_REQUEST)
+
+        # A file that turns unreadable part way still returns the report of what was committed
+        report = service.run(CatalogImportService.iter_rows(upload.file, fmt))
+        if report.get('error'):
+            return Response(report, status=status.HTTP_400_BAD_REQUEST)
+        return Response(report, status=status.HTTP_200_OK)
+
     # Delete a product by UUID
     @action(detail = True, methods = ['delete'], url_path = 'del-product')
     def delete_product(self, request, pk=None):
@@ -1,14 +1,18 @@
 # workshop/views/settings_view.py
 
+from datetime import date
+
 from rest_framework import viewsets, status
 from rest_framework.decorators import action
 from rest_framework.response import Response
 from django.contrib.auth import get_user_model
 from workshop.permissions import IsAdmin
 from workshop.models.settings import BusinessSettings
+from workshop.models.holiday import Holiday
 from workshop.serializers.settings_serializer import (
     BusinessSettingsSerializer,
-    ChangePasswordSerializer
+    ChangePasswordSerializer,
+    HolidaySerializer
 )
 
 User = get_user_model()
@@ -36,7 +40,7 @@ class SettingsView(viewsets.ViewSet):
     @action(detail=False, methods=['patch'], url_path='update')
     def update_business_settings(self, request):
         try:
-            settings = BusinessSettings.get_settings()
+            settings = BusinessSettings.load()
             serializer = BusinessSettingsSerializer(settings, data=request.data, partial=True)
             
             if serializer.is_valid():
@@ -63,6 +67,34 @@ class SettingsView(viewsets.ViewSet):
             )
 
 
+    # List or add holidays; booking capacity for the date is recomputed on save
+    @action(detail=False, methods=['get', 'post'], url_path='holidays')
+    def holidays(self, request):
+        if request.method == 'GET':
+            holidays = Holiday.objects.all()
+            if request.query_params.get('upcoming'):
+                holidays = holidays.filter(date__gte=date.today())
+            return Response(HolidaySerializer(holidays, many=True).data, status=status.HTTP_200_OK)
+
+        serializer = HolidaySerializer(data=request.data)
+        if serializer.is_valid():
+            serializer.save()
+            return Response(serializer.data, status=status.HTTP_201_CREATED)
+        return Response(
+            {'error': 'Invalid data', 'details': serializer.errors},
+            status=status.HTTP_400_BAD_REQUEST
+        )
+
+
+    # Remove a holiday
+    @action(detail=False, methods=['delete'], url_path=r'holidays/(?P<holiday_id>[^/.]+)')
+    def delete_holiday(self, request, holiday_id=None):
+        deleted, _ = Holiday.objects.filter(id=holiday_id).delete()
+        if not deleted:
+            return Response({'error': 'Holiday not found'}, status=status.HTTP_404_NOT_FOUND)
+        return Response(status=status.HTTP_204_NO_CONTENT)
+
+
     # Change user password
     @action(detail=False, methods=['post'], url_path='change-password')
     def change_password(self, request):
@@ -5,6 +5,7 @@ from rest_framework.response import Response
 from rest_framework.viewsets import ViewSet
 from rest_framework.decorators import action
 from workshop.services.stock_movement_service import StockMovementService
+from workshop.services.export_service import ExportService
 from workshop.models.product_variant import ProductVariant
 from workshop.permissions import IsAdmin
 
@@ -189,3 +190,8 @@ class StockMovementView(ViewSet):
         }
         
         return Response(summary, status=status.HTTP_200_OK)
+
+    @action(detail=False, methods=['get'], url_path='export')
+    def export_movements(self, request):
+        """Stream stock movements as CSV, filtered by variant_id, reason and date range"""
+        return ExportService().export_stock_movements(request.query_params)
@@ -1,6 +1,6 @@
 import axios from 'axios';
 
-const API_BASE_URL = 'https://api.detailinghubpk.com';
+export const API_BASE_URL = 'https://api.detailinghubpk.com';
 // const API_BASE_URL = 'http://localhost:8000';
 
 // Create axios instance
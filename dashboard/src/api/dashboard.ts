@@ -23,7 +23,7 @@ export const dashboardQueries = {
     queryKey: dashboardQueries.keys.stats(),
     queryFn: () => dashboardAPI.getStats(),
     staleTime: 1000 * 60 * 5, // 5 minutes
-    refetchInterval: 1000 * 30, // Refresh every 30 seconds
+    refetchInterval: 1000 * 60 * 5, // Fallback refresh; live updates arrive over SSE (useLiveUpdates)
   }),
 };
 
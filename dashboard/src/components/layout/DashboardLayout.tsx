@@ -1,8 +1,11 @@
 import React from 'react';
 import Sidebar from './Sidebar';
 import Header from './Header';
+import { useLiveUpdates } from '../../hooks/useLiveUpdates';
 
 const DashboardLayout: React.FC<{ children: React.ReactNode }> = ({ children }) => {
+  useLiveUpdates();
+
   return (
     <div className="min-h-screen flex bg-gradient-to-br from-slate-900 via-gray-900 to-black">
       <Sidebar />
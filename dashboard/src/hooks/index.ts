@@ -11,4 +11,5 @@ export * from './useNotifications';
 export * from './useSettings';
 export * from './useServices';
 export * from './useAnalytics';
-export * from './useMiscellaneousBills';
\ No newline at end of file
+export * from './useMiscellaneousBills';
+export * from './useLiveUpdates';
\ No newline at end of file
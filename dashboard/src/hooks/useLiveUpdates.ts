@@ -0,0 +1,42 @@
+// src/hooks/useLiveUpdates.ts
+import { useEffect } from 'react';
+import { useQueryClient } from '@tanstack/react-query';
+import { API_BASE_URL } from '../api/client';
+import { bookingQueries } from '../api/booking';
+import { dashboardQueries } from '../api/dashboard';
+import { inventoryQueries } from '../api/inventory';
+
+// Server event -> query keys to refetch
+const INVALIDATIONS: Record<string, readonly (readonly unknown[])[]> = {
+  'booking.created': [bookingQueries.keys.all, dashboardQueries.keys.all, ['analytics']],
+  'booking.status_changed': [bookingQueries.keys.all, dashboardQueries.keys.all, ['analytics']],
+  'booking.bulk_status_changed': [bookingQueries.keys.all, dashboardQueries.keys.all, ['analytics']],
+  'stock.low': [inventoryQueries.keys.all, dashboardQueries.keys.all],
+  'notification.created': [['notifications'], ['notification-stats']],
+};
+
+/**
+ * Subscribes to the backend Server-Sent Events stream and refreshes the
+ * affected React Query caches instead of polling on an interval.
+ * EventSource reconnects on its own when the server closes the stream.
+ */
+export const useLiveUpdates = () => {
+  const queryClient = useQueryClient();
+
+  useEffect(() => {
+    const source = new EventSource(`${API_BASE_URL}/events/stream/`, { withCredentials: true });
+
+    const listeners = Object.entries(INVALIDATIONS).map(([eventType, keys]) => {
+      const listener = () => {
+        keys.forEach((queryKey) => queryClient.invalidateQueries({ queryKey }));
+      };
+      source.addEventListener(eventType, listener);
+      return [eventType, listener] as const;
+    });
+
+    return () => {
+      listeners.forEach(([eventType, listener]) => source.removeEventListener(eventType, listener));
+      source.close();
+    };
+  }, [queryClient]);
+};